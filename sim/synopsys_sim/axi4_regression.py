@@ -15,6 +15,7 @@ Features:
 - Generates no_pass_list for failed tests
 - Timeout handling for stuck tests
 - Summary report with failure details
+- Reuses cached verdicts of runs already simulated with identical build, test, seed and plusargs
 
 Usage:
     python3 axi4_regression.py [-p NUM_WORKERS] [--timeout SECONDS] [--verbose]
@@ -36,13 +37,322 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import signal
 import json
+import csv
+import socket
+import math
+import tempfile
+import hashlib
+import hmac
+import fcntl
+import struct
+import secrets
+import difflib
+import fnmatch
+import gzip
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from axi4_regression_fs import move_path, link_path
+
+
+# Timestamps recorded for every run (epoch seconds, missing = not observed):
+#   queued        test entered the queue (regression start locally, bsub in LSF mode)
+#   started       a worker/LSF slot picked it up
+#   launched      folder prepared, VCS started
+#   compile_done  VCS finished compile + elab + link
+#   sim_start     simv began simulating
+#   sim_end       simulation finished
+#   analyzed      verdict known
+#   archived      log (and coverage) placed in the results folder
+TIMING_EVENTS = ('queued', 'started', 'launched', 'compile_done', 'sim_start', 'sim_end', 'analyzed', 'archived')
+
+# Per-phase timing breakdown derived from TIMING_EVENTS: phase -> (from, to)
+TIMING_PHASES = {
+    'queue': ('queued', 'started'),
+    'setup': ('started', 'launched'),
+    'compile': ('launched', 'compile_done'),
+    'load': ('compile_done', 'sim_start'),
+    'sim': ('sim_start', 'sim_end'),
+    'analyze': ('sim_end', 'analyzed'),
+    'archive': ('analyzed', 'archived'),
+}
+
+# LSF memory request sizing (see _memory_request_mb): the largest peak seen in the
+# test's history plus a margin, rounded up; the default applies to unseen tests
+MEM_REQUEST_DEFAULT_MB = 4000
+MEM_REQUEST_MIN_MB = 1000
+MEM_REQUEST_MARGIN = 1.25
+MEM_REQUEST_ROUND_MB = 256
+
+# Samples kept per test in regression_history.json
+HISTORY_SAMPLES_PER_TEST = 50
+
+# Per-test timeouts (see _test_timeout): p99 of the test's recorded durations times
+# TIMEOUT_MARGIN, rounded up to TIMEOUT_ROUND_S and held within the floor/ceiling.
+# Tests with fewer than TIMEOUT_MIN_SAMPLES recorded runs get --timeout. A run killed
+# at its timeout is recorded as a lower bound, and the next history-derived timeout is
+# at least TIMEOUT_GROWTH times that, until the test completes again.
+TIMEOUT_MARGIN = 3.0
+TIMEOUT_GROWTH = 2.0
+TIMEOUT_MIN_SAMPLES = 3
+TIMEOUT_FLOOR_S = 180
+TIMEOUT_CEILING_S = 4 * 3600
+TIMEOUT_ROUND_S = 30
+
+# LSF completion detection (see _monitor_lsf_jobs): jobs report their start and
+# finish as small files in lsf_status/, which is rescanned every
+# LSF_STATUS_SCAN_INTERVAL seconds. bjobs is only a fallback for jobs that die
+# without writing a record, queried in batches every LSF_FALLBACK_POLL_INTERVAL;
+# a job bjobs reports finished gets LSF_RECORD_GRACE seconds for its record to
+# show up on the shared filesystem before it is completed from bjobs.
+LSF_STATUS_SCAN_INTERVAL = 0.5
+LSF_FALLBACK_POLL_INTERVAL = 10
+LSF_RECORD_GRACE = 5
+LSF_BJOBS_BATCH = 200
+
+# Compile signature (see _compile_signature): every run recompiles, and the build
+# differs between runs only by the compile options in their command_add. These
+# `+` options change the build; any other `+name[=value]` is a runtime plusarg.
+COMPILE_PLUSARG_PREFIXES = ('+define+', '+incdir+', '+libext+', '+systemverilogext+',
+                            '+lint=', '+warn=', '+v2k', '+nospecify', '+notimingcheck',
+                            '+no_timing_check')
+
+# Compile errors that say nothing about the sources: another run trampling the
+# daidir, or no license. These fail one run, not the whole compile signature.
+TRANSIENT_BUILD_ERRORS = ('Error-[VFS_SDB_ERROR]', 'Error-[LIC', 'Error-[SNPSLMD')
+
+# Coordinator/worker mode (--serve / --worker): JSON messages over TCP, each framed
+# by a 4-byte big-endian length. A connected worker sends a heartbeat every
+# WORKER_HEARTBEAT_INTERVAL seconds while it simulates; a connection silent for
+# WORKER_LOST_TIMEOUT seconds is dropped and its test goes back to the queue.
+# Workers with nothing to do ask again every WORKER_IDLE_POLL seconds.
+WORKER_HEARTBEAT_INTERVAL = 5
+WORKER_LOST_TIMEOUT = 30
+WORKER_IDLE_POLL = 1
+WORKER_FRAME_HEADER = struct.Struct('!I')
+# A run's log goes back in 'log' frames of up to WORKER_LOG_CHUNK_CHARS characters
+# ahead of its 'result' frame, so neither side holds a multi-GB log in memory
+WORKER_LOG_CHUNK_CHARS = 1 << 20
+
+# Fabric-IP (Track-B) builds compile a -f file starting with this name. Their code
+# coverage is scoped to the fabric interface (written, like command_add, for a run
+# folder next to sim/); databases of different builds are never merged together.
+FABRIC_IP_COMPILE_FILE_PREFIX = 'axi4_compile_fabric_ip'
+FABRIC_IP_COVERAGE_SCOPE = '../coverage_scope.cm_hier'
+
+# Pre-flight test name check (see _check_test_names): UVM_TESTNAME must name a
+# component registered in one of the test/*.sv files
+TEST_REGISTRATION_RE = re.compile(r'`uvm_component(?:_param)?_utils(?:_begin)?\s*\(\s*(\w+)')
+
+# Failure-window waves (see _failure_window): reruns of failed runs with --rerun-fsdb
+# dump hdl_top from FSDB_WINDOW_BEFORE_PS before the first UVM_ERROR/UVM_FATAL to
+# FSDB_WINDOW_AFTER_PS after it. Every run uses -override_timescale=1ps/1ps, so the
+# times UVM prints, and the +fsdb_start=/+fsdb_stop= plusargs of hdl_top, are in ps.
+FSDB_WINDOW_BEFORE_PS = 2000000
+FSDB_WINDOW_AFTER_PS = 200000
+SIM_TIME_UNITS_PS = {'fs': 1e-3, 'ps': 1, 'ns': 1e3, 'us': 1e6, 'ms': 1e9, 's': 1e12}
+
+# Archived log compression (--compress-logs): logs in pass_logs/no_pass_logs become
+# <run>.log.gz, or <run>.log.zst with the zstd command, once their verdict is in.
+# LOG_COMPRESS_WORKERS background threads do it, few enough to leave the CPUs to the
+# simulations; level 3 keeps gzip fast while still shrinking UVM logs about tenfold.
+LOG_COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+LOG_COMPRESS_LEVEL = 3
+LOG_COMPRESS_WORKERS = 2
+
+# Live metrics (--metrics, see _metrics_snapshot): upper bounds in seconds of the
+# buckets of the per-phase latency histograms, from a cached-fast setup to a
+# multi-hour simulation
+METRICS_PHASE_BUCKETS_S = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200, 14400)
+
+# Column order of results.jsonl records and results.csv
+RESULT_FIELDS = [
+    'name', 'base_name', 'run_number', 'test_group', 'status', 'duration',
+    'seed', 'command_add', 'uvm_errors', 'uvm_fatals', 'error_msg', 'cached',
+    'verbosity', 'rerun_of', 'rerun',
+    'folder_id', 'log_file', 'host', 'peak_mem_mb', 'cpu_time_s', 'io_read_mb', 'io_write_mb',
+] + [f'{phase}_s' for phase in TIMING_PHASES] + [f't_{event}' for event in TIMING_EVENTS] + ['completed_at']
+
+
+def _send_frame(sock, message):
+    """Send one length-prefixed JSON message (see WORKER_FRAME_HEADER)"""
+    payload = json.dumps(message).encode('utf-8')
+    sock.sendall(WORKER_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes, or None if the peer closed the connection first"""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _recv_frame(sock):
+    """Receive one length-prefixed JSON message, or None once the peer has closed"""
+    header = _recv_exact(sock, WORKER_FRAME_HEADER.size)
+    if header is None:
+        return None
+    payload = _recv_exact(sock, WORKER_FRAME_HEADER.unpack(header)[0])
+    return json.loads(payload.decode('utf-8')) if payload is not None else None
+
+
+def _find_log(path):
+    """The log at path, else its compressed copy (path.gz / path.zst), else None"""
+    path = Path(path)
+    for candidate in [path] + [path.with_name(path.name + suffix) for suffix in LOG_COMPRESSION_SUFFIXES.values()]:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@contextmanager
+def _open_log(path):
+    """Open a log as a text stream, reading path.gz / path.zst when path was compressed
+
+    The plain log is tried first: a log compressed meanwhile only disappears after
+    its compressed copy is complete.
+    """
+    path = Path(path)
+    try:
+        stream = open(path, 'r', errors='replace')
+    except FileNotFoundError:
+        stream = None
+    if stream is None:
+        compressed = _find_log(path)
+        if compressed is None:
+            raise FileNotFoundError(f"No such log: {path}")
+        if compressed.suffix == '.zst':
+            process = subprocess.Popen(['zstd', '-dcq', str(compressed)], stdout=subprocess.PIPE,
+                                       text=True, errors='replace')
+            try:
+                yield process.stdout
+            finally:
+                process.stdout.close()
+                process.kill()
+                process.wait()
+            return
+        stream = gzip.open(compressed, 'rt', errors='replace')
+    with stream:
+        yield stream
+
+
+def _compress_log(path, codec):
+    """Replace the log at path by path.gz / path.zst; returns (original bytes, compressed bytes)"""
+    target = path.with_name(path.name + LOG_COMPRESSION_SUFFIXES[codec])
+    tmp_file = path.with_name(f".{target.name}.{os.getpid()}")
+    size = path.stat().st_size
+    try:
+        if codec == 'zstd':
+            subprocess.run(['zstd', '-q', f'-{LOG_COMPRESS_LEVEL}', '-f', '-o', str(tmp_file), str(path)],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        else:
+            with open(path, 'rb') as source, gzip.open(tmp_file, 'wb', compresslevel=LOG_COMPRESS_LEVEL) as sink:
+                shutil.copyfileobj(source, sink, 1 << 20)
+        shutil.copystat(path, tmp_file)
+        os.replace(tmp_file, target)  # Complete before the plain log goes (see _open_log)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    path.unlink()
+    return size, target.stat().st_size
+
+
+def _process_rss_bytes():
+    """Resident set size of this process in bytes, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _prometheus_text(snapshot):
+    """Render a _metrics_snapshot() in the Prometheus text exposition format"""
+    lines = []
+    
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP axi4_regression_{name} {help_text}")
+        lines.append(f"# TYPE axi4_regression_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ','.join(f'{key}="{label}"' for key, label in labels.items())
+            lines.append(f"axi4_regression_{name}{suffix}{{{label_text}}} {value}" if label_text
+                         else f"axi4_regression_{name}{suffix} {value}")
+    
+    runs = snapshot['runs']
+    metric('runs', 'gauge', 'Runs of the regression by state (reruns of failures not included)',
+           [('', {'state': state}, runs[state]) for state in ('total', 'completed', 'running', 'pending')])
+    metric('queue_depth', 'gauge', 'Runs waiting for a slot: LSF PEND jobs, the worker queue, or local runs not started',
+           [('', {}, snapshot['queue_depth'])])
+    metric('cached_runs', 'gauge', 'Completed runs answered from regression_cache/', [('', {}, runs['cached'])])
+    metric('reruns_running', 'gauge', 'Reruns of failures (--low-verbosity/--rerun-fsdb) started, not yet completed',
+           [('', {}, runs['reruns_running'])])
+    metric('reruns_completed', 'gauge', 'Completed reruns of failures (--low-verbosity/--rerun-fsdb)',
+           [('', {}, runs['reruns_completed'])])
+    metric('verdicts', 'gauge', 'Completed runs by verdict',
+           [('', {'status': status}, count) for status, count in snapshot['verdicts'].items()])
+    metric('verdict_rate', 'gauge', 'Share of completed runs that passed, failed (any other verdict) or timed out',
+           [('', {'verdict': verdict}, rate) for verdict, rate in snapshot['rates'].items()])
+    samples = []
+    for phase, histogram in snapshot['phase_seconds'].items():
+        for bound, count in histogram['buckets'].items():
+            samples.append(('_bucket', {'phase': phase, 'le': bound}, count))
+        samples.append(('_bucket', {'phase': phase, 'le': '+Inf'}, histogram['count']))
+        samples.append(('_sum', {'phase': phase}, histogram['sum']))
+        samples.append(('_count', {'phase': phase}, histogram['count']))
+    metric('phase_seconds', 'histogram', 'Per-phase latency of completed runs (see TIMING_PHASES)', samples)
+    if snapshot['rss_bytes'] is not None:
+        metric('runner_rss_bytes', 'gauge', 'Resident memory of the regression runner', [('', {}, snapshot['rss_bytes'])])
+    metric('elapsed_seconds', 'gauge', 'Time since the regression started', [('', {}, snapshot['elapsed_s'])])
+    if snapshot['lsf_poll']:
+        polls = snapshot['lsf_poll'].items()
+        metric('lsf_poll_seconds', 'summary', 'Latency of LSF completion polls (lsf_status/ scans, bjobs queries)',
+               [sample for source, stats in polls for sample in
+                (('_sum', {'source': source}, stats['seconds']), ('_count', {'source': source}, stats['polls']))])
+        metric('lsf_poll_last_seconds', 'gauge', 'Latency of the latest LSF completion poll',
+               [('', {'source': source}, stats['last_s']) for source, stats in polls])
+        metric('lsf_poll_max_seconds', 'gauge', 'Slowest LSF completion poll so far',
+               [('', {'source': source}, stats['max_s']) for source, stats in polls])
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics (Prometheus text) and /metrics.json for --metrics; server.runner is the RegressionRunner"""
+    
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            body = _prometheus_text(self.server.runner._metrics_snapshot()).encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif path == '/metrics.json':
+            body = json.dumps(self.server.runner._metrics_snapshot(), indent=2).encode('utf-8')
+            content_type = 'application/json'
+        else:
+            self.send_error(404, "Serving /metrics and /metrics.json")
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # One line per scrape would bury the progress output
 
 
 class TestResult:
     """Container for test execution results"""
-    def __init__(self, name, status, duration, log_file, error_msg=None, folder_id=0, uvm_errors=0, uvm_fatals=0, seed=None, command_add=None, base_name=None, run_number=1, test_group=None):
+    def __init__(self, name, status, duration, log_file, error_msg=None, folder_id=0, uvm_errors=0, uvm_fatals=0, seed=None, command_add=None, base_name=None, run_number=1, test_group=None, host=None, timestamps=None, peak_mem_mb=None, cpu_time_s=None, io_read_mb=None, io_write_mb=None, cached=False, verbosity=None, rerun_of=None, rerun=None):
         self.name = name
-        self.status = status  # 'PASS', 'FAIL', 'TIMEOUT', 'ERROR'
+        self.status = status  # 'PASS', 'FAIL', 'TIMEOUT', 'ERROR', 'BUILD_ERROR'
         self.duration = duration
         self.log_file = log_file
         self.error_msg = error_msg
@@ -54,45 +364,381 @@ class TestResult:
         self.base_name = base_name or name  # Base test name without _N suffix
         self.run_number = run_number  # Run number for multiple runs
         self.test_group = test_group  # Group identifier for run_cnt tests
+        self.host = host  # Execution host (local hostname or LSF exec host)
+        self.timestamps = dict(timestamps or {})  # event -> epoch seconds, see TIMING_EVENTS
+        self.peak_mem_mb = peak_mem_mb  # Peak simulator memory, if known
+        self.cpu_time_s = cpu_time_s  # User + system CPU of the whole run
+        self.io_read_mb = io_read_mb  # Block input of the whole run
+        self.io_write_mb = io_write_mb  # Block output of the whole run
+        self.cached = cached  # Verdict and log reused from the result cache, not simulated
+        self.verbosity = verbosity  # +UVM_VERBOSITY of the run
+        self.rerun_of = rerun_of  # For a rerun of a failure: the failed run it repeats
+        self.rerun = rerun  # For a failed run: the name of its rerun (see _rerun_failures)
+        self.completed_at = datetime.now().isoformat(timespec='seconds')
+
+    @property
+    def timing(self):
+        """Phase -> seconds for every phase whose two bounding events were observed"""
+        timing = {}
+        for phase, (start_event, end_event) in TIMING_PHASES.items():
+            start = self.timestamps.get(start_event)
+            end = self.timestamps.get(end_event)
+            if start is not None and end is not None:
+                timing[phase] = max(0.0, end - start)
+        return timing
+
+    @classmethod
+    def from_record(cls, record):
+        """Rebuild a TestResult from a results.jsonl record (inverse of to_record)"""
+        timestamps = {event: record.get(f't_{event}') for event in TIMING_EVENTS
+                      if record.get(f't_{event}') is not None}
+        result = cls(
+            name=record['name'],
+            status=record['status'],
+            duration=record.get('duration') or 0.0,
+            log_file=record.get('log_file') or '',
+            error_msg=record.get('error_msg'),
+            folder_id=record.get('folder_id') or 0,
+            uvm_errors=record.get('uvm_errors') or 0,
+            uvm_fatals=record.get('uvm_fatals') or 0,
+            seed=record.get('seed'),
+            command_add=record.get('command_add'),
+            base_name=record.get('base_name'),
+            run_number=record.get('run_number') or 1,
+            test_group=record.get('test_group'),
+            host=record.get('host'),
+            timestamps=timestamps,
+            peak_mem_mb=record.get('peak_mem_mb'),
+            cpu_time_s=record.get('cpu_time_s'),
+            io_read_mb=record.get('io_read_mb'),
+            io_write_mb=record.get('io_write_mb'),
+            cached=bool(record.get('cached')),
+            verbosity=record.get('verbosity'),
+            rerun_of=record.get('rerun_of'),
+            rerun=record.get('rerun')
+        )
+        if record.get('completed_at'):
+            result.completed_at = record['completed_at']
+        return result
+
+    def to_record(self):
+        """Flat dict of all fields, in RESULT_FIELDS order, for results.jsonl / results.csv"""
+        record = {}
+        timing = self.timing
+        for field in RESULT_FIELDS:
+            if field.endswith('_s') and field[:-2] in TIMING_PHASES:
+                value = timing.get(field[:-2])
+                record[field] = round(value, 3) if value is not None else None
+            elif field.startswith('t_') and field[2:] in TIMING_EVENTS:
+                value = self.timestamps.get(field[2:])
+                record[field] = round(value, 3) if value is not None else None
+            else:
+                record[field] = getattr(self, field, None)
+        record['duration'] = round(self.duration, 3)
+        return record
+
+
+class TestListComposer:
+    """Resolve the include/exclude/filter directives of a test list into plain entries
+
+    Directives (one per line; every other non-comment line is an entry, kept verbatim):
+      include <list>           the entries of another list, path relative to this one
+      exclude <pattern> ...    drop the entries matching any of the patterns
+      filter <pattern> ...     keep only the entries matching one of the patterns
+    A pattern is a glob on the test name (axi4_qos_*), or <column>=<glob>[,<glob>...]
+    on the test's row of doc/testcase_matrix.csv, where the column is its header in
+    lower case with underscores, or a trailing part of it: category=QoS*,
+    bus_matrix_mode=BUS_ENHANCED_MATRIX,ALL. Tests missing from the matrix match no
+    column pattern. exclude and filter apply to everything their list collects,
+    wherever they appear in it; several filter lines must all match. An included
+    list resolves its own directives first, and entries repeated by overlapping
+    includes are kept once.
+
+    Lists with directives are cached in .test_list_cache.json with the mtime and size
+    of every file they were composed from.
+    """
+    
+    DIRECTIVES = ('include', 'exclude', 'filter')
+    
+    def __init__(self, matrix_file, cache_file):
+        self.matrix_file = Path(matrix_file)
+        self.cache_file = Path(cache_file)
+        self._matrix = None  # test name -> {column key: value}
+        self._columns = None  # column key -> column key, for every accepted spelling
+    
+    def compose(self, list_file):
+        """(entries, note): the entry lines of list_file, directives resolved; note is for display"""
+        list_file = Path(list_file).resolve()
+        cache = self._load_cache()
+        cached = cache.get(str(list_file))
+        if cached and all(self._file_stamp(path) == stamp for path, stamp in cached['files'].items()):
+            return cached['entries'], f"{len(cached['files'])} files, cached"
+        
+        files = set()
+        stats = {'excluded': 0, 'filtered': 0, 'not_in_matrix': set()}
+        entries = self._compose(list_file, files, stats, [])
+        if len(files) > 1 or stats['excluded'] or stats['filtered']:
+            cache[str(list_file)] = {'files': {path: self._file_stamp(path) for path in sorted(files)},
+                                     'entries': entries}
+            self._save_cache(cache)
+            if stats['not_in_matrix']:
+                missing = sorted(stats['not_in_matrix'])
+                print(f"⚠️  Warning: {len(missing)} tests have no row in {self.matrix_file.name} to match "
+                      f"column patterns against (e.g. {', '.join(missing[:3])})")
+            return entries, (f"{len(files)} files, {stats['excluded']} excluded, "
+                             f"{stats['filtered']} filtered out")
+        return entries, None
+    
+    def _compose(self, list_file, files, stats, stack):
+        """Entries of one list with its includes expanded and its exclude/filter lines applied"""
+        if list_file in stack:
+            raise ValueError(f"include cycle: {' -> '.join(p.name for p in stack + [list_file])}")
+        files.add(str(list_file))
+        entries = []
+        excludes = []
+        filters = []
+        with open(list_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                # Skip comments and empty lines
+                if not line or line.startswith('#'):
+                    continue
+                keyword, _, argument = line.partition(' ')
+                if keyword not in self.DIRECTIVES:
+                    entries.append(line)
+                elif not argument.split():
+                    raise ValueError(f"{list_file.name}: '{keyword}' needs an argument")
+                elif keyword == 'include':
+                    included = (list_file.parent / argument.strip()).resolve()
+                    if not included.exists():
+                        raise ValueError(f"{list_file.name} includes a missing list: {argument.strip()}")
+                    known = set(entries)
+                    for entry in self._compose(included, files, stats, stack + [list_file]):
+                        if entry not in known:
+                            known.add(entry)
+                            entries.append(entry)
+                elif keyword == 'exclude':
+                    excludes += argument.split()
+                else:
+                    filters.append(argument.split())
+        
+        if not excludes and not filters:
+            return entries
+        if any('=' in pattern for patterns in filters + [excludes] for pattern in patterns):
+            files.add(str(self.matrix_file))
+        kept = []
+        for entry in entries:
+            test_name = entry.split()[0]
+            if excludes and self._matches(test_name, excludes, stats):
+                stats['excluded'] += 1
+            elif not all(self._matches(test_name, patterns, stats) for patterns in filters):
+                stats['filtered'] += 1
+            else:
+                kept.append(entry)
+        return kept
+    
+    def _matches(self, test_name, patterns, stats):
+        """Whether the test matches any of the patterns (name globs or column=globs)"""
+        not_in_matrix = False
+        for pattern in patterns:
+            if '=' not in pattern:
+                if fnmatch.fnmatchcase(test_name, pattern):
+                    return True
+                continue
+            column, _, values = pattern.partition('=')
+            value = self._matrix_value(test_name, column)
+            if value is None:
+                not_in_matrix = True
+            elif any(fnmatch.fnmatchcase(value, glob) for glob in values.split(',') if glob):
+                return True
+        if not_in_matrix:
+            stats['not_in_matrix'].add(test_name)
+        return False
+    
+    def _matrix_value(self, test_name, column):
+        """The test's value in a testcase_matrix.csv column, or None if the test has no row"""
+        if self._matrix is None:
+            self._load_matrix()
+        key = self._columns.get(column.lower())
+        if key is None:
+            raise ValueError(f"no column '{column}' in {self.matrix_file.name} "
+                             f"(columns: {', '.join(sorted(set(self._columns.values())))})")
+        row = self._matrix.get(test_name)
+        return (row.get(key) or '') if row is not None else None
+    
+    def _load_matrix(self):
+        """Read testcase_matrix.csv: column keys are headers in lower case with underscores"""
+        self._matrix = {}
+        self._columns = {}
+        try:
+            with open(self.matrix_file, 'r', newline='') as f:
+                reader = csv.DictReader(f)
+                headers = {header: re.sub(r'\W+', '_', header.strip().lower()).strip('_')
+                           for header in reader.fieldnames or []}
+                for row in reader:
+                    name = (row.get('Test Name') or '').strip()
+                    if name:
+                        self._matrix[name] = {headers[h]: (v or '').strip() for h, v in row.items() if h in headers}
+        except OSError as e:
+            raise ValueError(f"column patterns need {self.matrix_file}: {e}")
+        # A trailing part of a key selects the column too, when only one column ends with it
+        suffixes = {}
+        for key in headers.values():
+            words = key.split('_')
+            for start in range(len(words)):
+                suffixes.setdefault('_'.join(words[start:]), set()).add(key)
+        self._columns = {suffix: keys.pop() for suffix, keys in suffixes.items() if len(keys) == 1}
+        self._columns.update({key: key for key in headers.values()})
+    
+    def _file_stamp(self, path):
+        """(mtime, size) of a file, None once it is gone"""
+        try:
+            stat = os.stat(path)
+            return [stat.st_mtime, stat.st_size]
+        except OSError:
+            return None
+    
+    def _load_cache(self):
+        """Composed lists of earlier runs (missing or unreadable cache is just empty)"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self, cache):
+        """Write the cache atomically; regressions started side by side may race for it"""
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write {self.cache_file.name}: {e}")
 
 
 class RegressionRunner:
     """Main regression test runner class"""
     
-    def __init__(self, max_parallel=None, timeout=600, verbose=False, use_lsf=False, fsdb_dump=False, coverage=False):
+    def __init__(self, max_parallel=None, timeout=600, verbose=False, use_lsf=False, fsdb_dump=False, coverage=False, triage_fsdb=False, resume_dir=None, use_cache=True, smoke_threshold=90.0, history_timeouts=True, scratch_dir=None, use_scratch=True, serve_address=None, worker_token=None, check_test_names=True, seed_base=None, low_verbosity=False, rerun_verbosity='MEDIUM', rerun_fsdb=False, compress_logs=None, metrics_address=None):
         self.max_parallel = max_parallel  # Will be set to number of tests if None
+        self.requested_parallel = max_parallel  # As given, for --resume (None: one per test)
         self.timeout = timeout
+        self.history_timeouts = history_timeouts  # per-test timeouts from regression_history.json
         self.verbose = verbose
         self.use_lsf = use_lsf
         self.fsdb_dump = fsdb_dump
         self.coverage = coverage
+        self.triage_fsdb = triage_fsdb  # Add +define+DUMP_FSDB to triage_rerun_list entries
         self.base_dir = Path.cwd()
         self.results = []
-        self.running_tests = {}
+        self.running_tests = {}  # run name -> start time, for runs in a local run folder
         self.test_queue = queue.Queue()
         self.results_lock = threading.Lock()
         self.stop_all = threading.Event()
         
         # LSF job tracking
         self.lsf_jobs = {}  # job_id -> test_info
-        # Completions drained by the submission throttle, waiting to be reported
-        # by the monitoring loop (see _run_lsf_regression).
-        self._pending_completions = []
+        self._lsf_status_seen = set()  # lsf_status/ files already processed
+        self._last_lsf_fallback_poll = 0.0
         self.pending_jobs = 0
         self.running_jobs = 0
+        self.lsf_poll = {}  # 'status_records'/'bjobs' -> poll count and latency (see _record_lsf_poll)
         
-        # Results folder with timestamp
-        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.results_folder = self.base_dir / f"regression_result_{self.timestamp}"
-        self.logs_folder = self.results_folder / "logs"
-        self.pass_logs_folder = self.logs_folder / "pass_logs"
-        self.no_pass_logs_folder = self.logs_folder / "no_pass_logs"
+        # Results folder with timestamp. A resumed regression keeps writing into the
+        # folder (and under the timestamp) of the run it continues; a new one claims
+        # its folder when it starts (see _claim_results_folder), so building a runner
+        # creates nothing.
+        self.resume_dir = Path(resume_dir).resolve() if resume_dir else None
+        if self.resume_dir:
+            timestamp_match = re.search(r'(\d{8}_\d{6})$', self.resume_dir.name)
+            self._set_results_folder(self.resume_dir, timestamp_match.group(1) if timestamp_match
+                                     else datetime.now().strftime('%Y%m%d_%H%M%S'))
+        else:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._set_results_folder(self.base_dir / f"regression_result_{timestamp}", timestamp)
         
-        # Coverage collection folder
-        if self.coverage:
-            self.coverage_folder = self.results_folder / "coverage_collect"
+        # Node-local scratch (see _scratch_exec_dir): VCS runs there and only the log,
+        # coverage vdb and waves come back. LSF jobs default to the $TMPDIR LSF gives
+        # them, expanded on the execution host; local runs only use it when asked.
+        if not use_scratch:
+            self.scratch_root = None
+        elif scratch_dir:
+            self.scratch_root = scratch_dir
         else:
-            self.coverage_folder = None
+            self.scratch_root = '$TMPDIR' if use_lsf else None
+        
+        # axi4_compile.f and command_add are written for a run folder next to sim/
+        # (path_anchor_dir); runs read an absolute-path copy (see _set_results_folder)
+        self.path_anchor_dir = self.base_dir.parent / 'run_folder_00'
+        # Guards what regressions from this checkout share: regression_cache/ and
+        # regression_history.json (see _shared_state_lock)
+        self.shared_lock_file = self.base_dir / ".regression.lock"
+        self.test_registry_cache_file = self.base_dir / ".test_registry_cache.json"
+        # Seed stream (see _derive_seeds): with a base, runs without seed= get a seed
+        # that depends only on the base and the run itself
+        self.seed_base = seed_base
+        self.list_composer = TestListComposer(self.base_dir.parent.parent / 'doc' / 'testcase_matrix.csv',
+                                              self.base_dir / ".test_list_cache.json")
+        self.check_test_names = check_test_names
+        # --low-verbosity / --rerun-fsdb: every FAIL/TIMEOUT is run once more with its
+        # seed at rerun_verbosity, with --rerun-fsdb also with failure-window waves
+        # (see _rerun_failures). Reruns are kept out of self.results: they diagnose a
+        # verdict, they do not add one.
+        self.verbosity = 'LOW' if low_verbosity else 'MEDIUM'
+        self.rerun_verbosity = rerun_verbosity if low_verbosity or rerun_fsdb else None
+        self.rerun_fsdb = rerun_fsdb
+        self.rerun_results = []
+        self._rerun_names = {}  # rerun name -> name of the failed run it repeats
+        self.copy_back = {'runs': 0, 'bytes': 0}  # scratch runs and what they copied back
+        # Archived logs are compressed in the background once their verdict is in
+        # (see _queue_log_compression); compress_logs is 'gzip', 'zstd' or None
+        self.log_codec = compress_logs
+        self._log_compressor = None
+        self._log_compression_lock = threading.Lock()
+        self.log_compression = {'logs': 0, 'bytes': 0, 'compressed_bytes': 0, 'seconds': 0.0}
+        # Live metrics over HTTP (--metrics): (bind host, port), or None
+        self.metrics_address = metrics_address
+        self._metrics_server = None
+        
+        self._results_stream = None  # results.jsonl, open while the regression runs
+        self.hostname = socket.gethostname()
+        
+        self._resume_lsf_jobs = {}  # job_id -> journal record, for unfinished LSF jobs
+        
+        # Per-test resource/duration history shared by all regressions run from here
+        self.history_file = self.base_dir / "regression_history.json"
+        self.history = {}
+        
+        # Result cache shared by all regressions run from here: verdict + log per
+        # (build content hash, test, seed, plusargs), see _apply_result_cache
+        self.use_cache = use_cache
+        self.cache_dir = self.base_dir / "regression_cache"
+        self._cache_keys = {}  # test name -> cache key, for runs whose seed is known up front
+        self.cached_tests = 0
+        
+        # Tiered regression: tier=0 smoke runs gate the rest (see _run_tiers)
+        self.smoke_threshold = smoke_threshold
+        self.smoke_names = set()
+        self.smoke_gate = None  # decision, once the smoke tier has run
+
+        # Compile-error short-circuit: compile signature -> the run whose compile failed
+        # (see _record_build_failure); queued runs sharing it are not run
+        self.broken_builds = {}
+        self.build_skipped_tests = 0
+
+        # Coordinator mode (--serve): workers on other hosts pull the queued runs over
+        # TCP instead of local run folders or LSF (see _run_distributed_regression)
+        self.serve_address = serve_address  # (bind host, port), or None
+        self.worker_token = worker_token or secrets.token_hex(8)  # workers must present it
+        self._worker_server = None
+        self._worker_build_hash = None  # portable _build_hash workers must match (None: unchecked)
+        self._worker_queue = deque()  # runs not yet handed to a worker
+        self._worker_leases = {}  # run name -> test_obj, for runs a worker is simulating
+        self._worker_hosts = {}  # connection -> worker host, for connected workers
+        self._worker_lock = threading.Lock()
+        self._workers_released = False  # regression over: idle workers are told to exit
+        self.requeued_tests = 0
         
         # Statistics
         self.total_tests = 0
@@ -143,6 +789,10 @@ class RegressionRunner:
         else:
             return test_name  # Return as-is if no _N suffix found
     
+    def _uvm_test_name(self, test_obj):
+        """UVM_TESTNAME of a run: its name without the _N suffix (a rerun runs the test it repeats)"""
+        return self._extract_base_test_name(test_obj.get('rerun_of') or test_obj['name'])
+    
     def _check_lsf_availability(self):
         """Check if LSF commands are available"""
         try:
@@ -179,16 +829,14 @@ class RegressionRunner:
         - testname seed=123                        (run once with custom seed)
         - testname command_add=+define+XXX         (run once with custom VCS command)
         - testname run_cnt=N seed=123 command_add=+define+XXX  (combine parameters)
+        - testname tier=0                          (smoke tier: runs first and gates the rest, see _run_tiers)
+        - include/exclude/filter directives        (composed lists, see TestListComposer)
         """
-        tests = []
         expanded_tests = []
         try:
-            with open(test_list_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if line and not line.startswith('#'):
-                        tests.append(line)
+            tests, composed = self.list_composer.compose(test_list_file)
+            if composed:
+                print(f"📋 Composed {len(tests)} entries from {test_list_file} ({composed})")
             
             if not tests:
                 raise ValueError(f"No tests found in {test_list_file}")
@@ -229,6 +877,7 @@ class RegressionRunner:
                 repeat_count = 1
                 custom_seed = None
                 command_add = None
+                tier = None
                 
                 for part in parts[1:]:
                     if part.startswith('run_cnt='):
@@ -258,6 +907,15 @@ class RegressionRunner:
                             print(f"⚠️  Warning: Invalid command_add format in '{test_entry}': {e}")
                             print(f"    Expected format: 'testname command_add=+define+XXX'")
                             command_add = None
+                    elif part.startswith('tier='):
+                        try:
+                            tier = int(part.split('=')[1])
+                            if tier < 0:
+                                raise ValueError(f"tier must be >= 0, got {tier}")
+                        except (ValueError, IndexError) as e:
+                            print(f"⚠️  Warning: Invalid tier format in '{test_entry}': {e}")
+                            print(f"    Expected format: 'testname tier=0'")
+                            tier = None
                 
                 # Pattern recognition for different settings
                 pattern_key = f"{test_name}_{custom_seed}_{command_add}"
@@ -291,7 +949,8 @@ class RegressionRunner:
                             'run_number': i,
                             'seed': custom_seed,
                             'command_add': command_add,
-                            'test_group': group_id
+                            'test_group': group_id,
+                            'tier': tier
                         }
                         expanded_tests.append(test_obj)
                         self.test_groups[group_id]['members'].append(f"{actual_test_name}_{i}")
@@ -312,7 +971,8 @@ class RegressionRunner:
                         'run_number': 1,
                         'seed': custom_seed,
                         'command_add': command_add,
-                        'test_group': None
+                        'test_group': None,
+                        'tier': tier
                     }
                     expanded_tests.append(test_obj)
                     
@@ -494,57 +1154,189 @@ class RegressionRunner:
             
         except Exception as e:
             print(f"⚠️  Warning: Could not generate no pass list: {e}")
-    
-    def _cleanup_existing_folders(self):
-        """Clean up old run_folder_xx directories before starting, but keep folders from last run within current range"""
-        print("🧹 Cleaning up old run_folder_xx directories...")
-        folders_cleaned = 0
-        folders_kept = 0
-        
-        # Look for all run_folder_xx patterns in parent directory
-        parent_dir = self.base_dir.parent
-        for folder_path in parent_dir.glob("run_folder_*"):
-            if folder_path.is_dir():
-                try:
-                    # Extract folder number from name
-                    folder_name = folder_path.name
-                    folder_num = int(folder_name.split('_')[-1])
-                    
-                    if folder_num >= self.max_parallel:
-                        # This folder is beyond current parallel count, remove it
-                        shutil.rmtree(folder_path)
-                        folders_cleaned += 1
+
+    def _generate_gated_list(self, tests):
+        """Write the runs held back by a closed smoke gate, ready to run once the build is fixed"""
+        gated_list_file = self.results_folder / "gated_list"
+        try:
+            with open(gated_list_file, 'w') as f:
+                f.write(f"# Gated list generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"# Runs not started because the tier-0 smoke runs failed the gate\n")
+                f.write(f"# Format: test_name [seed=XXX] [command_add=XXX]\n")
+                f.write(f"# Total gated runs: {len(tests)}\n")
+                f.write("#\n")
+                for test_obj in tests:
+                    params = []
+                    if test_obj.get('seed') is not None:
+                        params.append(f"seed={test_obj['seed']}")
+                    if test_obj.get('command_add') is not None:
+                        params.append(f"command_add={shlex.quote(test_obj['command_add'])}")  # see _generate_running_list
+                    f.write(' '.join([test_obj.get('base_name', test_obj['name'])] + params) + "\n")
+            print(f"📋 Generated gated list: {self._to_relative_path(gated_list_file)}")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not generate gated list: {e}")
+
+    def _first_error_line(self, log_path):
+        """Return the first UVM_ERROR/UVM_FATAL/Error-[ line of a log, or None
+
+        Streams the file (compressed or not) and stops at the first hit, so
+        multi-hundred-MB stress logs are not read whole just to find one line.
+        """
+        error_line_re = re.compile(r'UVM_FATAL(?!\s*:\s*\d+)|UVM_ERROR(?!\s*:\s*\d+)(?!\s+@\s+0:)|Error-\[')
+        try:
+            with _open_log(log_path) as f:
+                for line in f:
+                    if error_line_re.search(line):
+                        return line.strip()
+        except (OSError, TypeError):
+            pass
+        return None
+
+    def _failure_signature(self, result):
+        """Reduce a failing run to a signature shared by every run failing the same way
+
+        The signature is the first error line of the log with everything that varies
+        per seed stripped out:
+            UVM_ERROR /x/axi4_scoreboard.sv(812) @ 91230: uvm_test_top.env.sb [SB_DATA] addr=0x1f00 exp=3 got=7
+            -> FAIL UVM_ERROR [SB_DATA] addr=<H> exp=<N> got=<N>
+        error_msg alone is not enough: for most failures it is the generic
+        "UVM_ERROR Count: N, UVM_FATAL Count: M" from the report summary, which would
+        put every scoreboard, protocol and config failure into one bucket.
+        """
+        log_path = self.no_pass_logs_folder / f"{result.name}.log"
+        if not _find_log(log_path):
+            log_path = result.log_file
+        line = self._first_error_line(log_path) if log_path else None
+
+        if line:
+            uvm_match = re.match(r'.*?(UVM_ERROR|UVM_FATAL)\s+\S+\s+@\s+\d+\s*:\s*\S+\s+(\[[^\]]*\])?\s*(.*)', line)
+            if uvm_match:
+                severity, msg_id, text = uvm_match.groups()
+                text = f"{severity} {msg_id or ''} {text}"
+            else:
+                text = line
+        else:
+            text = result.error_msg or 'no error message'
+
+        text = re.sub(r'(/[\w.+-]+)+', '<P>', text)
+        text = re.sub(r"0x[0-9a-fA-F_]+|'h[0-9a-fA-F_]+", '<H>', text)
+        text = re.sub(r'\d+', '<N>', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return f"{result.status} {text}"[:200]
+
+    def _triage_failures(self, results):
+        """Group non-passing runs into buckets keyed by failure signature
+
+        Returns a list of (signature, runs) ordered largest bucket first.
+        """
+        buckets = {}
+        for result in results:
+            if result.status == 'PASS':
+                continue
+            buckets.setdefault(self._failure_signature(result), []).append(result)
+        return sorted(buckets.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    def _generate_triage_rerun_list(self, results):
+        """Generate a triage_rerun_list with one representative run per failure signature
+
+        Rerunning the whole no_pass_list recompiles and resimulates every failing seed,
+        even when dozens of them fail with the same message. This list keeps only the
+        fastest run of each bucket, so a reproduce-and-debug cycle costs one run per
+        distinct failure. With --triage-fsdb the representatives also carry
+        +define+DUMP_FSDB, so only they pay for a waveform build.
+        """
+        triage_list_file = self.results_folder / "triage_rerun_list"
+
+        try:
+            buckets = self._triage_failures(results)
+
+            with open(triage_list_file, 'w') as f:
+                f.write(f"# Triage rerun list generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"# One representative (fastest) run per failure signature\n")
+                f.write(f"# Format: test_name [seed=XXX] [command_add=XXX]\n")
+                f.write(f"# Failure signatures: {len(buckets)} (covering {sum(len(runs) for _, runs in buckets)} failed runs)\n")
+                if self.triage_fsdb:
+                    f.write(f"# FSDB dumping enabled for these runs (+define+DUMP_FSDB)\n")
+                f.write("#\n")
+
+                for index, (signature, runs) in enumerate(buckets, 1):
+                    representative = min(runs, key=lambda r: r.duration)
+                    base_name = self._remove_suffix_for_lists(representative.name)
+
+                    command_add = representative.command_add
+                    if self.triage_fsdb and not self.fsdb_dump and '+define+DUMP_FSDB' not in (command_add or ''):
+                        command_add = f"{command_add} +define+DUMP_FSDB" if command_add else "+define+DUMP_FSDB"
+
+                    params = []
+                    if representative.seed is not None:
+                        params.append(f"seed={representative.seed}")
+                    if command_add is not None:
+                        params.append(f"command_add={shlex.quote(command_add)}")  # see _generate_running_list
+
+                    f.write(f"# [bucket {index}] {len(runs)} run(s): {signature}\n")
+                    if params:
+                        f.write(f"{base_name} {' '.join(params)}\n")
                     else:
-                        # This folder is within current parallel count, keep it but clean contents
-                        self._cleanup_vcs_artifacts(folder_path)
-                        folders_kept += 1
-                        if self.verbose:
-                            print(f"   Keeping {folder_path.name} (cleaning VCS artifacts only)")
-                            
-                except (ValueError, IndexError):
-                    # Invalid folder name format, remove it
-                    try:
-                        shutil.rmtree(folder_path)
-                        folders_cleaned += 1
-                    except Exception as e:
-                        print(f"⚠️  Warning: Could not remove {folder_path}: {e}")
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not process {folder_path}: {e}")
-        
-        if folders_cleaned > 0:
-            print(f"✅ Cleaned up {folders_cleaned} old run folders")
-        if folders_kept > 0:
-            print(f"📁 Kept {folders_kept} run folders from previous run (cleaned VCS artifacts)")
-        if folders_cleaned == 0 and folders_kept == 0:
-            print("✅ No existing run folders to clean")
+                        f.write(f"{base_name}\n")
+
+            if buckets:
+                print(f"📋 Generated triage rerun list: {self._to_relative_path(triage_list_file)}")
+                print(f"    {len(buckets)} failure signature(s) -> {len(buckets)} rerun(s) instead of {sum(len(runs) for _, runs in buckets)}")
+
+        except Exception as e:
+            print(f"⚠️  Warning: Could not generate triage rerun list: {e}")
 
+    def _set_results_folder(self, results_folder, timestamp):
+        """Point the results folder, and every path kept inside it, at results_folder"""
+        self.results_folder = results_folder
+        self.timestamp = timestamp
+        self.logs_folder = self.results_folder / "logs"
+        self.pass_logs_folder = self.logs_folder / "pass_logs"
+        self.no_pass_logs_folder = self.logs_folder / "no_pass_logs"
+        self.waves_folder = self.results_folder / "waves"
+        self.coverage_folder = self.results_folder / "coverage_collect" if self.coverage else None
+        
+        # Every regression executes in its own run folders under work/, so several can
+        # run from one checkout at once
+        self.work_folder = self.results_folder / "work"
+        self.abs_compile_file = self.results_folder / "axi4_compile.abs.f"
+        
+        # Machine-readable results: results.jsonl is appended as each test completes,
+        # results.csv is written once at the end (see _update_progress/_print_summary)
+        self.results_jsonl_file = self.results_folder / "results.jsonl"
+        self.results_csv_file = self.results_folder / "results.csv"
+        
+        # Resume journal: regression_state.json records how the run was started,
+        # lsf_jobs.jsonl every LSF submission (so a resumed run can re-attach to it)
+        self.state_file = self.results_folder / "regression_state.json"
+        self.lsf_journal_file = self.results_folder / "lsf_jobs.jsonl"
+        # <job_id>.start / <job_id>.done records written by the LSF job scripts
+        self.lsf_status_dir = self.results_folder / "lsf_status"
+        
+    def _claim_results_folder(self):
+        """Create a new regression's results folder, atomically
+        
+        Another regression (or worker) started from this checkout in the same second
+        gets the next timestamp instead of sharing the folder.
+        """
+        while True:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self._set_results_folder(self.base_dir / f"regression_result_{timestamp}", timestamp)
+            try:
+                self.results_folder.mkdir()
+                return
+            except FileExistsError:
+                time.sleep(0.2)
+        
     def _setup_test_folders(self) :
-        """Create and setup test execution folders"""
+        """Create and setup test execution folders
+
+        The run folders are this regression's own (work/run_folder_NN in its results
+        folder): nothing outside the results folder is deleted, so regressions started
+        side by side from one checkout do not wipe each other's builds.
+        """
         folders = []
         
-        # Clean up existing run folders first
-        self._cleanup_existing_folders()
-        
         # Create results folder and logs subfolders
         self.results_folder.mkdir(exist_ok=True)
         self.logs_folder.mkdir(exist_ok=True)
@@ -555,6 +1347,13 @@ class RegressionRunner:
         if self.coverage:
             self.coverage_folder.mkdir(exist_ok=True)
         
+        # Open the results stream now so that every completion lands on disk
+        self._results_stream = open(self.results_jsonl_file, 'a', buffering=1)
+        
+        self._write_absolute_compile_file()
+        if self.scratch_root:
+            self._setup_scratch()
+        
         print(f"📁 Created results folder: {self._to_relative_path(self.results_folder)}")
         
         # Verify the folder was actually created
@@ -568,31 +1367,23 @@ class RegressionRunner:
         if self.coverage:
             print(f"       └─ coverage_collect folder: {self._to_relative_path(self.coverage_folder)}")
         
-        # Always set up parallel folders based on number of tests
-        num_folders = min(self.max_parallel, self.total_tests)
+        # Always set up parallel folders based on number of tests (workers bring their own)
+        num_folders = 0 if self.serve_address else min(self.max_parallel, self.total_tests)
         print(f"🔧 Setting up {num_folders} parallel execution folders...")
         
         for i in range(num_folders):
             folder_name = f"run_folder_{i:02d}"
-            folder_path = self.base_dir.parent / folder_name
-            
-            # Clean existing folder (additional safety check)
-            if folder_path.exists():
-                shutil.rmtree(folder_path)
-            
-            # Create new folder
-            folder_path.mkdir(exist_ok=True)
-            
-# Using ../axi4_compile.f directly from run folders - no file copying needed
+            folder_path = self.work_folder / folder_name
             
+            # Kept as they are when resuming: LSF jobs of the interrupted run may
+            # still be executing in them and are re-attached
+            folder_path.mkdir(parents=True, exist_ok=True)
             folders.append(folder_path)
             
-        print(f"✅ Created {len(folders)} execution folders")
+        print(f"✅ Created {len(folders)} execution folders in {self._to_relative_path(self.work_folder)}")
             
         return folders
     
-# Removed _create_compile_file_for_folder - using ../axi4_compile.f directly
-    
     def _kill_all_lsf_jobs(self):
         """Kill all LSF jobs associated with this regression"""
         if not self.lsf_jobs:
@@ -618,7 +1409,13 @@ class RegressionRunner:
         log_file_rel = f'{test_name}.log'
         
         # Extract base test name for UVM_TESTNAME (remove _N suffix if present)
-        base_test_name = self._extract_base_test_name(test_name)
+        base_test_name = self._uvm_test_name(test_obj)
+        # Reruns repeat a run's stimulus; their coverage would only be counted twice
+        collect_coverage = self.coverage and not test_obj.get('rerun_of')
+        verbosity = test_obj.get('verbosity', self.verbosity)
+        
+        # Paths resolve from the run folder under work/ and from scratch alike
+        vcs_command_add = self._absolute_command_add(command_add)
         
         with open(job_script, 'w') as f:
             f.write('#!/bin/bash\n')
@@ -627,11 +1424,22 @@ class RegressionRunner:
             f.write('#BSUB -e {}.lsf.err\n'.format(test_name))
             f.write('#BSUB -q normal\n')  # Adjust queue as needed
             f.write('#BSUB -n 1\n')
-            f.write('#BSUB -R "rusage[mem=4000]"\n')  # 4GB memory
+            mem_request_mb = self._memory_request_mb(test_obj.get('rerun_of') or test_name, command_add)
+            f.write(f'#BSUB -R "rusage[mem={mem_request_mb}]"\n')  # Sized from regression_history.json
             f.write('\n')
             f.write('# Change to execution directory\n')
             f.write(f'cd {folder_path}\n')
             f.write('\n')
+            f.write('# Start/completion records for the runner (see _collect_lsf_status_records).\n')
+            f.write('# Written to a temporary name and renamed, so the runner never reads half a record.\n')
+            f.write(f'status_dir={self.lsf_status_dir}\n')
+            f.write('job_start=$(date +%s.%N)\n')
+            f.write('echo "$job_start" > $status_dir/.$LSB_JOBID.start && '
+                    'mv -f $status_dir/.$LSB_JOBID.start $status_dir/$LSB_JOBID.start\n')
+            f.write('\n')
+            f.write('# Phase timestamps for the runner (see _read_lsf_phase_stamps)\n')
+            f.write(f'echo "started $job_start" > {test_name}.phases\n')
+            f.write('\n')
             f.write('# Clean up VCS artifacts before running test\n')
             # NOTE: *.log is deliberately NOT removed. Execution folders are reused by
             # later tests, and the runner reads each result from
@@ -656,8 +1464,30 @@ class RegressionRunner:
                 seed_value &= 0x7FFFFFFF  # Ensure positive 32-bit value
                 f.write(f'# Generated random seed: {seed_value}\n')
             
+            f.write(f'echo "launched $(date +%s.%N)" >> {test_name}.phases\n')
+            f.write('# GNU time, where installed, measures peak RSS and CPU of the VCS process tree\n')
+            f.write('usage_cmd=""\n')
+            f.write(f'[ -x /usr/bin/time ] && usage_cmd="/usr/bin/time -o {folder_path}/{test_name}.usage -f %M,%U,%S"\n')
+            if self.scratch_root:
+                f.write('# Execute in node-local scratch when the host has one; only the log,\n')
+                f.write('# coverage and waves are copied back (see _setup_scratch)\n')
+                f.write(f'scratch_root="{self.scratch_root}"\n')
+                f.write('exec_dir=""\n')
+                f.write(f'if [ -n "$scratch_root" ] && mkdir -p "$scratch_root/axi4_regression_{self.timestamp}/{test_name}"; then\n')
+                f.write(f'    exec_dir="$scratch_root/axi4_regression_{self.timestamp}/{test_name}"\n')
+                f.write('    cd "$exec_dir"\n')
+                f.write('    # Killed by bkill or the run limit: still bring the log back before the job ends\n')
+                f.write('    return_log() {\n')
+                f.write('        [ -n "$exec_dir" ] || return\n')
+                f.write(f'        mv -f "$exec_dir/{test_name}.log" {folder_path}/ 2>/dev/null\n')
+                f.write(f'        cd {folder_path} && rm -rf "$exec_dir"\n')
+                f.write('        exec_dir=""\n')
+                f.write('    }\n')
+                f.write('    trap return_log EXIT\n')
+                f.write("    trap 'return_log; exit 143' TERM\n")
+                f.write('fi\n')
             f.write('# Run VCS\n')
-            f.write(f'vcs -full64 -lca -kdb -sverilog +v2k ')
+            f.write(f'$usage_cmd vcs -full64 -lca -kdb -sverilog +v2k ')
             f.write(f'-debug_access+all -ntb_opts uvm-1.2 ')
             f.write(f'+ntb_random_seed={seed_value} -override_timescale=1ps/1ps ')
             f.write(f'+nospecify +no_timing_check ')
@@ -665,7 +1495,7 @@ class RegressionRunner:
                 f.write(f'+define+DUMP_FSDB ')
             
             # Add coverage flags if coverage collection is enabled
-            if self.coverage:
+            if collect_coverage:
                 # Use base test name for VDB directory to match expected naming
                 base_test_name_for_vdb = self._extract_base_test_name(test_name)
                 coverage_dir = f"{base_test_name_for_vdb}.vdb"
@@ -673,16 +1503,49 @@ class RegressionRunner:
                 f.write(f'-cm_seqnoconst ')
                 f.write(f'-cm_dir {coverage_dir} ')
                 f.write(f'-cm_name {base_test_name_for_vdb} ')
+                f.write(self._coverage_scope_option(command_add))
             
-            f.write(f'+define+UVM_VERDI_COMPWAVE -f ../axi4_compile.f ')
+            f.write(f'+define+UVM_VERDI_COMPWAVE -f {self.abs_compile_file} ')
             f.write(f'-debug_access+all -R +UVM_TESTNAME={base_test_name} ')
-            f.write(f'+UVM_VERBOSITY=MEDIUM +plusarg_ignore ')
+            f.write(f'+UVM_VERBOSITY={verbosity} +plusarg_ignore ')
+            f.write(self._rerun_waves_option(test_obj))
             
             # Add custom command if provided
             if command_add:
-                f.write(f'{command_add} ')
+                f.write(f'{vcs_command_add} ')
             
             f.write(f'-l {test_name}.log\n')
+            f.write('vcs_status=$?\n')
+            f.write('job_end=$(date +%s.%N)\n')
+            f.write('copy_back_kb=null\n')
+            if self.scratch_root:
+                returned = [f'{test_name}.log']
+                if collect_coverage:
+                    returned.append(coverage_dir)
+                f.write('if [ -n "$exec_dir" ]; then\n')
+                f.write('    shopt -s nullglob\n')
+                f.write(f'    waves=({"*.fsdb" if self._wants_waves(command_add) else ""})\n')
+                f.write(f'    copy_back_kb=$(du -skc {" ".join(returned)} "${{waves[@]}}" /dev/null 2>/dev/null | tail -n 1 | cut -f1)\n')
+                if collect_coverage:
+                    f.write(f'    rm -rf {folder_path}/{coverage_dir}\n')
+                f.write(f'    mv -f {" ".join(returned)} {folder_path}/ 2>/dev/null\n')
+                f.write('    if [ ${#waves[@]} -gt 0 ]; then\n')
+                f.write(f'        mkdir -p {self.waves_folder}/{test_name} && mv -f "${{waves[@]}}" {self.waves_folder}/{test_name}/\n')
+                f.write('    fi\n')
+                f.write(f'    cd {folder_path} && rm -rf "$exec_dir"\n')
+                f.write('    exec_dir=""\n')
+                f.write('fi\n')
+            f.write(f'echo "sim_end $job_end" >> {test_name}.phases\n')
+            f.write('\n')
+            f.write('# Completion record: exit code, start/end, host, peak memory (KB) and CPU\n')
+            f.write(f'IFS=, read -r peak_kb user_s sys_s < <(tail -n 1 {test_name}.usage 2>/dev/null)\n')
+            f.write('case "$peak_kb" in ""|*[!0-9]*) peak_kb=null; user_s=null; sys_s=null;; esac\n')
+            f.write('printf \'{"job_id": "%s", "test": "%s", "exit_code": %d, "start": %s, "end": %s, '
+                    '"host": "%s", "peak_mem_kb": %s, "user_s": %s, "sys_s": %s, "copy_back_kb": %s}\\n\' ')
+            f.write(f'"$LSB_JOBID" "{test_name}" "$vcs_status" "$job_start" "$job_end" "$(hostname)" '
+                    '"$peak_kb" "$user_s" "$sys_s" "$copy_back_kb" > $status_dir/.$LSB_JOBID.done\n')
+            f.write('mv -f $status_dir/.$LSB_JOBID.done $status_dir/$LSB_JOBID.done\n')
+            f.write('exit $vcs_status\n')
         
         # Make script executable
         os.chmod(job_script, 0o755)
@@ -713,10 +1576,13 @@ class RegressionRunner:
                     'command_add': command_add,
                     'base_name': test_obj.get('base_name', test_name),
                     'run_number': test_obj.get('run_number', 1),
-                    'test_group': test_obj.get('test_group')
+                    'test_group': test_obj.get('test_group'),
+                    'mem_request_mb': mem_request_mb,
+                    'timeout': test_obj.get('timeout', self.timeout)
                 }
                 
                 self.pending_jobs += 1
+                self._journal_lsf_submission(job_id)
                 if self.verbose:
                     print(f"📤 [LSF] Submitted {test_name} as job {job_id}")
                 
@@ -727,11 +1593,197 @@ class RegressionRunner:
         except subprocess.CalledProcessError as e:
             raise Exception(f"Failed to submit LSF job: {e.stderr}")
     
+    def _journal_lsf_submission(self, job_id):
+        """Append a submitted job to lsf_jobs.jsonl so --resume can re-attach to it"""
+        job_info = self.lsf_jobs[job_id]
+        record = dict(job_info, job_id=job_id, folder_path=str(job_info['folder_path']))
+        try:
+            with open(self.lsf_journal_file, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not journal LSF job {job_id}: {e}")
+    
+    def _read_journal(self, journal_file):
+        """Read a JSON Lines journal, skipping a torn last line left by a crash"""
+        records = []
+        if not journal_file.exists():
+            return records
+        with open(journal_file, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+    
+    def _save_regression_state(self, test_list_file):
+        """Record how this regression was started, so --resume needs only the folder"""
+        state = {
+            'test_list': str(Path(test_list_file).resolve()),
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'use_lsf': self.use_lsf,
+            'timeout': self.timeout,
+            'max_parallel': self.requested_parallel,
+            'fsdb_dump': self.fsdb_dump,
+            'coverage': self.coverage,
+            'seed_base': self.seed_base,
+            'low_verbosity': self.verbosity == 'LOW',
+            'rerun_verbosity': self.rerun_verbosity,
+            'rerun_fsdb': self.rerun_fsdb,
+            'compress_logs': self.log_codec,
+        }
+        try:
+            with open(self.state_file, 'w') as f:
+                json.dump(state, f, indent=2)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save regression state: {e}")
+    
+    def _load_resume_journal(self, tests):
+        """Restore verdicts from results.jsonl and return only the tests still to run
+
+        Finished runs are rebuilt as TestResults and counted as completed, so the final
+        lists and reports cover the whole regression, not just the resumed part. In LSF
+        mode, journalled jobs without a verdict are remembered for _reattach_lsf_jobs.
+        """
+        test_names = {test_obj['name'] for test_obj in tests}
+        finished = {}
+        for record in self._read_journal(self.results_jsonl_file):
+            if record.get('name') in test_names:
+                finished[record['name']] = record  # Last verdict wins
+        
+        for record in finished.values():
+            result = TestResult.from_record(record)
+            self.results.append(result)
+            self.completed_tests += 1
+            if result.status == 'PASS':
+                self.passed_tests += 1
+            else:
+                self.failed_tests += 1
+        
+        remaining = [test_obj for test_obj in tests if test_obj['name'] not in finished]
+        
+        if self.use_lsf:
+            # A test submitted more than once (resumed before) is journalled once per
+            # job: only its latest job can still be the one to wait for
+            latest_jobs = {}
+            for record in self._read_journal(self.lsf_journal_file):
+                if record.get('test_name') in test_names and record['test_name'] not in finished:
+                    latest_jobs[record['test_name']] = record
+            for record in latest_jobs.values():
+                self._resume_lsf_jobs[int(record['job_id'])] = record
+        
+        print(f"♻️  Resuming {self._to_relative_path(self.results_folder)}: "
+              f"{len(finished)} runs already have a verdict ({self.passed_tests} PASS, {self.failed_tests} FAIL), "
+              f"{len(remaining)} to go")
+        return remaining
+    
+    def _reattach_lsf_jobs(self, test_names):
+        """Take over still-known LSF jobs of the interrupted run instead of resubmitting
+
+        Only jobs of test_names (the batch about to run) are considered. Returns the
+        names of the tests that were re-attached. Jobs LSF no longer knows about are
+        left out and get resubmitted with the rest of the remaining tests.
+        """
+        reattached = set()
+        for job_id, record in list(self._resume_lsf_jobs.items()):
+            if record['test_name'] not in test_names:
+                continue
+            del self._resume_lsf_jobs[job_id]
+            status, _ = self._check_lsf_job_status(job_id)
+            if status not in ('PEND', 'RUN', 'PSUSP', 'USUSP', 'SSUSP', 'DONE', 'EXIT'):
+                continue
+            
+            job_info = dict(record)
+            job_info.pop('job_id', None)
+            job_info['folder_path'] = Path(record['folder_path'])
+            job_info['status'] = status
+            job_info.pop('completed', None)
+            if status == 'RUN':
+                job_info.setdefault('start_time', time.time())
+                self.running_jobs += 1
+            elif status == 'PEND':
+                self.pending_jobs += 1
+            self.lsf_jobs[job_id] = job_info
+            reattached.add(record['test_name'])
+            if self.verbose:
+                print(f"🔗 [LSF] Re-attached {record['test_name']} to job {job_id} ({status})")
+        
+        if reattached:
+            print(f"🔗 [LSF] Re-attached to {len(reattached)} jobs from the interrupted run")
+        return reattached
+    
+    def _parse_lsf_mem(self, value):
+        """bjobs MAX_MEM ('1.2 Gbytes', '512 Mbytes', '900 Kbytes') -> MB, or None"""
+        match = re.match(r'\s*([\d.]+)\s*([KMGT])', value or '', re.IGNORECASE)
+        if not match:
+            return None
+        scale = {'K': 1.0 / 1024, 'M': 1.0, 'G': 1024.0, 'T': 1048576.0}[match.group(2).upper()]
+        return round(float(match.group(1)) * scale, 1)
+    
+    def _parse_lsf_cpu(self, value):
+        """bjobs CPU_USED ('83.0 second(s)' or '00:01:23.45') -> seconds, or None"""
+        value = (value or '').strip()
+        match = re.match(r'([\d.]+)\s*second', value)
+        if match:
+            return float(match.group(1))
+        match = re.match(r'(\d+):(\d+):([\d.]+)$', value)
+        if match:
+            return int(match.group(1)) * 3600 + int(match.group(2)) * 60 + float(match.group(3))
+        return None
+    
+    def _apply_lsf_record(self, job_id, record):
+        """Status and exit reason from one bjobs -json record; keeps host and usage"""
+        if 'ERROR' in record:
+            # "Job <id> is not found": LSF has already cleaned it, assume completed
+            return 'DONE', ''
+        if job_id in self.lsf_jobs:
+            job_info = self.lsf_jobs[job_id]
+            exec_host = record.get('EXEC_HOST', '')
+            if exec_host:
+                job_info['exec_host'] = exec_host
+            # Usage only grows while the job runs; keep the latest reading
+            peak_mem_mb = self._parse_lsf_mem(record.get('MAX_MEM', ''))
+            if peak_mem_mb is not None:
+                job_info['peak_mem_mb'] = peak_mem_mb
+            cpu_time_s = self._parse_lsf_cpu(record.get('CPU_USED', ''))
+            if cpu_time_s is not None:
+                job_info['cpu_time_s'] = cpu_time_s
+        return record.get('STAT', 'UNKNOWN'), record.get('EXIT_REASON', '')
+    
+    def _query_lsf_jobs(self, job_ids):
+        """Status of several LSF jobs with one bjobs call per LSF_BJOBS_BATCH jobs
+
+        Returns {job_id: (status, exit_reason)}. Falls back to one query per job if
+        the batched -json form is not understood.
+        """
+        statuses = {}
+        job_ids = list(job_ids)
+        for start in range(0, len(job_ids), LSF_BJOBS_BATCH):
+            batch = job_ids[start:start + LSF_BJOBS_BATCH]
+            try:
+                result = subprocess.run(
+                    ['bjobs', '-o', 'jobid stat exit_reason exec_host max_mem cpu_used', '-json']
+                    + [str(job_id) for job_id in batch],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True
+                )
+                for record in json.loads(result.stdout).get('RECORDS', []):
+                    job_id = int(record.get('JOBID', 0))
+                    if job_id in batch:
+                        statuses[job_id] = self._apply_lsf_record(job_id, record)
+            except (OSError, ValueError):
+                pass
+            for job_id in batch:
+                if job_id not in statuses:
+                    statuses[job_id] = self._check_lsf_job_status(job_id)
+        return statuses
+    
     def _check_lsf_job_status(self, job_id):
         """Check the status of an LSF job"""
         try:
             result = subprocess.run(
-                ['bjobs', '-o', 'jobid stat exit_reason', '-json', str(job_id)],
+                ['bjobs', '-o', 'jobid stat exit_reason exec_host max_mem cpu_used', '-json', str(job_id)],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
@@ -741,10 +1793,7 @@ class RegressionRunner:
             # Parse JSON output
             data = json.loads(result.stdout)
             if 'RECORDS' in data and len(data['RECORDS']) > 0:
-                record = data['RECORDS'][0]
-                status = record.get('STAT', 'UNKNOWN')
-                exit_reason = record.get('EXIT_REASON', '')
-                return status, exit_reason
+                return self._apply_lsf_record(job_id, data['RECORDS'][0])
             else:
                 # Job not found, assume completed
                 return 'DONE', ''
@@ -772,61 +1821,177 @@ class RegressionRunner:
                 
             return 'UNKNOWN', ''
     
-    def _monitor_lsf_jobs(self):
-        """Monitor LSF jobs and update status"""
+    def _read_lsf_phase_stamps(self, job_info, log_content):
+        """Phase timestamps of a finished LSF job
+
+        The job script stamps started/launched/sim_end into <test>.phases on the
+        execution host. VCS output cannot be timestamped there, so compile_done is
+        placed after the compile + elab + link times VCS itself reports in the log.
+        Falls back to the RUN/DONE transitions this runner observed via bjobs.
+        """
+        timestamps = {'queued': job_info['submit_time']}
+        phases_file = job_info['folder_path'] / f"{job_info['test_name']}.phases"
+        try:
+            with open(phases_file, 'r') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0] in TIMING_EVENTS:
+                        timestamps[parts[0]] = float(parts[1])
+        except (OSError, ValueError):
+            pass
+        
+        if 'started' not in timestamps and 'start_time' in job_info:
+            timestamps['started'] = job_info['start_time']
+        if 'sim_end' not in timestamps and 'end_time' in job_info:
+            timestamps['sim_end'] = job_info['end_time']
+        
+        compile_match = self.VCS_COMPILE_DONE_RE.search(log_content or '')
+        if compile_match and 'launched' in timestamps:
+            build_seconds = sum(float(value) for value in compile_match.groups() if value)
+            timestamps['compile_done'] = timestamps['sim_start'] = timestamps['launched'] + build_seconds
+        return timestamps
+    
+    def _mark_lsf_job_running(self, job_info, start_time):
+        """PEND -> RUN bookkeeping for a job seen starting"""
+        if job_info['status'] == 'PEND':
+            self.pending_jobs -= 1
+        if job_info['status'] != 'RUN':
+            self.running_jobs += 1
+        job_info['status'] = 'RUN'
+        job_info.setdefault('start_time', start_time)
+    
+    def _finish_lsf_job(self, job_id, status, end_time):
+        """Mark a job completed with its final LSF status and release its counters"""
+        job_info = self.lsf_jobs[job_id]
+        if job_info['status'] == 'RUN':
+            self.running_jobs -= 1
+        elif job_info['status'] == 'PEND':
+            self.pending_jobs -= 1
+        job_info['status'] = status
+        job_info['completed'] = True
+        job_info['end_time'] = end_time
+    
+    def _collect_lsf_status_records(self):
+        """Apply the start/completion records the job scripts wrote to lsf_status/
+
+        A directory listing per call, rather than inotify: the records are written on
+        the execution hosts, and inotify does not see writes made by other NFS clients.
+        Returns the ids of jobs completed by a record.
+        """
         completed_jobs = []
+        try:
+            names = os.listdir(self.lsf_status_dir)
+        except OSError:
+            return completed_jobs
         
-        for job_id, job_info in self.lsf_jobs.items():
-            if job_info.get('completed', False):
+        for name in names:
+            if name in self._lsf_status_seen or name.startswith('.'):
                 continue
-                
-            status, exit_reason = self._check_lsf_job_status(job_id)
-            current_time = time.time()
-            
-            # Update job status
-            if job_info['status'] != status:
-                if status == 'RUN' and job_info['status'] == 'PEND':
-                    self.pending_jobs -= 1
-                    self.running_jobs += 1
-                    job_info['start_time'] = current_time
-                    
-                job_info['status'] = status
-            
-            # Check for completion
-            if status in ['DONE', 'EXIT']:
-                job_info['completed'] = True
-                job_info['end_time'] = current_time
-                
-                if status == 'RUN':
-                    self.running_jobs -= 1
-                elif status == 'PEND':
-                    self.pending_jobs -= 1
-                
-                completed_jobs.append(job_id)
-                
-            # Check for timeout
-            elif status == 'RUN' and 'start_time' in job_info:
-                elapsed = current_time - job_info['start_time']
-                if elapsed > self.timeout:
-                    print(f"⏰ [LSF] Job {job_id} ({job_info['test_name']}) timed out after {elapsed:.1f}s")
-                    try:
-                        subprocess.run(['bkill', str(job_id)], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        job_info['completed'] = True
-                        job_info['status'] = 'TIMEOUT'
-                        job_info['end_time'] = current_time
-                        self.running_jobs -= 1
-                        completed_jobs.append(job_id)
-                    except subprocess.CalledProcessError as e:
-                        print(f"⚠️  Warning: Could not kill timed out job {job_id}: {e}")
-        
+            job_id_text, _, kind = name.partition('.')
+            try:
+                job_id = int(job_id_text)
+            except ValueError:
+                continue
+            job_info = self.lsf_jobs.get(job_id)
+            if job_info is None or job_info.get('completed', False):
+                self._lsf_status_seen.add(name)
+                continue
+            try:
+                with open(self.lsf_status_dir / name, 'r') as f:
+                    content = f.read()
+                if kind == 'start':
+                    self._mark_lsf_job_running(job_info, float(content))
+                elif kind == 'done':
+                    record = json.loads(content)
+                    if record.get('host'):
+                        job_info['exec_host'] = record['host']
+                    if record.get('peak_mem_kb') is not None:
+                        job_info['peak_mem_mb'] = round(record['peak_mem_kb'] / 1024.0, 1)
+                    if record.get('user_s') is not None and record.get('sys_s') is not None:
+                        job_info['cpu_time_s'] = round(record['user_s'] + record['sys_s'], 2)
+                    job_info['exit_code'] = record['exit_code']
+                    if record.get('copy_back_kb') is not None:
+                        self._count_copy_back(record['copy_back_kb'] * 1024)
+                    self._mark_lsf_job_running(job_info, record['start'])
+                    self._finish_lsf_job(job_id, 'DONE' if record['exit_code'] == 0 else 'EXIT', record['end'])
+                    completed_jobs.append(job_id)
+                else:
+                    continue
+            except (OSError, ValueError, KeyError, TypeError):
+                continue  # Unreadable for now (e.g. NFS attribute cache); retry next scan
+            self._lsf_status_seen.add(name)
         return completed_jobs
     
-    def _display_lsf_status(self):
-        """Display current LSF job status summary"""
-        remaining_tests = self.total_tests - self.completed_tests
-        elapsed = time.time() - self.start_time
-        
-        # Calculate average completion time for ETA
+    def _monitor_lsf_jobs(self):
+        """Monitor LSF jobs and update status
+
+        Completion records are the primary signal. bjobs is asked, in batches and only
+        every LSF_FALLBACK_POLL_INTERVAL seconds, about jobs still without a record;
+        a job LSF reports finished is completed from bjobs if its record is still
+        missing LSF_RECORD_GRACE seconds later (killed, host failure, record lost).
+        """
+        poll_start = time.time()
+        completed_jobs = self._collect_lsf_status_records()
+        current_time = time.time()
+        self._record_lsf_poll('status_records', current_time - poll_start)
+        
+        if current_time - self._last_lsf_fallback_poll >= LSF_FALLBACK_POLL_INTERVAL:
+            self._last_lsf_fallback_poll = current_time
+            silent_jobs = [job_id for job_id, job_info in self.lsf_jobs.items()
+                           if not job_info.get('completed', False)]
+            statuses = self._query_lsf_jobs(silent_jobs)
+            if silent_jobs:
+                self._record_lsf_poll('bjobs', time.time() - current_time)
+            for job_id, (status, exit_reason) in statuses.items():
+                job_info = self.lsf_jobs[job_id]
+                if job_info.get('completed', False):
+                    continue  # its record arrived while bjobs ran
+                if status == 'RUN':
+                    self._mark_lsf_job_running(job_info, current_time)
+                elif status in ['DONE', 'EXIT'] and 'lsf_finished' not in job_info:
+                    job_info['lsf_finished'] = (status, exit_reason, current_time)
+        
+        for job_id, job_info in self.lsf_jobs.items():
+            if job_info.get('completed', False):
+                continue
+            if 'lsf_finished' in job_info:
+                status, exit_reason, finished_at = job_info['lsf_finished']
+                if current_time - finished_at >= LSF_RECORD_GRACE:
+                    if self.verbose:
+                        print(f"⚠️  [LSF] Job {job_id} ({job_info['test_name']}) ended without a completion record"
+                              f"{': ' + exit_reason if exit_reason else ''}")
+                    self._finish_lsf_job(job_id, status, finished_at)
+                    completed_jobs.append(job_id)
+                continue
+            if job_info['status'] != 'RUN' or 'start_time' not in job_info:
+                continue
+            # Check for timeout
+            elapsed = current_time - job_info['start_time']
+            if elapsed > job_info.get('timeout', self.timeout):
+                print(f"⏰ [LSF] Job {job_id} ({job_info['test_name']}) timed out after {elapsed:.1f}s")
+                try:
+                    subprocess.run(['bkill', str(job_id)], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                    self._finish_lsf_job(job_id, 'TIMEOUT', current_time)
+                    completed_jobs.append(job_id)
+                except subprocess.CalledProcessError as e:
+                    print(f"⚠️  Warning: Could not kill timed out job {job_id}: {e}")
+        
+        return completed_jobs
+    
+    def _record_lsf_poll(self, source, seconds):
+        """Count one LSF completion poll ('status_records' scan or 'bjobs' query) and its latency"""
+        stats = self.lsf_poll.setdefault(source, {'polls': 0, 'seconds': 0.0, 'last_s': 0.0, 'max_s': 0.0})
+        stats['polls'] += 1
+        stats['seconds'] += seconds
+        stats['last_s'] = seconds
+        stats['max_s'] = max(stats['max_s'], seconds)
+    
+    def _display_lsf_status(self):
+        """Display current LSF job status summary"""
+        remaining_tests = self.total_tests - self.completed_tests
+        elapsed = time.time() - self.start_time
+        
+        # Calculate average completion time for ETA
         if self.completed_tests > 0:
             avg_time = elapsed / self.completed_tests
             eta_seconds = remaining_tests * avg_time
@@ -849,50 +2014,14 @@ class RegressionRunner:
             print(f"           Results: {self.passed_tests} PASS, {self.failed_tests} FAIL")
     
     def _cleanup_all_folders(self):
-        """Clean up only old execution folders, keep all folders from current run"""
-        print(f"🧹 Cleaning up old execution folders (keeping run_folder_00 to run_folder_{self.max_parallel-1:02d} from current run)...")
-        
-        # Find all run_folder_* directories
-        all_run_folders = []
-        parent_dir = self.base_dir.parent
-        for folder_path in parent_dir.glob("run_folder_*"):
-            if folder_path.is_dir():
-                # Extract folder number from name
-                try:
-                    folder_name = folder_path.name
-                    folder_num = int(folder_name.split('_')[-1])
-                    all_run_folders.append((folder_num, folder_path))
-                except (ValueError, IndexError):
-                    # Skip folders with invalid naming
-                    continue
-        
-        if not all_run_folders:
-            print("✅ No old run folders to clean up")
-            return
-        
-        # Remove folders that are beyond the current max_parallel range
-        removed_count = 0
-        kept_count = 0
-        
-        for folder_num, folder_path in all_run_folders:
-            if folder_num >= self.max_parallel:
-                # This folder is beyond current parallel count, remove it
-                try:
-                    shutil.rmtree(folder_path)
-                    print(f"🧹 Removed old folder: {folder_path.name}")
-                    removed_count += 1
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not remove {folder_path}: {e}")
-            else:
-                # This folder is within current parallel count, keep it
-                kept_count += 1
-        
-        if kept_count > 0:
-            print(f"📁 Keeping {kept_count} execution folders from current run (run_folder_00 to run_folder_{self.max_parallel-1:02d})")
-        if removed_count > 0:
-            print(f"🧹 Removed {removed_count} old execution folders")
-        else:
-            print("✅ No old folders to remove")
+        """Remove this regression's execution folders (work/) once it has passed"""
+        try:
+            shutil.rmtree(self.work_folder)
+            print(f"🧹 Removed execution folders: {self._to_relative_path(self.work_folder)}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️  Warning: Could not remove {self._to_relative_path(self.work_folder)}: {e}")
     
     def _cleanup_vcs_artifacts(self, folder_path):
         """Clean up VCS compilation artifacts before running a test"""
@@ -947,7 +2076,7 @@ class RegressionRunner:
                 print(f"⚠️  Warning: Could not clean old logs in {folder_path}: {e}")
     
     def _copy_coverage_files(self, test_name, folder_path, folder_id):
-        """Copy coverage files from test execution folder to central coverage collection folder"""
+        """Move coverage files from test execution folder to central coverage collection folder"""
         if not self.coverage:
             return
         
@@ -963,65 +2092,103 @@ class RegressionRunner:
             # Keep .vdb extension in destination name for proper URG processing
             dest_coverage_dir = self.coverage_folder / f"{test_name}_cov_{folder_id:02d}.vdb"
             
-            # Copy coverage database to collection folder
-            # Handle compatibility with older Python versions
+            # Move coverage database to collection folder (the run folder is
+            # cleaned before its next test, so nothing reads it there again)
             if dest_coverage_dir.exists():
                 shutil.rmtree(dest_coverage_dir)
-            shutil.copytree(coverage_dir, dest_coverage_dir)
+            move_path(coverage_dir, dest_coverage_dir)
             
             if self.verbose:
-                print(f"📊 [Folder {folder_id:02d}] Copied coverage data: {coverage_dir.name} -> {dest_coverage_dir.name}")
+                print(f"📊 [Folder {folder_id:02d}] Moved coverage data: {coverage_dir.name} -> {dest_coverage_dir.name}")
             
-            # Also copy any additional coverage files (like .cm files if they exist)
+            # Also move any additional coverage files (like .cm files if they exist)
             for pattern in ['*.cm', '*.ucm', '*.ccf']:
                 for coverage_file in folder_path.glob(pattern):
                     dest_file = self.coverage_folder / f"{test_name}_{coverage_file.name}"
-                    shutil.copy2(coverage_file, dest_file)
+                    move_path(coverage_file, dest_file)
                     if self.verbose:
-                        print(f"📊 [Folder {folder_id:02d}] Copied coverage file: {coverage_file.name}")
+                        print(f"📊 [Folder {folder_id:02d}] Moved coverage file: {coverage_file.name}")
                         
         except Exception as e:
             print(f"⚠️  Warning: Could not copy coverage files for {test_name}: {e}")
     
+    def _coverage_scope_option(self, command_add):
+        """-cm_hier option for a run's build: fabric-IP builds only instrument up to the fabric interface"""
+        tokens = self._compile_signature(command_add)
+        if '-cm_hier' in tokens:
+            return ''
+        if any(os.path.basename(token).startswith(FABRIC_IP_COMPILE_FILE_PREFIX) for token in tokens):
+            return f"-cm_hier {self._absolute_path_token(FABRIC_IP_COVERAGE_SCOPE, self.path_anchor_dir)} "
+        return ''
+    
+    def _coverage_groups(self, coverage_dirs):
+        """Collected .vdb databases grouped by the compile signature of the run that wrote them
+
+        urg can only merge databases of one build: baseline, +define+RUN_10X10_CONFIG and
+        fabric-IP builds differ in design hierarchy and -cm scope. Groups are ordered by
+        size, largest first; databases of runs this regression has no result for form a
+        group of their own.
+        """
+        signatures = {result.name: self._compile_signature(result.command_add) for result in self.results}
+        groups = {}
+        for cov_dir in coverage_dirs:
+            run_name = cov_dir.name[:-len('.vdb')].rsplit('_cov_', 1)[0]
+            groups.setdefault(signatures.get(run_name), []).append(cov_dir)
+        return sorted(groups.items(), key=lambda item: -len(item[1]))
+    
     def _merge_coverage_data(self):
-        """Merge all collected coverage data using VCS urg tool"""
+        """Merge the collected coverage data with urg, one merge per build, in parallel"""
         if not self.coverage or not self.coverage_folder:
             return
         
-        # Create temporary merge folder at synopsys_sim level
-        temp_merge_folder = self.base_dir / "coverage_merge_temp"
+        coverage_dirs = [cov_dir for cov_dir in sorted(self.coverage_folder.glob("*.vdb"))
+                         if cov_dir.name != "merged_coverage.vdb"]
+        if not coverage_dirs:
+            print(f"⚠️  No coverage data found in {self.coverage_folder}")
+            return
+        
+        groups = self._coverage_groups(coverage_dirs)
+        print(f"\n📊 Merging coverage data from {len(coverage_dirs)} test runs in {len(groups)} build group(s)...")
+        
+        # A single build keeps the usual coverage_collect/merged_coverage.vdb layout
+        merges = []
+        for index, (signature, group_dirs) in enumerate(groups):
+            output_dir = self.coverage_folder if len(groups) == 1 else self.coverage_folder / f"build_{index:02d}"
+            build = ' '.join(signature) if signature else ("default build" if signature is not None else "unknown build")
+            merges.append((output_dir, build, group_dirs))
+        
+        with open(self.coverage_folder / "coverage_groups.txt", 'w') as f:
+            f.write("# Coverage merge groups: one urg merge per build (compile options of the runs)\n")
+            for output_dir, build, group_dirs in merges:
+                f.write(f"{output_dir.name}\t{len(group_dirs)} runs\t{build}\n")
+                for cov_dir in group_dirs:
+                    f.write(f"    {cov_dir.name}\n")
+        
+        with ThreadPoolExecutor(max_workers=min(len(merges), os.cpu_count() or 1)) as executor:
+            reports = list(executor.map(lambda merge: self._merge_coverage_group(*merge), merges))
+        
+        # Reported once all merges are done, so that the groups do not interleave
+        for (output_dir, build, group_dirs), lines in zip(merges, reports):
+            print(f"\n📊 Coverage of {len(group_dirs)} runs, {build}:")
+            for line in lines:
+                print(f"   {line}")
+    
+    def _merge_coverage_group(self, output_dir, build, coverage_dirs):
+        """Merge the databases of one build into output_dir; returns the lines to report"""
+        lines = []
+        # urg writes its scratch files into the working directory; every merge gets its own
+        temp_merge_folder = self.work_folder / f"coverage_merge_{output_dir.name}"
         
         try:
-            # Create temp folder if it doesn't exist
             if temp_merge_folder.exists():
                 shutil.rmtree(temp_merge_folder)
-            temp_merge_folder.mkdir()
-            
-            # Copy all coverage databases to temp folder with original .vdb structure
-            coverage_dirs = list(self.coverage_folder.glob("*.vdb"))
-            
-            if not coverage_dirs:
-                print(f"⚠️  No coverage data found in {self.coverage_folder}")
-                return
-            
-            print(f"\n📊 Preparing coverage data from {len(coverage_dirs)} test runs for merge...")
-            
-            # Copy coverage databases to temp folder
-            for cov_dir in coverage_dirs:
-                dest_dir = temp_merge_folder / cov_dir.name
-                shutil.copytree(cov_dir, dest_dir)
-                if self.verbose:
-                    print(f"   Copied {cov_dir.name} to temp merge folder")
-            
-            print(f"📊 Merging coverage data in {temp_merge_folder}...")
+            temp_merge_folder.mkdir(parents=True)
+            output_dir.mkdir(exist_ok=True)
             
             # Build urg command to merge coverage databases (use absolute paths)
             urg_cmd = ['urg']
-            
-            # Add all coverage directories
-            temp_coverage_dirs = list(temp_merge_folder.glob("*.vdb"))
-            for cov_dir in temp_coverage_dirs:
-                urg_cmd.extend(['-dir', cov_dir.name])
+            for cov_dir in coverage_dirs:
+                urg_cmd.extend(['-dir', str(cov_dir)])
             
             # Set output directory and format
             urg_cmd.extend([
@@ -1033,10 +2200,8 @@ class RegressionRunner:
             ])
             
             if self.verbose:
-                print(f"Running coverage merge command: {' '.join(urg_cmd)}")
-                print(f"Working directory: {temp_merge_folder}")
+                lines.append(f"Running coverage merge command: {' '.join(urg_cmd)}")
             
-            # Execute coverage merge in temp folder
             result = subprocess.run(
                 urg_cmd,
                 cwd=str(temp_merge_folder),
@@ -1045,86 +2210,202 @@ class RegressionRunner:
                 timeout=600  # 10 minute timeout for coverage merge
             )
             
-            if result.returncode == 0:
-                print(f"✅ Coverage merge completed successfully")
-                
-                # Move merged coverage and report to final location
-                merged_coverage_src = temp_merge_folder / "merged_coverage.vdb"
-                coverage_report_src = temp_merge_folder / "coverage_report"
-                
-                if merged_coverage_src.exists():
-                    merged_coverage_dest = self.coverage_folder / "merged_coverage.vdb"
-                    if merged_coverage_dest.exists():
-                        shutil.rmtree(merged_coverage_dest)
-                    shutil.move(str(merged_coverage_src), str(merged_coverage_dest))
-                    print(f"   Merged database: {merged_coverage_dest}")
-                
-                if coverage_report_src.exists():
-                    coverage_report_dest = self.coverage_folder / "coverage_report"
-                    if coverage_report_dest.exists():
-                        shutil.rmtree(coverage_report_dest)
-                    shutil.move(str(coverage_report_src), str(coverage_report_dest))
-                    print(f"   Coverage report: {coverage_report_dest}")
-                
-                # Display coverage summary if available
-                summary_file = self.coverage_folder / "coverage_report" / "summary.txt"
-                if summary_file.exists():
-                    print(f"\n📊 Coverage Summary:")
-                    with open(summary_file, 'r') as f:
-                        # Read first few lines of summary
-                        for i, line in enumerate(f):
-                            if i < 10:  # Show first 10 lines
-                                print(f"   {line.rstrip()}")
-                            else:
-                                break
-                
-            else:
-                print(f"⚠️  Coverage merge failed with return code {result.returncode}")
+            if result.returncode != 0:
+                lines.append(f"⚠️  Coverage merge failed with return code {result.returncode}")
                 if result.stderr:
-                    stderr_text = result.stderr.decode('utf-8', errors='replace')
-                    print(f"   stderr: {stderr_text}")
+                    lines.append(f"stderr: {result.stderr.decode('utf-8', errors='replace').strip()}")
+                return lines
+            
+            lines.append("✅ Coverage merge completed successfully")
+            
+            # Move merged coverage and report to final location
+            for name, label in (("merged_coverage.vdb", "Merged database"), ("coverage_report", "Coverage report")):
+                source = temp_merge_folder / name
+                if source.exists():
+                    destination = output_dir / name
+                    if destination.exists():
+                        shutil.rmtree(destination)
+                    shutil.move(str(source), str(destination))
+                    lines.append(f"{label}: {self._to_relative_path(destination)}")
+            
+            # Coverage summary if available (first 10 lines)
+            summary_file = output_dir / "coverage_report" / "summary.txt"
+            if summary_file.exists():
+                with open(summary_file, 'r') as f:
+                    lines += [line.rstrip() for _, line in zip(range(10), f)]
                 
         except subprocess.TimeoutExpired:
-            print(f"⚠️  Coverage merge timed out after 10 minutes")
+            lines.append("⚠️  Coverage merge timed out after 10 minutes")
         except FileNotFoundError:
-            print(f"⚠️  Coverage merge tool 'urg' not found. Make sure VCS tools are in PATH")
+            lines.append("⚠️  Coverage merge tool 'urg' not found. Make sure VCS tools are in PATH")
         except Exception as e:
-            print(f"⚠️  Error during coverage merge: {e}")
+            lines.append(f"⚠️  Error during coverage merge: {e}")
         finally:
-            # Clean up temp folder if it still exists
-            if temp_merge_folder.exists():
-                try:
-                    shutil.rmtree(temp_merge_folder)
-                except:
-                    pass
+            shutil.rmtree(temp_merge_folder, ignore_errors=True)
+        return lines
+    
+    def _absolute_path_token(self, token, anchor_dir):
+        """token with its paths made absolute, resolved as VCS would from anchor_dir
+
+        Runs executing in scratch cannot use the relative paths written for a run
+        folder next to sim/. Only +incdir+ directories and tokens naming an existing
+        file or directory are rewritten; option values such as 1ns/1ps stay as they are.
+        """
+        def resolve(path):
+            return os.path.normpath(os.path.join(str(anchor_dir), os.path.expandvars(path)))
+        
+        if token.startswith('+incdir+'):
+            return '+incdir+' + '+'.join(resolve(d) for d in token[len('+incdir+'):].split('+') if d)
+        if not token.startswith(('+', '-')) and os.path.exists(resolve(token)):
+            return resolve(token)
+        return token
+    
+    def _absolute_compile_tokens(self, compile_file, anchor_dir, seen=None):
+        """Tokens of a VCS -f file with absolute paths and nested -f files inlined"""
+        seen = seen if seen is not None else set()
+        if compile_file in seen:
+            return []
+        seen.add(compile_file)
+        
+        tokens = self._compile_file_tokens(compile_file)
+        absolute = []
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token in ('-f', '-F') and index + 1 < len(tokens):
+                index += 1
+                nested = Path(self._absolute_path_token(tokens[index], anchor_dir))
+                absolute += self._absolute_compile_tokens(nested, anchor_dir, seen)
+            else:
+                absolute.append(self._absolute_path_token(token, anchor_dir))
+            index += 1
+        return absolute
+    
+    def _write_absolute_compile_file(self):
+        """Write axi4_compile.abs.f: axi4_compile.f with absolute paths, nested -f inlined
+
+        Run folders live under this regression's work/ (or in scratch), where
+        ../axi4_compile.f and the ../../ paths inside it do not exist.
+        """
+        compile_file = self.base_dir.parent / 'axi4_compile.f'
+        try:
+            tokens = self._absolute_compile_tokens(compile_file, self.path_anchor_dir)
+            with open(self.abs_compile_file, 'w') as f:
+                f.write(f"// {compile_file.name} with absolute paths, generated for this regression\n")
+                f.write('\n'.join(tokens) + '\n')
+        except OSError as e:
+            raise RuntimeError(f"Could not prepare {compile_file.name} for the run folders: {e}")
+    
+    def _setup_scratch(self):
+        """Check the scratch root before the runs rely on it
+
+        Local runs need a scratch root that exists here; LSF runs resolve theirs
+        ($TMPDIR by default) on the execution host and fall back to the run folder
+        when it is unset.
+        """
+        if not self.use_lsf:
+            scratch_root = os.path.expandvars(self.scratch_root)
+            if '$' in scratch_root or not os.path.isdir(scratch_root):
+                print(f"⚠️  Warning: Scratch directory {self.scratch_root} does not exist, running in run folders")
+                self.scratch_root = None
+                return
+            self.scratch_root = scratch_root
+        print(f"💾 Runs execute in scratch under {self.scratch_root}; only logs, coverage and waves are copied back")
+    
+    def _scratch_exec_dir(self, test_name):
+        """Directory a local run executes in under the scratch root"""
+        return f"{self.scratch_root}/axi4_regression_{self.timestamp}/{test_name}"
+    
+    def _absolute_command_add(self, command_add):
+        """command_add with the paths it names (relative to a run folder next to sim/) made absolute"""
+        if not command_add:
+            return command_add
+        try:
+            tokens = shlex.split(command_add)
+        except ValueError:
+            return command_add
+        return ' '.join(shlex.quote(self._absolute_path_token(token, self.path_anchor_dir)) for token in tokens)
+    
+    def _wants_waves(self, command_add):
+        """True when the run dumps FSDB, for the whole regression or by its own command_add"""
+        return self.fsdb_dump or '+define+DUMP_FSDB' in (command_add or '')
+    
+    def _rerun_waves_option(self, test_obj):
+        """+fsdbfile= for a rerun with waves: straight into waves/<rerun>/, not the run folder
+
+        Run folders are cleaned for their next run, which would delete the FSDB of a
+        local run that does not use scratch.
+        """
+        if not test_obj.get('rerun_of') or not self._wants_waves(test_obj.get('command_add')):
+            return ''
+        waves_dir = self.waves_folder / test_obj['name']
+        waves_dir.mkdir(parents=True, exist_ok=True)
+        return f"+fsdbfile={waves_dir / (test_obj['name'] + '.fsdb')} "
+    
+    def _copy_back_scratch(self, exec_dir, folder_path, test_name, coverage_dir, waves):
+        """Bring back a local scratch run's artifacts and delete its scratch directory
+
+        The log and the coverage vdb go to the run folder, where the result analysis
+        and coverage collection read them; FSDB files go to waves/<test_name>/.
+        Everything else VCS wrote (csrc, simv.daidir, ...) never leaves scratch.
+        """
+        artifacts = [(exec_dir / f"{test_name}.log", folder_path / f"{test_name}.log")]
+        if coverage_dir:
+            artifacts.append((exec_dir / coverage_dir, folder_path / coverage_dir))
+        if waves:
+            artifacts += [(fsdb, self.waves_folder / test_name / fsdb.name) for fsdb in exec_dir.glob('*.fsdb')]
+        
+        copied = 0
+        try:
+            for source, target in artifacts:
+                if not source.exists():
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if source.is_dir():
+                    shutil.rmtree(target, ignore_errors=True)
+                    move_path(source, target)
+                    copied += sum(path.stat().st_size for path in target.rglob('*') if path.is_file())
+                else:
+                    move_path(source, target)
+                    copied += target.stat().st_size
+        except Exception as e:
+            print(f"⚠️  Warning: Could not copy back scratch results of {test_name}: {e}")
+        finally:
+            shutil.rmtree(exec_dir, ignore_errors=True)
+        self._count_copy_back(copied)
+    
+    def _count_copy_back(self, copied_bytes):
+        """Add one scratch run's copied-back bytes to the regression total"""
+        with self.results_lock:
+            self.copy_back['runs'] += 1
+            self.copy_back['bytes'] += copied_bytes
     
     def _run_single_test(self, test_obj, folder_path, folder_id):
         """Execute a single test in the specified folder"""
         start_time = time.time()
+        # Local mode queues every test at regression start
+        timestamps = {'queued': test_obj.get('queued_at', self.start_time or start_time), 'started': start_time}
         
         # Extract test information from test object
         test_name = test_obj['name']
         custom_seed = test_obj.get('seed')
         command_add = test_obj.get('command_add')
+        self.running_tests[test_name] = start_time  # Until _update_progress takes its result
         
         log_file = folder_path / f"{test_name}.log"
         
         # Extract base test name for UVM_TESTNAME (remove _N suffix if present)
-        base_test_name = self._extract_base_test_name(test_name)
+        base_test_name = self._uvm_test_name(test_obj)
+        # Reruns repeat a run's stimulus; their coverage would only be counted twice
+        collect_coverage = self.coverage and not test_obj.get('rerun_of')
+        verbosity = test_obj.get('verbosity', self.verbosity)
         
-        # Special handling for tests that intentionally take longer
-        # Near timeout tests need much longer timeout as they test timeout scenarios
-        test_timeout = self.timeout
-        if 'near_timeout' in test_name.lower() or 'timeout' in base_test_name.lower():
-            # These tests intentionally test timeout scenarios and may take longer
-            test_timeout = 3600  # 1 hour timeout for timeout-related tests
-            if self.verbose:
-                print(f"    📋 Extended timeout to {test_timeout}s for timeout-related test: {test_name}")
-        elif 'stress' in test_name.lower() or 'burnin' in test_name.lower():
-            # Stress tests may also take longer
-            test_timeout = 1800  # 30 minutes for stress tests
-            if self.verbose:
-                print(f"    📋 Extended timeout to {test_timeout}s for stress test: {test_name}")
+        # Timeout from the test's duration history (see _assign_timeouts)
+        if 'timeout' not in test_obj:
+            self._assign_timeouts([test_obj])
+        test_timeout = test_obj['timeout']
+        if self.verbose:
+            print(f"    ⏱️  Timeout {test_timeout}s ({test_obj['timeout_source']}): {test_name}")
         
         # Clean up VCS artifacts before running the test
         self._cleanup_vcs_artifacts(folder_path)
@@ -1145,6 +2426,10 @@ class RegressionRunner:
         run_script = folder_path / f'run_{test_name}.sh'
         log_file_rel = f'{test_name}.log'
         
+        # With a scratch root VCS runs there instead (see _copy_back_scratch)
+        exec_dir = Path(self._scratch_exec_dir(test_name)) if self.scratch_root else None
+        vcs_command_add = self._absolute_command_add(command_add)
+        
         # Create run script that runs VCS directly from within this folder
         with open(run_script, 'w') as f:
             f.write('#!/bin/bash\n')
@@ -1165,7 +2450,10 @@ class RegressionRunner:
             
             f.write('# Clean up VCS artifacts (already done in Python, but ensure completeness)\n')
             f.write('# This is a backup cleanup in case Python cleanup missed anything\n')
-            f.write('# Run VCS directly from this folder with adjusted compile file\n')
+            f.write('# Run VCS directly from this folder with the absolute-path compile file\n')
+            if exec_dir:
+                f.write('# ... or from node-local scratch; the runner copies the artifacts back\n')
+                f.write(f'mkdir -p {exec_dir} && cd {exec_dir} || exit 1\n')
             f.write(f'vcs -full64 -lca -kdb -sverilog +v2k ')
             f.write(f'-debug_access+all -ntb_opts uvm-1.2 ')
             f.write(f'+ntb_random_seed={seed_value} -override_timescale=1ps/1ps ')
@@ -1174,24 +2462,26 @@ class RegressionRunner:
                 f.write(f'+define+DUMP_FSDB ')
             
             # Add coverage flags if coverage collection is enabled
-            if self.coverage:
+            if collect_coverage:
                 coverage_dir = f"{test_name}.vdb"
                 f.write(f'-cm line+cond+fsm+tgl+branch+assert ')
                 f.write(f'-cm_seqnoconst ')
                 f.write(f'-cm_dir {coverage_dir} ')
                 f.write(f'-cm_name {test_name} ')
+                f.write(self._coverage_scope_option(command_add))
                 if self.verbose:
                     print(f"    Enabling coverage collection: {coverage_dir}")
             
-            f.write(f'+define+UVM_VERDI_COMPWAVE -f ../axi4_compile.f ')
+            f.write(f'+define+UVM_VERDI_COMPWAVE -f {self.abs_compile_file} ')
             f.write(f'-debug_access+all -R +UVM_TESTNAME={base_test_name} ')
-            f.write(f'+UVM_VERBOSITY=MEDIUM +plusarg_ignore ')
+            f.write(f'+UVM_VERBOSITY={verbosity} +plusarg_ignore ')
+            f.write(self._rerun_waves_option(test_obj))
             
             # Add custom command if provided
             if command_add:
-                f.write(f'{command_add} ')
+                f.write(f'{vcs_command_add} ')
                 if self.verbose:
-                    print(f"    Adding custom command: {command_add}")
+                    print(f"    Adding custom command: {vcs_command_add}")
             
             f.write(f'-l {log_file_rel}\n')
         
@@ -1199,23 +2489,38 @@ class RegressionRunner:
         os.chmod(run_script, 0o755)
 
         try:
-            # Change to the test folder and stay there for VCS execution
-            original_cwd = os.getcwd()
-            os.chdir(folder_path)
-            
-            # Run the test with timeout and early hang detection
-            script_name = f'./run_{test_name}.sh'
+            # Run the test in its folder with timeout and early hang detection. The
+            # folder is given to Popen, not os.chdir()ed into: the working directory
+            # belongs to the whole process, and parallel runs are threads of it.
+            timestamps['launched'] = time.time()
             process = subprocess.Popen(
-                [script_name],
+                [str(run_script)],
+                cwd=str(folder_path),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 universal_newlines=True,
                 preexec_fn=os.setsid  # Create new process group
             )
             
+            # Read VCS output as it is produced (instead of communicate()) so the
+            # compile/sim phase boundaries can be timestamped when they happen
+            stdout_lines = []
+            stdout_reader = threading.Thread(
+                target=self._read_vcs_output,
+                args=(process.stdout, stdout_lines, timestamps),
+                daemon=True
+            )
+            stdout_reader.start()
+            
             # Wait for completion with timeout and early hang detection
             try:
-                stdout, _ = process.communicate(timeout=test_timeout)
+                resources = self._wait_with_rusage(process, stdout_reader, test_timeout)
+                if exec_dir:
+                    self._copy_back_scratch(exec_dir, folder_path, test_name,
+                                            coverage_dir if collect_coverage else None,
+                                            self._wants_waves(command_add))
+                stdout = ''.join(stdout_lines)
+                timestamps.setdefault('sim_end', time.time())
                 duration = time.time() - start_time
                 
                 # Wait a moment for log file to be written
@@ -1224,7 +2529,6 @@ class RegressionRunner:
                 # Check multiple possible log file locations
                 log_locations = [
                     log_file,  # Expected location
-                    Path.cwd() / f"{test_name}.log",  # Current directory
                     self.base_dir / f"{test_name}.log",  # synopsys_sim directory
                 ]
                 
@@ -1249,38 +2553,36 @@ class RegressionRunner:
                 
                 # Check if test passed or failed  
                 status, error_msg, uvm_errors, uvm_fatals = self._analyze_test_result(log_file, stdout)
-                
+                if status in ('FAIL', 'ERROR'):
+                    build_error = self._compile_failure(log_file, stdout or None)
+                    if build_error:
+                        status, error_msg = 'BUILD_ERROR', f"Compile error: {build_error}"
+                timestamps['analyzed'] = time.time()
+
                 # Special handling for TIMEOUT status from analysis
                 if status == 'TIMEOUT':
                     # Kill the process if it's still running
                     if process.poll() is None:
                         os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                        process.communicate()
+                        process.wait()
                 
-                # Copy log to appropriate logs subfolder based on test status
-                log_copied = False
+                # Move log to appropriate logs subfolder based on test status; the
+                # result records where it went, so nothing looks for it again
                 target_folder = self.pass_logs_folder if status == 'PASS' else self.no_pass_logs_folder
-                
-                if log_file.exists():
-                    shutil.copy2(log_file, target_folder / f"{test_name}.log")
-                    log_copied = True
-                elif (folder_path / f"{test_name}.log").exists():
-                    # Try alternative log location
-                    shutil.copy2(folder_path / f"{test_name}.log", target_folder / f"{test_name}.log")
-                    log_copied = True
-                
-                if not log_copied:
+                log_file = self._archive_log(log_file, target_folder / f"{test_name}.log")
+                if log_file is None:
                     print(f"⚠️  Warning: Could not find log file for {test_name} after test completion")
                 
-                # Copy coverage files if coverage collection is enabled
-                if self.coverage:
+                # Move coverage files if coverage collection is enabled
+                if collect_coverage:
                     self._copy_coverage_files(test_name, folder_path, folder_id)
+                timestamps['archived'] = time.time()
                 
                 return TestResult(
                     name=test_name,
                     status=status,
                     duration=duration,
-                    log_file=str(log_file),
+                    log_file=str(log_file) if log_file else '',
                     error_msg=error_msg,
                     folder_id=folder_id,
                     uvm_errors=uvm_errors,
@@ -1289,13 +2591,25 @@ class RegressionRunner:
                     command_add=command_add,
                     base_name=test_obj.get('base_name', test_name),
                     run_number=test_obj.get('run_number', 1),
-                    test_group=test_obj.get('test_group')
+                    test_group=test_obj.get('test_group'),
+                    host=self.hostname,
+                    timestamps=timestamps,
+                    **resources
                 )
                     
             except subprocess.TimeoutExpired:
                 # Kill the entire process group
                 os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                process.communicate()  # Clean up
+                try:
+                    resources = self._wait_with_rusage(process, stdout_reader, 5)
+                except subprocess.TimeoutExpired:
+                    process.wait()  # Output still held open by a stray descendant
+                    resources = {}
+                timestamps['sim_end'] = time.time()
+                if exec_dir:
+                    self._copy_back_scratch(exec_dir, folder_path, test_name,
+                                            coverage_dir if collect_coverage else None,
+                                            self._wants_waves(command_add))
                 
                 duration = time.time() - start_time
                 
@@ -1304,7 +2618,7 @@ class RegressionRunner:
                 if log_file.exists():
                     try:
                         # Check log file for enhanced mode timeout patterns
-                        with open(log_file, 'r') as f:
+                        with _open_log(log_file) as f:
                             log_tail = f.read()[-10000:]  # Read last 10KB
                             if 'ultrasim' in log_tail.lower() or 'enhanced' in log_tail.lower():
                                 timeout_msg = f"Enhanced mode timeout detected after {test_timeout} seconds"
@@ -1313,31 +2627,27 @@ class RegressionRunner:
                     except Exception:
                         pass  # Use default timeout message
                 
-                # Copy log to no_pass_logs folder for timeout cases
-                log_copied = False
-                if log_file.exists():
-                    shutil.copy2(log_file, self.no_pass_logs_folder / f"{test_name}.log")
-                    log_copied = True
-                elif (folder_path / f"{test_name}.log").exists():
-                    # Try alternative log location
-                    shutil.copy2(folder_path / f"{test_name}.log", self.no_pass_logs_folder / f"{test_name}.log")
-                    log_copied = True
-                
-                if not log_copied:
+                # Move log to no_pass_logs folder for timeout cases
+                log_file = self._archive_log(log_file, self.no_pass_logs_folder / f"{test_name}.log")
+                if log_file is None:
                     print(f"⚠️  Warning: Could not find log file for {test_name} after timeout")
+                timestamps['analyzed'] = timestamps['archived'] = time.time()
                 
                 return TestResult(
                     name=test_name,
                     status='TIMEOUT',
                     duration=duration,
-                    log_file=str(log_file),
+                    log_file=str(log_file) if log_file else '',
                     error_msg=timeout_msg,
                     folder_id=folder_id,
                     seed=seed_value,
                     command_add=command_add,
                     base_name=test_obj.get('base_name', test_name),
                     run_number=test_obj.get('run_number', 1),
-                    test_group=test_obj.get('test_group')
+                    test_group=test_obj.get('test_group'),
+                    host=self.hostname,
+                    timestamps=timestamps,
+                    **resources
                 )
                 
         except Exception as e:
@@ -1353,11 +2663,62 @@ class RegressionRunner:
                 command_add=command_add,
                 base_name=test_obj.get('base_name', test_name),
                 run_number=test_obj.get('run_number', 1),
-                test_group=test_obj.get('test_group')
+                test_group=test_obj.get('test_group'),
+                host=self.hostname,
+                timestamps=timestamps
             )
-        finally:
-            # Restore original directory
-            os.chdir(original_cwd)
+    
+    def _wait_with_rusage(self, process, stdout_reader, timeout):
+        """Wait for a run and return its resource usage as TestResult keyword arguments
+
+        Reaps the run script with os.wait4() rather than Popen.wait(): wait4 returns
+        the rusage of that one process tree (the script plus the vcs and simv it waited
+        for), which RUSAGE_CHILDREN cannot give per test while several tests run in
+        parallel. Completion is detected by the output reader reaching EOF, as
+        communicate() did. Raises subprocess.TimeoutExpired if that takes longer than
+        timeout.
+        """
+        stdout_reader.join(timeout=timeout)
+        if stdout_reader.is_alive():
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        try:
+            _, wait_status, rusage = os.wait4(process.pid, 0)
+        except ChildProcessError:
+            process.wait()  # Already reaped elsewhere; no usage available
+            return {}
+        process.returncode = os.waitstatus_to_exitcode(wait_status)
+        return {
+            'peak_mem_mb': round(rusage.ru_maxrss / 1024.0, 1),  # ru_maxrss is in KB on Linux
+            'cpu_time_s': round(rusage.ru_utime + rusage.ru_stime, 2),
+            'io_read_mb': round(rusage.ru_inblock * 512 / 1048576.0, 1),  # 512-byte blocks
+            'io_write_mb': round(rusage.ru_oublock * 512 / 1048576.0, 1),
+        }
+    
+    # VCS output lines that mark phase boundaries of a `vcs ... -R` run:
+    #   "CPU time: 41.2 seconds to compile + 3.1 seconds to elab + 9.8 seconds to link"
+    #       printed once the build is complete
+    #   "Chronologic VCS simulator copyright 1991-2020"
+    #       banner printed by simv as it starts
+    #   "           V C S   S i m u l a t i o n   R e p o r t"
+    #       printed by simv when the simulation ends
+    VCS_COMPILE_DONE_RE = re.compile(r'CPU time:\s*([\d.]+) seconds to compile(?:\s*\+\s*([\d.]+) seconds to elab)?(?:\s*\+\s*([\d.]+) seconds to link)?')
+    VCS_SIM_START_RE = re.compile(r'Chronologic VCS simulator copyright')
+    VCS_SIM_END_RE = re.compile(r'V C S\s+S i m u l a t i o n\s+R e p o r t|\$finish called')
+    
+    def _read_vcs_output(self, stream, lines, timestamps):
+        """Collect VCS output and stamp compile_done / sim_start / sim_end as they appear"""
+        for line in stream:
+            lines.append(line)
+            if 'compile_done' not in timestamps and self.VCS_COMPILE_DONE_RE.search(line):
+                timestamps['compile_done'] = time.time()
+            elif 'sim_start' not in timestamps and self.VCS_SIM_START_RE.search(line):
+                timestamps['sim_start'] = time.time()
+                timestamps.setdefault('compile_done', timestamps['sim_start'])
+            elif 'sim_end' not in timestamps and self.VCS_SIM_END_RE.search(line):
+                timestamps['sim_end'] = time.time()
+        stream.close()
+        if 'compile_done' in timestamps:
+            timestamps.setdefault('sim_start', timestamps['compile_done'])
     
     def _analyze_test_result(self, log_file, stdout):
         """Analyze test output to determine pass/fail status and extract error message
@@ -1368,8 +2729,8 @@ class RegressionRunner:
         try:
             # Read the log file if it exists
             log_content = ""
-            if log_file.exists():
-                with open(log_file, 'r') as f:
+            if _find_log(log_file):
+                with _open_log(log_file) as f:
                     log_content = f.read()
             else:
                 # If log file doesn't exist, try to determine status from stdout only
@@ -1588,15 +2949,108 @@ class RegressionRunner:
         except Exception as e:
             return 'ERROR', f"Could not analyze results: {str(e)}", 0, 0
     
+    def _compile_signature(self, command_add):
+        """Key of the build a run compiles: the compile options in its command_add
+
+        Runs with the same signature compile the same sources with the same options
+        (--fsdb-dump and --cov apply to every run alike), so a compile error in one
+        of them is a compile error in all of them. Runtime plusargs, the seed and
+        +UVM_TESTNAME do not take part.
+        """
+        try:
+            tokens = shlex.split(command_add or '')
+        except ValueError:
+            tokens = (command_add or '').split()
+        return tuple(token for token in tokens
+                     if not token.startswith('+') or token.startswith(COMPILE_PLUSARG_PREFIXES))
+
+    def _compile_failure(self, log_file, output=None):
+        """First VCS compile error of a run that never started simulating, else None
+
+        output is text already read from the run (stdout or the log); the log file
+        is read when it is not given. Once simv prints its banner the build worked,
+        whatever fails afterwards, and errors in TRANSIENT_BUILD_ERRORS do not count.
+        """
+        if output is None:
+            try:
+                with _open_log(log_file) as f:
+                    output = f.read()
+            except OSError:
+                return None
+        if self.VCS_SIM_START_RE.search(output):
+            return None
+        for line in output.splitlines():
+            if 'Error-[' in line:
+                line = line.strip()
+                if line.startswith(TRANSIENT_BUILD_ERRORS):
+                    return None
+                return line[:200]
+        return None
+
+    def _record_build_failure(self, test_result):
+        """Remember the first compile failure of a compile signature and its log"""
+        signature = self._compile_signature(test_result.command_add)
+        if signature in self.broken_builds:
+            return
+        self.broken_builds[signature] = {
+            'test': test_result.name,
+            'log': self.no_pass_logs_folder / f"{test_result.name}.log",
+            'error': test_result.error_msg
+        }
+        options = ' '.join(signature) or 'no extra compile options'
+        print(f"🧱 Compile failed in {test_result.name} ({options}): queued runs with the same "
+              f"compile options are reported BUILD_ERROR without running")
+
+    def _build_error_result(self, test_obj, folder_id=None):
+        """BUILD_ERROR result for a queued run whose compile signature already failed, else None
+
+        The run is not started; its evidence is the log of the run whose compile
+        failed first (linked into no_pass_logs under this run's name).
+        """
+        broken = self.broken_builds.get(self._compile_signature(test_obj.get('command_add')))
+        if broken is None:
+            return None
+        self.build_skipped_tests += 1
+        test_name = test_obj['name']
+        return TestResult(
+            name=test_name,
+            status='BUILD_ERROR',
+            duration=0.0,
+            log_file=str(broken['log']),
+            error_msg=f"Not run, build failed in {broken['test']}: {broken['error']}",
+            folder_id=folder_id,
+            seed=test_obj.get('seed'),
+            command_add=test_obj.get('command_add'),
+            base_name=test_obj.get('base_name', test_name),
+            run_number=test_obj.get('run_number', 1),
+            test_group=test_obj.get('test_group')
+        )
+
     def _update_progress(self, test_result):
         """Update progress statistics and display"""
         with self.results_lock:
+            self.running_tests.pop(test_result.name, None)
+            if test_result.name in self._rerun_names:
+                self._record_rerun(test_result)
+                return
+            test_result.verbosity = test_result.verbosity or self.verbosity
             self.results.append(test_result)
             self.completed_tests += 1
             
-            # Ensure log is copied to results folder
+            # Ensure log is archived in the results folder
             self._ensure_log_copied(test_result)
+            if not test_result.cached:
+                test_result.timestamps.setdefault('archived', time.time())
+                self._store_cached_result(test_result)
             
+            # Stream the record before anything else can fail or be interrupted. With
+            # --compress-logs it already names the compressed log it is queued for.
+            self._queue_log_compression(test_result)
+            self._stream_result(test_result)
+
+            if test_result.status == 'BUILD_ERROR':
+                self._record_build_failure(test_result)
+
             if test_result.status == 'PASS':
                 self.passed_tests += 1
             else:
@@ -1610,8 +3064,8 @@ class RegressionRunner:
             if self.completed_tests > 0:
                 avg_time_per_test = elapsed / self.completed_tests
                 remaining_tests = self.total_tests - self.completed_tests
-                if self.use_lsf:
-                    eta_seconds = remaining_tests * avg_time_per_test  # LSF manages parallelism
+                if self.use_lsf or self.serve_address:
+                    eta_seconds = remaining_tests * avg_time_per_test  # LSF/workers manage parallelism
                 else:
                     eta_seconds = remaining_tests * avg_time_per_test / self.max_parallel
                 eta = str(timedelta(seconds=int(eta_seconds)))
@@ -1625,6 +3079,8 @@ class RegressionRunner:
                 status_icon = "❌"
             elif test_result.status == 'TIMEOUT':
                 status_icon = "⏰"
+            elif test_result.status == 'BUILD_ERROR':
+                status_icon = "🧱"
             else:
                 status_icon = "💥"
             
@@ -1634,67 +3090,301 @@ class RegressionRunner:
                 remaining = self.total_tests - self.completed_tests
                 lsf_status = f" [Remaining:{remaining} P:{self.pending_jobs} R:{self.running_jobs}]"
             
+            cached_tag = " ♻️ cached" if test_result.cached else ""
             print(f"{status_icon} [{self.completed_tests:3d}/{self.total_tests}] "
                   f"{test_result.name:50s} "
                   f"({test_result.duration:6.1f}s) "
-                  f"Progress: {progress:5.1f}% ETA: {eta}{lsf_status}")
+                  f"Progress: {progress:5.1f}% ETA: {eta}{lsf_status}{cached_tag}")
             
             if test_result.status != 'PASS' and test_result.error_msg:
                 print(f"    └─ Error: {test_result.error_msg}")
     
+    def _record_rerun(self, test_result):
+        """Archive a rerun of a failure and link it with the failed run it repeats
+
+        Called by _update_progress, under results_lock. The rerun is archived, cached and
+        streamed like any run, but adds nothing to the pass/fail counts. It does count
+        as completed while its batch runs, since the batch runners wait for that.
+        """
+        test_result.rerun_of = self._rerun_names[test_result.name]
+        test_result.verbosity = test_result.verbosity or self.rerun_verbosity
+        self.rerun_results.append(test_result)
+        self.completed_tests += 1
+        for original in self.results:
+            if original.name == test_result.rerun_of:
+                original.rerun = test_result.name
+        
+        self._ensure_log_copied(test_result)
+        if not test_result.cached:
+            test_result.timestamps.setdefault('archived', time.time())
+            self._store_cached_result(test_result)
+        self._queue_log_compression(test_result)
+        self._stream_result(test_result)
+        
+        log_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
+        cached_tag = " ♻️ cached" if test_result.cached else ""
+        print(f"🔍 Rerun of {test_result.rerun_of:42s} at UVM_{test_result.verbosity:6s} "
+              f"{test_result.status:8s} ({test_result.duration:6.1f}s){cached_tag}")
+        print(f"    └─ Log: {self._to_relative_path(log_folder / f'{test_result.name}.log')}")
+    
+    def _queue_log_compression(self, test_result):
+        """Hand the archived log of a finished run to the background compressors
+        
+        Called once the log is archived and cached, and before the run is streamed:
+        its log_file is set to the compressed log right away, so results.jsonl names
+        the file that stays. Compile-error logs stay plain: the runs skipped for the
+        same broken build are hardlinks to them.
+        """
+        if not self.log_codec or test_result.status == 'BUILD_ERROR':
+            return
+        log_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
+        archived_log = log_folder / f"{test_result.name}.log"
+        if not archived_log.exists():
+            return
+        if self._log_compressor is None:
+            self._log_compressor = ThreadPoolExecutor(max_workers=LOG_COMPRESS_WORKERS,
+                                                      thread_name_prefix='log_compress')
+        test_result.log_file = str(archived_log) + LOG_COMPRESSION_SUFFIXES[self.log_codec]
+        self._log_compressor.submit(self._compress_archived_log, test_result, archived_log)
+        
+    def _compress_archived_log(self, test_result, archived_log):
+        """Compress one archived log (runs in the background pool) and count it
+        
+        If compression fails the log stays plain, and a corrected record follows the
+        streamed one in results.jsonl (the last record of a run wins).
+        """
+        start = time.time()
+        try:
+            size, compressed_size = _compress_log(archived_log, self.log_codec)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not compress {archived_log.name}: {e}")
+            with self.results_lock:
+                test_result.log_file = str(archived_log)
+                self._stream_result(test_result)
+            return
+        with self._log_compression_lock:
+            self.log_compression['logs'] += 1
+            self.log_compression['bytes'] += size
+            self.log_compression['compressed_bytes'] += compressed_size
+            self.log_compression['seconds'] += time.time() - start
+    
+    def _finish_log_compression(self):
+        """Wait for the background compressors, so every report names the final log"""
+        if self._log_compressor is None:
+            return
+        self._log_compressor.shutdown(wait=True)
+        self._log_compressor = None
+        if self.log_compression['logs']:
+            print(f"🗜️  {self._log_storage_summary()}")
+    
+    def _log_storage_summary(self):
+        """Disk used by logs/ and, with --compress-logs, how much compression saved and how fast"""
+        used = sum(path.stat().st_size for path in self.logs_folder.rglob('*') if path.is_file())
+        line = f"{used / 1048576.0:.1f} MB in {self.logs_folder.name}/"
+        stats = self.log_compression
+        if stats['logs']:
+            ratio = stats['bytes'] / stats['compressed_bytes'] if stats['compressed_bytes'] else 0.0
+            throughput = stats['bytes'] / 1048576.0 / stats['seconds'] if stats['seconds'] else 0.0
+            line += (f", {stats['logs']} logs compressed with {self.log_codec}: "
+                     f"{stats['bytes'] / 1048576.0:.1f} MB -> {stats['compressed_bytes'] / 1048576.0:.1f} MB "
+                     f"({ratio:.1f}x, {throughput:.0f} MB/s per thread)")
+        return line
+    
+    def _archived_log(self, result):
+        """Path of a run's log in pass_logs/no_pass_logs, compressed or not"""
+        log_folder = self.pass_logs_folder if result.status == 'PASS' else self.no_pass_logs_folder
+        expected = log_folder / f"{result.name}.log"
+        return _find_log(expected) or expected
+    
+    def _stream_result(self, test_result):
+        """Append one JSON line per completed run to results.jsonl and flush it
+
+        Dashboards read this instead of re-parsing the text reports, and because
+        every line is flushed as it is written, a runner that dies mid-regression
+        still leaves one complete record per finished run.
+        """
+        if self._results_stream is None:
+            return
+        try:
+            self._results_stream.write(json.dumps(test_result.to_record()) + "\n")
+            self._results_stream.flush()
+        except Exception as e:
+            print(f"⚠️  Warning: Could not write result record for {test_result.name}: {e}")
+    
+    def _start_metrics_server(self):
+        """Serve _metrics_snapshot() over HTTP (--metrics) from daemon threads until the regression ends"""
+        try:
+            self._metrics_server = ThreadingHTTPServer(self.metrics_address, _MetricsHandler)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not serve metrics on port {self.metrics_address[1]}: {e}")
+            return
+        self._metrics_server.daemon_threads = True
+        self._metrics_server.runner = self
+        threading.Thread(target=self._metrics_server.serve_forever, daemon=True).start()
+        url = f"http://{self.metrics_address[0] or socket.getfqdn()}:{self._metrics_server.server_address[1]}"
+        print(f"📈 Metrics: {url}/metrics (Prometheus), {url}/metrics.json")
+    
+    def _stop_metrics_server(self):
+        """Stop answering scrapes; the final numbers are in the reports and results.jsonl"""
+        if self._metrics_server is None:
+            return
+        self._metrics_server.shutdown()
+        self._metrics_server.server_close()
+        self._metrics_server = None
+    
+    def _metrics_snapshot(self):
+        """Live state of the regression for --metrics, as served by /metrics.json
+
+        Counts are of the runs of the list: reruns of failures are counted apart, and
+        cached runs count as completed without phase timings. Phase histograms cover
+        completed runs (see TIMING_PHASES) with METRICS_PHASE_BUCKETS_S bounds.
+        """
+        with self.results_lock:
+            results = list(self.results)
+            reruns = len(self.rerun_results)
+            running_names = list(self.running_tests)
+        if self.use_lsf:
+            live = [(job['test_name'], job['status']) for job in list(self.lsf_jobs.values())
+                    if not job.get('completed')]
+            running_names = [name for name, status in live if status == 'RUN']
+            waiting_names = [name for name, status in live if status == 'PEND']
+        elif self.serve_address:
+            with self._worker_lock:
+                running_names = list(self._worker_leases)
+                waiting_names = [test_obj['name'] for test_obj in self._worker_queue]
+        else:
+            waiting_names = None
+        # Reruns start once every run of the list is done; they get their own gauges
+        running = sum(1 for name in running_names if name not in self._rerun_names)
+        reruns_running = len(running_names) - running
+        completed = len(results)
+        pending = max(0, self.total_tests - completed - running)
+        if waiting_names is None:
+            queue_depth = pending  # Local runs wait for a free run folder
+        else:
+            queue_depth = sum(1 for name in waiting_names if name not in self._rerun_names)
+        
+        verdicts = dict.fromkeys(('PASS', 'FAIL', 'TIMEOUT', 'ERROR', 'BUILD_ERROR'), 0)
+        phases = {phase: {'buckets': dict.fromkeys(METRICS_PHASE_BUCKETS_S, 0), 'sum': 0.0, 'count': 0}
+                  for phase in TIMING_PHASES}
+        for result in results:
+            verdicts[result.status] = verdicts.get(result.status, 0) + 1
+            for phase, seconds in result.timing.items():
+                histogram = phases[phase]
+                histogram['sum'] += seconds
+                histogram['count'] += 1
+                for bound in histogram['buckets']:
+                    if seconds <= bound:
+                        histogram['buckets'][bound] += 1
+        passed, timed_out = verdicts['PASS'], verdicts['TIMEOUT']
+        
+        def share(count):
+            """Fraction of the completed runs"""
+            return count / completed if completed else 0.0
+        
+        return {
+            'regression': self.results_folder.name,
+            'mode': 'LSF' if self.use_lsf else 'Workers' if self.serve_address else 'Local',
+            'elapsed_s': time.time() - self.start_time if self.start_time else 0.0,
+            'runs': {'total': self.total_tests, 'completed': completed, 'running': running, 'pending': pending,
+                     'cached': self.cached_tests, 'reruns_running': reruns_running, 'reruns_completed': reruns},
+            'queue_depth': queue_depth,
+            'verdicts': verdicts,
+            'rates': {'pass': share(passed), 'fail': share(completed - passed - timed_out), 'timeout': share(timed_out)},
+            'phase_seconds': phases,
+            'rss_bytes': _process_rss_bytes(),
+            'lsf_poll': {source: dict(stats) for source, stats in list(self.lsf_poll.items())}
+        }
+    
+    def _save_results_csv(self, csv_file: Path):
+        """Save all results as one compact CSV table (one row per run, RESULT_FIELDS columns)"""
+        try:
+            with open(csv_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+                writer.writeheader()
+                for result in self.results + self.rerun_results:
+                    writer.writerow(result.to_record())
+        except Exception as e:
+            print(f"⚠️  Warning: Could not write results CSV: {e}")
+    
+    def _archive_log(self, log_path, target_log):
+        """Place a run's log at target_log in pass_logs/no_pass_logs; returns target_log, or None if there is no log
+
+        Logs of this regression's runs are moved (a rename, the run folder log is not
+        needed again). Logs that must stay where they are, a cached run's log in the
+        result cache or a broken build's log already in no_pass_logs, are hardlinked.
+        """
+        log_path = Path(log_path)
+        if not log_path.exists():
+            return None
+        if log_path == target_log:
+            return target_log
+        if log_path.parent == self.cache_dir or self.logs_folder in log_path.parents:
+            link_path(log_path, target_log)
+        else:
+            move_path(log_path, target_log)
+        return target_log
+    
     def _ensure_log_copied(self, test_result):
-        """Ensure test log is copied to appropriate logs subfolder based on test status"""
+        """Ensure test log is in appropriate logs subfolder based on test status, and recorded as the result's log"""
         try:
             # Determine target folder based on test status
             target_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
             target_log = target_folder / f"{test_result.name}.log"
             
-            if target_log.exists():
-                return  # Already copied
+            archived_log = _find_log(target_log)
+            if archived_log:
+                test_result.log_file = str(archived_log)
+                return  # Already archived (and maybe compressed since)
             
             # Try to find the log file in various locations
             possible_locations = [
                 # Original log path from test result
                 Path(test_result.log_file) if test_result.log_file else None,
-                # In the run folder
-                self.base_dir.parent / f"run_folder_{test_result.folder_id:02d}" / f"{test_result.name}.log",
+                # In the run folder (cached results have none)
+                self.work_folder / f"run_folder_{test_result.folder_id:02d}" / f"{test_result.name}.log"
+                if test_result.folder_id is not None else None,
                 # In synopsys_sim directory  
                 self.base_dir / f"{test_result.name}.log"
             ]
             
             for log_path in possible_locations:
-                if log_path and log_path.exists():
-                    shutil.copy2(log_path, target_log)
+                if log_path and self._archive_log(log_path, target_log):
+                    test_result.log_file = str(target_log)
                     status_folder = "pass_logs" if test_result.status == 'PASS' else "no_pass_logs"
                     if self.verbose:
-                        print(f"📋 Copied log to {status_folder}: {test_result.name}.log")
+                        print(f"📋 Archived log to {status_folder}: {test_result.name}.log")
                     return
             
             print(f"⚠️  Warning: Could not find log file for {test_result.name}")
         except Exception as e:
-            print(f"⚠️  Warning: Error copying log for {test_result.name}: {e}")
+            print(f"⚠️  Warning: Error archiving log for {test_result.name}: {e}")
     
     def _copy_all_logs_to_logs_folder(self):
-        """Ensure all test logs are in appropriate pass_logs or no_pass_logs folders"""
+        """Ensure all test logs are in appropriate pass_logs or no_pass_logs folders
+
+        Logs are archived as each run completes and the result records the path, so
+        this only checks that each recorded log is where its status puts it.
+        """
         print(f"\n📋 Verifying log organization...")
         verified_count = 0
         missing_count = 0
         
-        for test_result in self.results:
+        for test_result in self.results + self.rerun_results:
             # Determine target folder based on test status
             target_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
-            target_log = target_folder / f"{test_result.name}.log"
+            archived_log = Path(test_result.log_file) if test_result.log_file else None
             
             # Check if already properly organized
-            if target_log.exists():
+            if archived_log and archived_log.parent == target_folder and archived_log.is_file():
                 verified_count += 1
                 continue
             
-            # If not found, this indicates an issue with earlier copying
+            # If not found, this indicates an issue with earlier archiving
             missing_count += 1
             print(f"⚠️  Warning: Log not found in expected location for {test_result.name}")
         
-        status_msg = f"✅ Verified {verified_count}/{len(self.results)} logs are properly organized"
+        status_msg = f"✅ Verified {verified_count}/{len(self.results) + len(self.rerun_results)} logs are properly organized"
         if missing_count > 0:
             status_msg += f" (⚠️  {missing_count} logs missing)"
         print(status_msg)
@@ -1714,6 +3404,7 @@ class RegressionRunner:
         # Generate pass and no pass lists with actual execution parameters
         self._generate_pass_list(self.results)
         self._generate_no_pass_list(self.results)
+        self._generate_triage_rerun_list(self.results)
         
         total_time = time.time() - self.start_time
         
@@ -1725,9 +3416,37 @@ class RegressionRunner:
         print(f"   Total Tests:     {self.total_tests}")
         print(f"   Passed:          {self.passed_tests} ({(self.passed_tests/self.total_tests)*100:.1f}%)")
         print(f"   Failed:          {self.failed_tests} ({(self.failed_tests/self.total_tests)*100:.1f}%)")
+        if self.cached_tests:
+            print(f"   Cached:          {self.cached_tests} (verdicts reused, not simulated; --no-cache to rerun)")
+        if self.copy_back['runs']:
+            print(f"   Scratch:         {self.copy_back['runs']} runs in {self.scratch_root}, "
+                  f"{self.copy_back['bytes'] / 1048576.0:.1f} MB copied back (logs, coverage, waves)")
+        print(f"   Logs:            {self._log_storage_summary()}")
+        if self.serve_address:
+            print(f"   Workers:         {self._worker_summary()}")
+        if self.broken_builds:
+            print(f"   Build Errors:    {len(self.broken_builds)} compile option set(s) failed to compile, "
+                  f"{self.build_skipped_tests} queued runs not run")
+        if self.smoke_gate:
+            print(f"   {'🚦' if self.smoke_gate['released'] else '🛑'} {self._smoke_gate_line()}")
+        if self.rerun_results:
+            print(f"   Reruns:          {self._rerun_summary()}")
         print(f"   Total Time:      {str(timedelta(seconds=int(total_time)))}")
         print(f"   Average per Test: {total_time/self.total_tests:.1f}s")
         
+        phase_lines = self._phase_timing_summary()
+        if phase_lines:
+            print(f"\n⏱️  Time per phase:")
+            for line in phase_lines:
+                print(f"   {line}")
+        
+        resource_lines = self._resource_usage_summary()
+        if resource_lines:
+            print(f"\n🧮 Largest tests by peak memory (all in regression_summary.txt):")
+            for line in resource_lines[:6]:
+                print(f"   {line}")
+        self._update_history()
+        
         # Group results by status
         failed_results = [r for r in self.results if r.status != 'PASS']
         
@@ -1737,14 +3456,17 @@ class RegressionRunner:
             
             
             for result in failed_results:
-                print(f"   {result.status:8s} {result.name:50s} ({result.duration:6.1f}s)")
+                print(f"   {result.status:8s} {result.name:50s} ({result.duration:6.1f}s){' [cached]' if result.cached else ''}")
                 if result.error_msg:
                     # Truncate long error messages
                     error_short = result.error_msg[:100] + "..." if len(result.error_msg) > 100 else result.error_msg
                     print(f"            └─ {error_short}")
-                print(f"            └─ Log: {self._to_relative_path(self.no_pass_logs_folder / f'{result.name}.log')}")
+                print(f"            └─ Log: {self._to_relative_path(self._archived_log(result))}")
+                if result.rerun:
+                    print(f"            └─ Rerun: {self._rerun_line(result)}")
             
             print(f"\n📝 Failed test list saved to: {self._to_relative_path(self.results_folder / 'no_pass_list')}")
+            print(f"📝 Triage rerun list (one run per failure signature): {self._to_relative_path(self.results_folder / 'triage_rerun_list')}")
         
         # Save detailed results to results folder
         results_file = self.results_folder / f"regression_results_{self.timestamp}.txt"
@@ -1754,7 +3476,14 @@ class RegressionRunner:
         regression_log = self.results_folder / "regression_summary.txt"
         self._save_regression_summary(regression_log)
         
+        # Machine-readable table of every run
+        self._save_results_csv(self.results_csv_file)
+        if self._results_stream is not None:
+            self._results_stream.close()
+            self._results_stream = None
+        
         print(f"\n📄 Detailed results saved to: {self._to_relative_path(results_file)}")
+        print(f"📄 Machine-readable results: {self._to_relative_path(self.results_jsonl_file)}, {self._to_relative_path(self.results_csv_file)}")
         print(f"📁 All results in folder: {self._to_relative_path(self.results_folder)}")
         print(f"📋 Test logs organized in:")
         print(f"   ✅ Pass logs: {self._to_relative_path(self.pass_logs_folder)}")
@@ -1768,40 +3497,523 @@ class RegressionRunner:
             print(f"\n🎉 REGRESSION PASSED: All {self.passed_tests} tests passed!")
             return 0
     
-    def _save_detailed_results(self, results_file: Path):
-        """Save detailed test results to file"""
-        with open(results_file, 'w') as f:
-            f.write(f"AXI4 Regression Results\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"="*80 + "\n\n")
-            
-            f.write(f"Summary:\n")
-            f.write(f"  Total Tests: {self.total_tests}\n")
-            f.write(f"  Passed:      {self.passed_tests}\n")
-            f.write(f"  Failed:      {self.failed_tests}\n")
-            f.write(f"  Pass Rate:   {(self.passed_tests/self.total_tests)*100:.1f}%\n\n")
-            
-            # Group results by status: TIMEOUT and FAIL first, PASS second
-            timeout_results = [r for r in self.results if r.status == 'TIMEOUT']
-            fail_results = [r for r in self.results if r.status in ['FAIL', 'ERROR']]
-            pass_results = [r for r in self.results if r.status == 'PASS']
-            
-            # REGION 1: FAILED AND TIMEOUT TESTS
-            if timeout_results or fail_results:
-                f.write(f"=" * 80 + "\n")
-                f.write(f"REGION 1: FAILED AND TIMEOUT TESTS\n")
-                f.write(f"=" * 80 + "\n\n")
+    def _history_key(self, test_name, command_add):
+        """History is kept per UVM test and command_add: a 10x10 build is not a 4x4 one"""
+        base_test_name = self._extract_base_test_name(test_name)
+        return f"{base_test_name} {command_add}" if command_add else base_test_name
+    
+    @contextmanager
+    def _shared_state_lock(self):
+        """Hold .regression.lock while touching state regressions of this checkout share"""
+        with open(self.shared_lock_file, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+    
+    def _load_test_registry(self):
+        """Names of the components registered in test/*.sv, or None without a test/ folder
+
+        Per-file registrations are cached in .test_registry_cache.json by mtime and size,
+        so only edited test files are read again.
+        """
+        test_dir = self.base_dir.parent.parent / 'test'
+        if not test_dir.is_dir():
+            return None
+        try:
+            with open(self.test_registry_cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        registry = set()
+        files = {}
+        for test_file in sorted(test_dir.glob('*.sv')):
+            stat = test_file.stat()
+            entry = cache.get(test_file.name)
+            if not entry or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+                with open(test_file, 'r', errors='replace') as f:
+                    entry = {'mtime': stat.st_mtime, 'size': stat.st_size,
+                             'tests': TEST_REGISTRATION_RE.findall(f.read())}
+            files[test_file.name] = entry
+            registry.update(entry['tests'])
+        
+        if files != cache:
+            tmp_file = self.test_registry_cache_file.with_name(f"{self.test_registry_cache_file.name}.{os.getpid()}")
+            try:
+                with open(tmp_file, 'w') as f:
+                    json.dump(files, f)
+                os.replace(tmp_file, self.test_registry_cache_file)
+            except OSError as e:
+                print(f"⚠️  Warning: Could not write {self.test_registry_cache_file.name}: {e}")
+        return registry
+    
+    def _check_test_names(self, tests):
+        """Unknown UVM_TESTNAMEs in the expanded list, with close matches; empty if all are known
+
+        A typo otherwise costs a full compile and shows up as a UVM fatal at time 0.
+        The name checked is the one the run passes as +UVM_TESTNAME.
+        """
+        registry = self._load_test_registry()
+        if registry is None:
+            print(f"⚠️  Warning: No test/ folder next to sim/, test names not checked")
+            return {}
+        unknown = {}
+        for test_obj in tests:
+            uvm_test_name = self._extract_base_test_name(test_obj['name'])
+            if uvm_test_name not in registry and uvm_test_name not in unknown:
+                unknown[uvm_test_name] = difflib.get_close_matches(uvm_test_name, registry, n=3, cutoff=0.6)
+        if not unknown:
+            print(f"✅ All {len(tests)} runs name one of the {len(registry)} registered tests")
+        return unknown
+    
+    def _derived_seed(self, test_obj):
+        """Seed of a run in the --seed-base stream: blake2b of base, test, run number and command_add
+
+        Unlike Python's hash(), which is salted per process, the same list and base give
+        the same seeds in every regression, on every host.
+        """
+        key = json.dumps([self.seed_base, test_obj['base_name'], test_obj.get('run_number', 1),
+                          test_obj.get('command_add') or ''])
+        seed = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=4).digest(), 'big') & 0x7FFFFFFF
+        return seed or 1
+    
+    def _derive_seeds(self, tests):
+        """Give every run without seed= its --seed-base seed, making it cacheable"""
+        if self.seed_base is None:
+            return
+        derived = 0
+        for test_obj in tests:
+            if test_obj.get('seed') is None:
+                test_obj['seed'] = self._derived_seed(test_obj)
+                derived += 1
+        print(f"🎲 Seeds: {derived} runs seeded from --seed-base {self.seed_base}, "
+              f"{len(tests) - derived} with seed= from the list")
+    
+    def _load_history(self):
+        """Load regression_history.json (missing or unreadable history is just empty)"""
+        try:
+            with open(self.history_file, 'r') as f:
+                self.history = json.load(f)
+        except (OSError, ValueError):
+            self.history = {}
+    
+    def _update_history(self):
+        """Fold this regression's measurements into regression_history.json
+
+        Keeps the last HISTORY_SAMPLES_PER_TEST samples per test. Re-reads the file
+        and replaces it atomically under the shared lock, so another regression that
+        finishes at the same time does not lose its samples.
+        """
+        try:
+            with self._shared_state_lock():
+                self._load_history()
+                for result in self.results:
+                    if result.cached or result.status not in ('PASS', 'FAIL', 'TIMEOUT'):
+                        continue  # ERROR durations and usage say nothing about the test
+                    entry = self.history.setdefault(self._history_key(result.name, result.command_add), {})
+                    if result.status == 'TIMEOUT':
+                        # Only a lower bound: the test would have run at least this long
+                        entry['timed_out_s'] = max(entry.get('timed_out_s', 0), round(result.duration, 2))
+                        continue
+                    entry.pop('timed_out_s', None)
+                    for metric, value in (('duration', result.duration), ('peak_mem_mb', result.peak_mem_mb),
+                                          ('cpu_time_s', result.cpu_time_s)):
+                        if value is not None:
+                            samples = entry.setdefault(metric, [])
+                            samples.append(round(value, 2))
+                            del samples[:-HISTORY_SAMPLES_PER_TEST]
                 
-                # Write TIMEOUT results first
-                if timeout_results:
-                    f.write(f"TIMEOUT Tests ({len(timeout_results)}):\n")
-                    f.write(f"-" * 80 + "\n")
-                    for result in timeout_results:
-                        f.write(f"Test:     {result.name}\n")
-                        f.write(f"Status:   {result.status}\n")
-                        f.write(f"Duration: {result.duration:.1f}s\n")
-                        f.write(f"Folder:   {result.folder_id}\n")
-                        f.write(f"Log:      {self._to_relative_path(self.no_pass_logs_folder / f'{result.name}.log')}\n")
+                fd, tmp_path = tempfile.mkstemp(dir=str(self.history_file.parent), prefix='.regression_history.')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.history, f, sort_keys=True)
+                os.replace(tmp_path, self.history_file)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not update {self.history_file.name}: {e}")
+    
+    def _memory_request_mb(self, test_name, command_add):
+        """LSF rusage[mem=] for a test: largest peak in its history plus a margin"""
+        samples = self.history.get(self._history_key(test_name, command_add), {}).get('peak_mem_mb')
+        if not samples:
+            return MEM_REQUEST_DEFAULT_MB
+        request = max(samples) * MEM_REQUEST_MARGIN
+        request = int(math.ceil(request / MEM_REQUEST_ROUND_MB)) * MEM_REQUEST_ROUND_MB
+        return max(MEM_REQUEST_MIN_MB, request)
+    
+    def _test_timeout(self, test_name, command_add):
+        """Timeout in seconds for a run, and where it came from
+
+        A test that ran TIMEOUT_MIN_SAMPLES times gets the p99 of its recorded
+        durations times TIMEOUT_MARGIN: a hang in a 2-minute test is killed after
+        minutes instead of at --timeout, and a test that needs 40 minutes is not
+        killed at 10. If the test timed out since it last completed, the timeout is
+        at least TIMEOUT_GROWTH times the time it was killed at, so a test that got
+        slower is not killed at the same point on every run. Without enough history
+        it gets --timeout, raised for tests whose names say they run long.
+        """
+        entry = self.history.get(self._history_key(test_name, command_add), {})
+        samples = entry.get('duration')
+        if self.history_timeouts and samples and len(samples) >= TIMEOUT_MIN_SAMPLES:
+            p99 = self._percentile(samples, 0.99)
+            source = f"history: p99 {p99:.0f}s x{TIMEOUT_MARGIN:g} of {len(samples)} runs"
+            limit = p99 * TIMEOUT_MARGIN
+            timed_out = entry.get('timed_out_s')
+            if timed_out and timed_out * TIMEOUT_GROWTH > limit:
+                limit = timed_out * TIMEOUT_GROWTH
+                source = f"history: timed out at {timed_out:.0f}s, x{TIMEOUT_GROWTH:g}"
+            timeout = int(math.ceil(limit / TIMEOUT_ROUND_S)) * TIMEOUT_ROUND_S
+            return min(TIMEOUT_CEILING_S, max(TIMEOUT_FLOOR_S, timeout)), source
+        
+        # Timeout-scenario and stress tests run long by design
+        base_test_name = self._extract_base_test_name(test_name).lower()
+        if 'timeout' in base_test_name:
+            return max(self.timeout, 3600), "no history: timeout-scenario test"
+        if 'stress' in base_test_name or 'burnin' in base_test_name:
+            return max(self.timeout, 1800), "no history: stress test"
+        return self.timeout, "no history: --timeout"
+    
+    def _assign_timeouts(self, tests):
+        """Set test_obj['timeout'] (and its 'timeout_source') for every run"""
+        for test_obj in tests:
+            test_obj['timeout'], test_obj['timeout_source'] = self._test_timeout(
+                test_obj['name'], test_obj.get('command_add'))
+    
+    def _print_timeout_plan(self, tests):
+        """One line on how the timeouts were chosen, and every run's timeout in run_plan"""
+        from_history = [test_obj['timeout'] for test_obj in tests
+                        if test_obj['timeout_source'].startswith('history')]
+        if from_history:
+            print(f"⏱️  Timeouts: {len(from_history)} runs from duration history "
+                  f"({min(from_history)}s-{max(from_history)}s), "
+                  f"{len(tests) - len(from_history)} without enough history "
+                  f"(--timeout {self.timeout}s or name-based)")
+        
+        plan_file = self.results_folder / "run_plan"
+        try:
+            with open(plan_file, 'w') as f:
+                f.write(f"# Run plan generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"# Format: run_name tier timeout_s timeout_source [seed=XXX] [command_add=XXX]\n")
+                f.write(f"# Total runs: {len(tests)}\n")
+                f.write("#\n")
+                for test_obj in tests:
+                    tier = test_obj['tier'] if test_obj.get('tier') is not None else 1
+                    line = f"{test_obj['name']:50s} {tier:4d} {test_obj['timeout']:7d}  {test_obj['timeout_source']}"
+                    if test_obj.get('seed') is not None:
+                        line += f"  seed={test_obj['seed']}"
+                    if test_obj.get('command_add'):
+                        line += f"  command_add={test_obj['command_add']}"
+                    f.write(line + "\n")
+            if self.verbose:
+                print(f"📝 Run plan with per-run timeouts: {self._to_relative_path(plan_file)}")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not write run plan: {e}")
+    
+    def _check_local_memory_budget(self, tests):
+        """Warn when the known peaks of max_parallel concurrent tests exceed free memory"""
+        try:
+            with open('/proc/meminfo', 'r') as f:
+                meminfo = dict(line.split(':', 1) for line in f)
+            available_mb = int(meminfo['MemAvailable'].split()[0]) / 1024.0
+        except (OSError, KeyError, ValueError):
+            return
+        
+        peaks = []
+        for test_obj in tests:
+            samples = self.history.get(self._history_key(test_obj['name'], test_obj.get('command_add')), {}).get('peak_mem_mb')
+            if samples:
+                peaks.append(max(samples))
+        if not peaks:
+            return
+        worst_case_mb = sum(sorted(peaks, reverse=True)[:self.max_parallel])
+        if worst_case_mb > available_mb:
+            print(f"⚠️  Warning: the {min(self.max_parallel, len(peaks))} largest tests peaked at {worst_case_mb / 1024:.1f} GB together, "
+                  f"but only {available_mb / 1024:.1f} GB is available - consider a lower --max-parallel")
+    
+    def _compile_file_tokens(self, compile_file):
+        """Whitespace-separated tokens of a VCS -f file, without // and # comments"""
+        tokens = []
+        with open(compile_file, 'r') as f:
+            for line in f:
+                line = line.split('//', 1)[0]
+                if not line.lstrip().startswith('#'):
+                    tokens.extend(line.split())
+        return tokens
+    
+    def _compile_file_inputs(self, compile_file, anchor_dir, seen=None):
+        """Source files and include directories a VCS -f file pulls into the build
+
+        Relative paths are resolved like VCS does from an execution folder (anchor_dir).
+        Returns (files, include_dirs, options); nested -f files are followed.
+        """
+        seen = seen if seen is not None else set()
+        files, include_dirs, options = [compile_file], [], []
+        if compile_file in seen:
+            return [], [], []
+        seen.add(compile_file)
+        
+        def resolve(path):
+            return Path(os.path.normpath(os.path.join(str(anchor_dir), os.path.expandvars(path))))
+        
+        tokens = self._compile_file_tokens(compile_file)
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token.startswith('+incdir+'):
+                include_dirs.extend(resolve(d) for d in token[len('+incdir+'):].split('+') if d)
+            elif token in ('-f', '-F', '-v', '-y') and index + 1 < len(tokens):
+                index += 1
+                path = resolve(tokens[index])
+                if token in ('-f', '-F'):
+                    nested = self._compile_file_inputs(path, anchor_dir, seen)
+                    files += nested[0]
+                    include_dirs += nested[1]
+                    options += nested[2]
+                elif token == '-y':
+                    include_dirs.append(path)
+                else:
+                    files.append(path)
+            elif token.startswith(('+', '-')):
+                options.append(token)
+            else:
+                files.append(resolve(token))
+            index += 1
+        return files, include_dirs, options
+    
+    def _build_hash(self, portable=False):
+        """Content hash of everything the VCS build depends on, or None if unknown
+        
+        Covers the compile file, every source it lists, every file in its include
+        directories (`include targets are not listed anywhere else) and the build
+        options this runner adds. Any edit anywhere in the testbench changes it.
+        The portable hash is the one a worker and its coordinator compare: it leaves
+        out the FSDB/coverage options (a worker only learns them from the coordinator,
+        after its hello) and names files relative to the checkout, which may sit
+        elsewhere on the worker's host.
+        """
+        compile_file = self.base_dir.parent / 'axi4_compile.f'
+        try:
+            files, include_dirs, options = self._compile_file_inputs(compile_file, self.path_anchor_dir)
+        except OSError:
+            return None
+        
+        for include_dir in include_dirs:
+            try:
+                files.extend(path for path in include_dir.iterdir() if path.is_file())
+            except OSError:
+                continue
+        
+        digest = hashlib.blake2b(digest_size=16)
+        run_settings = {} if portable else {'fsdb_dump': self.fsdb_dump, 'coverage': self.coverage}
+        digest.update(json.dumps(dict(run_settings, options=options), sort_keys=True).encode())
+        checkout = self.base_dir.parent.parent
+        for path in sorted(set(files)):
+            name = str(path)
+            if portable:
+                try:
+                    name = str(Path(path).relative_to(checkout))
+                except ValueError:
+                    pass  # outside the checkout: only the same absolute path matches
+            digest.update(name.encode() + b'\0')
+            try:
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+            except OSError:
+                digest.update(b'<missing>')
+        return digest.hexdigest()
+    
+    def _result_cache_key(self, build_hash, test_obj):
+        """Cache key of one run; None when the seed is only chosen at launch"""
+        if test_obj.get('seed') is None:
+            return None
+        key = json.dumps([build_hash, self._uvm_test_name(test_obj), int(test_obj['seed']),
+                          test_obj.get('command_add') or '',
+                          f"+UVM_VERBOSITY={test_obj.get('verbosity', self.verbosity)}"])
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    
+    def _apply_result_cache(self, tests):
+        """Report cached runs straight from regression_cache/ and return the rest
+
+        Only runs with a fixed seed (seed= in the list, e.g. a rerun of no_pass_list,
+        or any run with --seed-base) have a key. PASS and FAIL verdicts are reused; TIMEOUT and ERROR are always
+        rerun. Coverage regressions bypass the cache because a cached run has no
+        coverage database to merge, and runs that dump FSDB (--fsdb-dump, the reruns of
+        --rerun-fsdb) because it has no waves.
+        """
+        if self.coverage or not any(test_obj.get('seed') is not None for test_obj in tests):
+            return tests
+        build_hash = self._build_hash()
+        if build_hash is None:
+            return tests
+        
+        remaining = []
+        reused = 0
+        for test_obj in tests:
+            if self._wants_waves(test_obj.get('command_add')):
+                remaining.append(test_obj)  # No key: never served from or stored in the cache
+                continue
+            key = self._result_cache_key(build_hash, test_obj)
+            if key is not None:
+                self._cache_keys[test_obj['name']] = key
+            result = self._cached_result(test_obj, key) if key and self.use_cache else None
+            if result is None:
+                remaining.append(test_obj)
+            else:
+                reused += 1
+                if not test_obj.get('rerun_of'):
+                    self.cached_tests += 1
+                self._update_progress(result)
+        
+        if reused:
+            print(f"♻️  Result cache: {reused} of {len(tests)} runs reused from "
+                  f"{self._to_relative_path(self.cache_dir)} (--no-cache to re-simulate)")
+        return remaining
+    
+    def _cached_result(self, test_obj, key):
+        """TestResult for test_obj from the cache entry key, or None on a miss"""
+        record_file = self.cache_dir / f"{key}.json"
+        log_file = self.cache_dir / f"{key}.log"
+        try:
+            with open(record_file, 'r') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get('status') not in ('PASS', 'FAIL') or not log_file.exists():
+            return None
+        
+        record.update(
+            name=test_obj['name'],
+            base_name=test_obj.get('base_name', test_obj['name']),
+            run_number=test_obj.get('run_number', 1),
+            test_group=test_obj.get('test_group'),
+            seed=test_obj.get('seed'),
+            command_add=test_obj.get('command_add'),
+            log_file=str(log_file),
+            completed_at=None,
+            rerun_of=test_obj.get('rerun_of'),
+            rerun=None
+        )
+        result = TestResult.from_record({field: value for field, value in record.items()
+                                         if not field.startswith('t_')})
+        result.folder_id = None
+        result.cached = True
+        return result
+    
+    def _store_cached_result(self, test_result):
+        """Save the verdict and log of a fresh PASS/FAIL run under its cache key"""
+        key = self._cache_keys.get(test_result.name)
+        if key is None or test_result.status not in ('PASS', 'FAIL'):
+            return
+        folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
+        archived_log = folder / f"{test_result.name}.log"
+        if not archived_log.exists():
+            return
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            # Log first, record last: a record only ever points at a complete log.
+            # Under the lock, so a concurrent regression storing the same key cannot
+            # pair its log with this record.
+            with self._shared_state_lock():
+                link_path(archived_log, self.cache_dir / f"{key}.log")
+                fd, tmp_record = tempfile.mkstemp(dir=str(self.cache_dir), prefix=f'.{key}.')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(test_result.to_record(), f)
+                os.replace(tmp_record, self.cache_dir / f"{key}.json")
+        except Exception as e:
+            print(f"⚠️  Warning: Could not cache result of {test_result.name}: {e}")
+    
+    def _resource_usage_summary(self):
+        """Per-test resource usage of this regression, largest peak memory first, as report lines"""
+        per_test = {}
+        for result in self.results:
+            if result.cached or (result.peak_mem_mb is None and result.cpu_time_s is None):
+                continue
+            entry = per_test.setdefault(self._history_key(result.name, result.command_add), {'runs': 0, 'mem': [], 'cpu': [], 'io': 0.0})
+            entry['runs'] += 1
+            if result.peak_mem_mb is not None:
+                entry['mem'].append(result.peak_mem_mb)
+            if result.cpu_time_s is not None:
+                entry['cpu'].append(result.cpu_time_s)
+            entry['io'] += (result.io_read_mb or 0.0) + (result.io_write_mb or 0.0)
+        if not per_test:
+            return []
+        
+        lines = [f"{'Test':60s} {'Runs':>5s} {'PeakMem':>10s} {'MeanCPU':>9s} {'IO':>9s}"]
+        for key, entry in sorted(per_test.items(), key=lambda item: -max(item[1]['mem'] or [0])):
+            peak = f"{max(entry['mem']):.0f}MB" if entry['mem'] else '-'
+            cpu = f"{sum(entry['cpu']) / len(entry['cpu']):.1f}s" if entry['cpu'] else '-'
+            lines.append(f"{key[:60]:60s} {entry['runs']:5d} {peak:>10s} {cpu:>9s} {entry['io']:8.0f}M")
+        return lines
+    
+    def _percentile(self, values, fraction):
+        """Nearest-rank percentile of a non-empty list"""
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+    
+    def _phase_timing_summary(self):
+        """Per-phase aggregates over all runs, as report lines
+
+        Shows where the wall time of the regression goes: waiting for a slot, runner
+        setup, VCS compile, simv load, simulation, analysis or archiving.
+        """
+        per_phase = {phase: [] for phase in TIMING_PHASES}
+        for result in self.results:
+            for phase, seconds in result.timing.items():
+                per_phase[phase].append(seconds)
+        
+        grand_total = sum(sum(values) for values in per_phase.values())
+        if grand_total <= 0:
+            return []
+        
+        lines = [f"{'Phase':10s} {'Runs':>6s} {'Total':>10s} {'Share':>7s} {'Mean':>9s} {'P50':>9s} {'P95':>9s} {'Max':>9s}"]
+        for phase, values in per_phase.items():
+            if not values:
+                lines.append(f"{phase:10s} {0:6d} {'-':>10s}")
+                continue
+            total = sum(values)
+            lines.append(f"{phase:10s} {len(values):6d} {str(timedelta(seconds=int(total))):>10s} "
+                         f"{total / grand_total * 100:6.1f}% {total / len(values):8.1f}s "
+                         f"{self._percentile(values, 0.50):8.1f}s {self._percentile(values, 0.95):8.1f}s "
+                         f"{max(values):8.1f}s")
+        return lines
+    
+    def _save_detailed_results(self, results_file: Path):
+        """Save detailed test results to file"""
+        with open(results_file, 'w') as f:
+            f.write(f"AXI4 Regression Results\n")
+            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"="*80 + "\n\n")
+            
+            f.write(f"Summary:\n")
+            f.write(f"  Total Tests: {self.total_tests}\n")
+            f.write(f"  Passed:      {self.passed_tests}\n")
+            f.write(f"  Failed:      {self.failed_tests}\n")
+            f.write(f"  Pass Rate:   {(self.passed_tests/self.total_tests)*100:.1f}%\n\n")
+            
+            # Group results by status: TIMEOUT and FAIL first, PASS second
+            timeout_results = [r for r in self.results if r.status == 'TIMEOUT']
+            fail_results = [r for r in self.results if r.status in ['FAIL', 'ERROR', 'BUILD_ERROR']]
+            pass_results = [r for r in self.results if r.status == 'PASS']
+            
+            # REGION 1: FAILED AND TIMEOUT TESTS
+            if timeout_results or fail_results:
+                f.write(f"=" * 80 + "\n")
+                f.write(f"REGION 1: FAILED AND TIMEOUT TESTS\n")
+                f.write(f"=" * 80 + "\n\n")
+                
+                # Write TIMEOUT results first
+                if timeout_results:
+                    f.write(f"TIMEOUT Tests ({len(timeout_results)}):\n")
+                    f.write(f"-" * 80 + "\n")
+                    for result in timeout_results:
+                        f.write(f"Test:     {result.name}\n")
+                        f.write(f"Status:   {result.status}\n")
+                        f.write(f"Duration: {result.duration:.1f}s\n")
+                        f.write(f"Folder:   {result.folder_id}\n")
+                        f.write(f"Log:      {self._to_relative_path(self._archived_log(result))}\n")
+                        if result.rerun:
+                            f.write(f"Rerun:    {self._rerun_line(result)}\n")
                         if result.error_msg:
                             f.write(f"Error:    {result.error_msg}\n")
                         f.write(f"\n")
@@ -1816,7 +4028,9 @@ class RegressionRunner:
                         f.write(f"Status:   {result.status}\n")
                         f.write(f"Duration: {result.duration:.1f}s\n")
                         f.write(f"Folder:   {result.folder_id}\n")
-                        f.write(f"Log:      {self._to_relative_path(self.no_pass_logs_folder / f'{result.name}.log')}\n")
+                        f.write(f"Log:      {self._to_relative_path(self._archived_log(result))}\n")
+                        if result.rerun:
+                            f.write(f"Rerun:    {self._rerun_line(result)}\n")
                         if result.error_msg:
                             f.write(f"Error:    {result.error_msg}\n")
                         f.write(f"\n")
@@ -1834,9 +4048,25 @@ class RegressionRunner:
                     f.write(f"Status:   {result.status}\n")
                     f.write(f"Duration: {result.duration:.1f}s\n")
                     f.write(f"Folder:   {result.folder_id}\n")
-                    f.write(f"Log:      {self._to_relative_path(self.pass_logs_folder / f'{result.name}.log')}\n")
+                    f.write(f"Log:      {self._to_relative_path(self._archived_log(result))}\n")
                     f.write(f"\n")
     
+    def _result_folder_label(self, result):
+        """Where a run executed: its run folder, or the result cache it was taken from"""
+        if result.cached:
+            return f"{self.cache_dir.name} (cached)"
+        if result.folder_id is None:
+            return "none (not run)"
+        if self.serve_address and result.host:
+            return f"run_folder_{result.folder_id:02d} on {result.host}"
+        return f"run_folder_{result.folder_id:02d}"
+    
+    def _worker_summary(self):
+        """Hosts that simulated the runs of a --serve regression, and the runs requeued"""
+        hosts = {result.host for result in self.results if result.folder_id is not None and not result.cached}
+        return (f"{len(self.results) - self.cached_tests - self.build_skipped_tests} runs on "
+                f"{len(hosts)} host(s), {self.requeued_tests} requeued from lost workers")
+    
     def _save_regression_summary(self, summary_file: Path):
         """Save comprehensive summary with all test records and detailed error information"""
         with open(summary_file, 'w') as f:
@@ -1849,17 +4079,48 @@ class RegressionRunner:
             f.write(f"  Total Tests:     {self.total_tests}\n")
             f.write(f"  Passed:          {self.passed_tests} ({(self.passed_tests/self.total_tests)*100:.1f}%)\n")
             f.write(f"  Failed:          {self.failed_tests} ({(self.failed_tests/self.total_tests)*100:.1f}%)\n")
+            if self.cached_tests:
+                f.write(f"  Cached:          {self.cached_tests} (verdicts reused from {self.cache_dir.name}/)\n")
+            if self.copy_back['runs']:
+                f.write(f"  Scratch:         {self.copy_back['runs']} runs in {self.scratch_root}, "
+                        f"{self.copy_back['bytes'] / 1048576.0:.1f} MB copied back (logs, coverage, waves)\n")
+            f.write(f"  Logs:            {self._log_storage_summary()}\n")
+            if self.serve_address:
+                f.write(f"  Workers:         {self._worker_summary()}\n")
+            if self.broken_builds:
+                f.write(f"  Build Errors:    {len(self.broken_builds)} compile option set(s) failed to compile, "
+                        f"{self.build_skipped_tests} queued runs not run\n")
+                for broken in self.broken_builds.values():
+                    f.write(f"    {broken['test']}: {broken['error']}\n")
+            if self.smoke_gate:
+                f.write(f"  Smoke Gate:      {self._smoke_gate_line()}\n")
+            if self.rerun_results:
+                f.write(f"  Reruns:          {self._rerun_summary()}\n")
             elapsed = time.time() - self.start_time
             f.write(f"  Total Time:      {str(timedelta(seconds=int(elapsed)))}\n")
             f.write(f"  Average per Test: {elapsed/self.total_tests:.1f}s\n\n")
             
+            phase_lines = self._phase_timing_summary()
+            if phase_lines:
+                f.write(f"Time per Phase:\n")
+                for line in phase_lines:
+                    f.write(f"  {line}\n")
+                f.write(f"\n")
+            
+            resource_lines = self._resource_usage_summary()
+            if resource_lines:
+                f.write(f"Resource Usage per Test:\n")
+                for line in resource_lines:
+                    f.write(f"  {line}\n")
+                f.write(f"\n")
+            
             # Detailed results for ALL tests (not just failed)
             f.write(f"Detailed Test Results:\n")
             f.write(f"="*80 + "\n\n")
             
             # Sort results: TIMEOUT first, FAIL/ERROR second, PASS last
             timeout_results = [r for r in self.results if r.status == 'TIMEOUT']
-            fail_results = [r for r in self.results if r.status in ['FAIL', 'ERROR']]
+            fail_results = [r for r in self.results if r.status in ['FAIL', 'ERROR', 'BUILD_ERROR']]
             pass_results = [r for r in self.results if r.status == 'PASS']
             
             test_num = 1
@@ -1867,10 +4128,12 @@ class RegressionRunner:
             # Show TIMEOUT tests
             for result in timeout_results:
                 f.write(f"[{test_num:3d}] Test: {result.name}\n")
-                f.write(f"      Status:     {result.status}\n")
+                f.write(f"      Status:     {result.status}{' (cached)' if result.cached else ''}\n")
                 f.write(f"      Duration:   {result.duration:.1f}s\n")
-                f.write(f"      Folder:     run_folder_{result.folder_id:02d}\n")
-                f.write(f"      Log:        {self._to_relative_path(self.no_pass_logs_folder / f'{result.name}.log')}\n")
+                f.write(f"      Folder:     {self._result_folder_label(result)}\n")
+                f.write(f"      Log:        {self._to_relative_path(self._archived_log(result))}\n")
+                if result.rerun:
+                    f.write(f"      Rerun:      {self._rerun_line(result)}\n")
                 if result.error_msg:
                     f.write(f"      Error:      {result.error_msg}\n")
                 f.write(f"\n")
@@ -1879,10 +4142,12 @@ class RegressionRunner:
             # Show FAIL/ERROR tests
             for result in fail_results:
                 f.write(f"[{test_num:3d}] Test: {result.name}\n")
-                f.write(f"      Status:     {result.status}\n")
+                f.write(f"      Status:     {result.status}{' (cached)' if result.cached else ''}\n")
                 f.write(f"      Duration:   {result.duration:.1f}s\n")
-                f.write(f"      Folder:     run_folder_{result.folder_id:02d}\n")
-                f.write(f"      Log:        {self._to_relative_path(self.no_pass_logs_folder / f'{result.name}.log')}\n")
+                f.write(f"      Folder:     {self._result_folder_label(result)}\n")
+                f.write(f"      Log:        {self._to_relative_path(self._archived_log(result))}\n")
+                if result.rerun:
+                    f.write(f"      Rerun:      {self._rerun_line(result)}\n")
                 if result.error_msg:
                     f.write(f"      Error:      {result.error_msg}\n")
                 if result.uvm_errors > 0 or result.uvm_fatals > 0:
@@ -1893,10 +4158,10 @@ class RegressionRunner:
             # Show PASS tests
             for result in pass_results:
                 f.write(f"[{test_num:3d}] Test: {result.name}\n")
-                f.write(f"      Status:     {result.status}\n")
+                f.write(f"      Status:     {result.status}{' (cached)' if result.cached else ''}\n")
                 f.write(f"      Duration:   {result.duration:.1f}s\n")
-                f.write(f"      Folder:     run_folder_{result.folder_id:02d}\n")
-                f.write(f"      Log:        {self._to_relative_path(self.pass_logs_folder / f'{result.name}.log')}\n")
+                f.write(f"      Folder:     {self._result_folder_label(result)}\n")
+                f.write(f"      Log:        {self._to_relative_path(self._archived_log(result))}\n")
                 f.write(f"\n")
                 test_num += 1
             
@@ -1920,37 +4185,87 @@ class RegressionRunner:
             # Load test list
             tests = self._load_test_list(test_list_file)
             
+            # Reject names no test registers before anything is compiled
+            unknown = self._check_test_names(tests) if self.check_test_names else {}
+            if unknown:
+                print(f"❌ Error: {len(unknown)} test name(s) in {test_list_file} match no uvm_component_utils in test/*.sv:")
+                for name, matches in unknown.items():
+                    hint = f" (did you mean {', '.join(matches)}?)" if matches else ""
+                    print(f"   {name}{hint}")
+                print(f"💡 Fix the list, or pass --no-test-check for tests registered elsewhere")
+                self._regression_success = True  # nothing ran, nothing to keep
+                return 1
+            if not self.resume_dir:
+                self._claim_results_folder()
+            self._derive_seeds(tests)
+            self.smoke_names = {test_obj['name'] for test_obj in tests if test_obj.get('tier') == 0}
+            
             # Set max_parallel to number of tests if not specified
             if self.max_parallel is None:
                 self.max_parallel = len(tests)
             
-            execution_mode = "LSF" if self.use_lsf else "Local"
+            # Skip everything the interrupted run already finished
+            if self.resume_dir:
+                tests = self._load_resume_journal(tests)
+            
+            # Per-test history sizes LSF memory requests and timeouts, and checks local memory
+            self._load_history()
+            self._assign_timeouts(tests)
+            if not self.use_lsf and not self.serve_address:
+                self._check_local_memory_budget(tests)
+            
+            execution_mode = "LSF" if self.use_lsf else "Workers" if self.serve_address else "Local"
             print(f"⚙️  Configuration: {execution_mode} mode, {self.max_parallel} parallel workers, {self.timeout}s timeout")
+            if self.rerun_verbosity:
+                print(f"🔇 Verbosity: UVM_{self.verbosity}, failures rerun with their seed at UVM_{self.rerun_verbosity}"
+                      f"{' with failure-window FSDB' if self.rerun_fsdb else ''}")
             
             # Setup test folders
             folders = self._setup_test_folders()
+            if not self.resume_dir:
+                self._save_regression_state(test_list_file)
+            self._print_timeout_plan(tests)
             
             # Start timer
             self.start_time = time.time()
+            if self.metrics_address:
+                self._start_metrics_server()
             
             print(f"\n🏃 Starting regression with {len(tests)} tests...")
             print("-" * 80)
             
-            if self.use_lsf:
-                return self._run_lsf_regression(tests, folders)
-            else:
-                return self._run_local_regression(tests, folders)
+            # Runs already simulated with identical inputs are answered from the cache;
+            # their progress lines come first, under the header
+            tests = self._apply_result_cache(tests)
+            
+            self._run_tiers(tests, folders)
+            if self.rerun_verbosity and not self.stop_all.is_set():
+                self._rerun_failures(folders)
+            if self._worker_server:
+                self._release_workers()
+            if self.scratch_root and not self.use_lsf:
+                # Whatever killed or crashed runs left behind in scratch
+                shutil.rmtree(Path(self._scratch_exec_dir('')), ignore_errors=True)
+            
+            # Verify all logs are in the logs folder and print summary
+            self._finish_log_compression()
+            self._copy_all_logs_to_logs_folder()
+            exit_code = self._print_summary()
+            if exit_code == 0:
+                self._regression_success = True
+            return exit_code
             
         except Exception as e:
             print(f"\n💥 Fatal error during regression: {e}")
             return 1
         finally:
-            # Clean up old execution folders but keep all folders from current run
+            self._stop_metrics_server()
+            # Remove this regression's execution folders, unless something needs debugging
             if hasattr(self, '_regression_success') and self._regression_success:
                 self._cleanup_all_folders()
             else:
-                print("⚠️  Keeping all execution folders for debugging (run_folder_*)")
-                print("💡 Manually remove with: rm -rf run_folder_*")
+                print(f"⚠️  Keeping all execution folders for debugging ({self._to_relative_path(self.work_folder)})")
+                print(f"💡 Manually remove with: rm -rf {self._to_relative_path(self.work_folder)}")
             
             # Always report the regression result folder location
             if hasattr(self, 'results_folder') and self.results_folder.exists():
@@ -1958,6 +4273,242 @@ class RegressionRunner:
                 print(f"   View summary: cat {self._to_relative_path(self.results_folder / 'regression_summary.txt')}")
                 print(f"   View detailed results: cat {self._to_relative_path(self.results_folder / f'regression_results_{self.timestamp}.txt')}")
     
+    def _run_tiers(self, tests, folders):
+        """Run the tier-0 smoke runs first and release the other tiers only if they pass
+
+        Lists without tier=0 entries run as a single batch, lower tiers first. Otherwise
+        the smoke runs go on their own, and the pass rate of every tier-0 run (resumed
+        and cached ones included) is checked against --smoke-threshold. Below it, the
+        remaining runs are never started: they go to gated_list and out of the totals,
+        so a broken build costs the smoke runs and nothing more.
+        """
+        run_batch = self._batch_runner()
+        
+        def tier_of(test_obj):
+            """List entries without tier= run in tier 1"""
+            return test_obj['tier'] if test_obj.get('tier') is not None else 1
+        
+        smoke_tests = [test_obj for test_obj in tests if tier_of(test_obj) == 0]
+        other_tests = sorted((test_obj for test_obj in tests if tier_of(test_obj) > 0), key=tier_of)
+        
+        if not self.smoke_names or not other_tests:
+            run_batch(smoke_tests + other_tests, folders)
+            return
+        
+        print(f"🚦 Tier 0: {len(smoke_tests)} smoke runs first, {len(other_tests)} runs in later tiers wait for them")
+        run_batch(smoke_tests, folders)
+        if self.stop_all.is_set():
+            return
+        
+        smoke_results = [result for result in self.results if result.name in self.smoke_names]
+        passed = sum(1 for result in smoke_results if result.status == 'PASS')
+        rate = passed / len(smoke_results) * 100 if smoke_results else 0.0
+        released = rate >= self.smoke_threshold
+        self.smoke_gate = {'passed': passed, 'runs': len(smoke_results), 'rate': rate,
+                           'released': released, 'later_runs': len(other_tests)}
+        print(f"\n{'🚦' if released else '🛑'} {self._smoke_gate_line()}")
+        if released:
+            print("-" * 80)
+            run_batch(other_tests, folders)
+        else:
+            self.total_tests -= len(other_tests)
+            self._generate_gated_list(other_tests)
+    
+    def _batch_runner(self):
+        """The method that runs one batch of runs to completion in this execution mode"""
+        if self.use_lsf:
+            return self._run_lsf_regression
+        if self.serve_address:
+            return self._run_distributed_regression
+        return self._run_local_regression
+    
+    def _rerun_failures(self, folders):
+        """Run every FAIL/TIMEOUT once more with the same seed, at --rerun-verbosity
+
+        A UVM_LOW log is enough for a verdict but rarely for a diagnosis; paying for
+        MEDIUM/HIGH logging on the runs that pass is what --low-verbosity avoids, and
+        paying for waves on them is what --rerun-fsdb avoids. Each rerun is named
+        <run>_rerun, keeps the run's seed and command_add and is linked both ways in
+        the results (rerun / rerun_of). With --rerun-fsdb it also gets
+        +define+DUMP_FSDB and the dump window of _failure_window. It collects no
+        coverage and leaves the verdict alone.
+        """
+        failures = [result for result in self.results
+                    if result.status in ('FAIL', 'TIMEOUT') and result.seed is not None]
+        if not failures:
+            return
+        
+        reruns = []
+        windows = 0
+        for result in failures:
+            command_add = result.command_add
+            if self.rerun_fsdb:
+                options = [] if self.fsdb_dump or '+define+DUMP_FSDB' in (command_add or '') else ['+define+DUMP_FSDB']
+                window = self._failure_window(result)
+                if window:
+                    options += [f"+fsdb_start={window[0]}", f"+fsdb_stop={window[1]}"]
+                    windows += 1
+                command_add = ' '.join(filter(None, [command_add] + options)) or None
+            test_obj = {
+                'name': f"{result.name}_rerun",
+                'base_name': result.base_name,
+                'run_number': result.run_number,
+                'seed': result.seed,
+                'command_add': command_add,
+                'verbosity': self.rerun_verbosity,
+                'rerun_of': result.name,
+            }
+            test_obj['timeout'], test_obj['timeout_source'] = self._test_timeout(result.name, result.command_add)
+            self._rerun_names[test_obj['name']] = result.name
+            reruns.append(test_obj)
+        
+        if self.rerun_fsdb:
+            waves = f" with FSDB of hdl_top ({windows} limited to the failure window)"
+        else:
+            waves = " with FSDB" if self.fsdb_dump else ""
+        print(f"\n🔍 Rerunning {len(reruns)} failed run(s) with the same seed at UVM_{self.rerun_verbosity}{waves}")
+        print("-" * 80)
+        self._batch_runner()(self._apply_result_cache(reruns), folders)
+        # Reruns counted as completed only so the batch runners could wait for them
+        self.completed_tests -= len(self.rerun_results)
+    
+    def _failure_window(self, result):
+        """(start, stop) sim time in ps of the waves for the rerun of a failed run, or None
+
+        Taken from the @ <time> of the first UVM_ERROR/UVM_FATAL in its log: the dump
+        starts FSDB_WINDOW_BEFORE_PS before and stops FSDB_WINDOW_AFTER_PS after it.
+        Runs without a timed error (a TIMEOUT, a compile error) get the whole run.
+        """
+        log_path = self.no_pass_logs_folder / f"{result.name}.log"
+        if not _find_log(log_path):
+            log_path = result.log_file
+        line = self._first_error_line(log_path) if log_path else None
+        time_match = re.search(r'UVM_(?:ERROR|FATAL)\b.*?@\s*([\d.]+)\s*(fs|ps|ns|us|ms|s)?\s*:', line or '')
+        if not time_match:
+            return None
+        error_time = int(float(time_match.group(1)) * SIM_TIME_UNITS_PS[time_match.group(2) or 'ps'])
+        return max(0, error_time - FSDB_WINDOW_BEFORE_PS), error_time + FSDB_WINDOW_AFTER_PS
+    
+    def _rerun_line(self, result):
+        """Verdict and log of the rerun of a failed run"""
+        for rerun in self.rerun_results:
+            if rerun.name == result.rerun:
+                line = (f"{rerun.status} at UVM_{rerun.verbosity}, "
+                        f"log {self._to_relative_path(self._archived_log(rerun))}")
+                # The folder is made when the job is written; it only counts once VCS dumped into it
+                if any((self.waves_folder / rerun.name).glob('*.fsdb')):
+                    line += f", waves {self._to_relative_path(self.waves_folder / rerun.name)}"
+                return line
+        return result.rerun
+    
+    def _rerun_summary(self):
+        """One line on the reruns of failed runs and how they ended"""
+        passed = sum(1 for result in self.rerun_results if result.status == 'PASS')
+        line = (f"{len(self.rerun_results)} failed run(s) rerun at UVM_{self.rerun_verbosity}, "
+                f"{len(self.rerun_results) - passed} failed again")
+        if passed:
+            line += f", ⚠️  {passed} passed (verdict depends on verbosity or is not reproducible)"
+        return line
+    
+    def _smoke_gate_line(self):
+        """One-line description of the smoke gate decision"""
+        gate = self.smoke_gate
+        verdict = (f"{gate['passed']}/{gate['runs']} tier-0 runs passed ({gate['rate']:.1f}%, "
+                   f"threshold {self.smoke_threshold:g}%)")
+        if gate['released']:
+            return f"Smoke gate open: {verdict}, released {gate['later_runs']} runs in later tiers"
+        return f"Smoke gate closed: {verdict}, {gate['later_runs']} runs in later tiers not started (gated_list)"
+    
+    def _process_lsf_completion(self, job_id):
+        """Analyze a completed LSF job and record its result"""
+        job_info = self.lsf_jobs[job_id]
+        test_name = job_info['test_name']
+        folder_path = job_info['folder_path']
+        folder_id = job_info['folder_id']
+        
+        # Analyze results
+        log_file = folder_path / f"{test_name}.log"
+        log_content = ''
+        if job_info['status'] == 'TIMEOUT':
+            status = 'TIMEOUT'
+            error_msg = f"LSF job timed out after {job_info.get('timeout', self.timeout)}s"
+            uvm_errors = 0
+            uvm_fatals = 0
+        elif job_info['status'] == 'EXIT':
+            status = 'FAIL'
+            error_msg = "LSF job exited with error"
+            if job_info.get('exit_code') is not None:
+                error_msg += f" (exit code {job_info['exit_code']})"
+            uvm_errors = 0
+            uvm_fatals = 0
+        else:
+            # Analyze log file for actual test result
+            if _find_log(log_file):
+                with _open_log(log_file) as f:
+                    log_content = f.read()
+                status, error_msg, uvm_errors, uvm_fatals = self._analyze_test_result(log_file, log_content)
+            else:
+                status = 'ERROR'
+                error_msg = "Log file not found"
+                uvm_errors = 0
+                uvm_fatals = 0
+        
+        # A failed compile leaves no simv, so the job usually EXITs: the log tells
+        if status in ('FAIL', 'ERROR'):
+            build_error = self._compile_failure(log_file, log_content or None)
+            if build_error:
+                status, error_msg = 'BUILD_ERROR', f"Compile error: {build_error}"
+        
+        timestamps = self._read_lsf_phase_stamps(job_info, log_content)
+        timestamps['analyzed'] = time.time()
+        
+        # Duration is execution time only: pending time is the 'queue' phase
+        end_time = timestamps.get('sim_end', job_info.get('end_time', time.time()))
+        duration = end_time - timestamps.get('started', job_info['submit_time'])
+        
+        result = TestResult(
+            name=test_name,
+            status=status,
+            duration=duration,
+            log_file=str(log_file),
+            error_msg=error_msg,
+            folder_id=folder_id,
+            uvm_errors=uvm_errors,
+            uvm_fatals=uvm_fatals,
+            seed=job_info.get('seed'),
+            command_add=job_info.get('command_add'),
+            base_name=job_info.get('base_name', test_name),
+            run_number=job_info.get('run_number', 1),
+            test_group=job_info.get('test_group'),
+            host=job_info.get('exec_host'),
+            timestamps=timestamps,
+            peak_mem_mb=job_info.get('peak_mem_mb'),
+            cpu_time_s=job_info.get('cpu_time_s')
+        )
+        
+        # Move coverage files if coverage collection is enabled
+        if self.coverage and test_name not in self._rerun_names:
+            self._copy_coverage_files(test_name, folder_path, folder_id)
+        
+        self._update_progress(result)
+        if status == 'BUILD_ERROR':
+            self._drop_pending_lsf_builds()
+    
+    def _drop_pending_lsf_builds(self):
+        """bkill jobs still pending in LSF whose compile signature has already failed"""
+        for job_id, job_info in self.lsf_jobs.items():
+            if job_info.get('completed', False) or job_info.get('status') not in (None, 'PEND'):
+                continue
+            if self._compile_signature(job_info.get('command_add')) not in self.broken_builds:
+                continue
+            try:
+                subprocess.run(['bkill', str(job_id)], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            except subprocess.CalledProcessError:
+                continue  # already started or finished: it reports its own result
+            self._finish_lsf_job(job_id, 'BUILD_ERROR', time.time())
+            self._update_progress(self._build_error_result(dict(job_info, name=job_info['test_name']),
+                                                           job_info['folder_id']))
+    
     def _folder_busy(self, folder_id):
         """True while some still-running LSF job owns this execution folder."""
         for job_info in self.lsf_jobs.values():
@@ -1981,6 +4532,14 @@ class RegressionRunner:
         # --max-parallel only ever sized the folder pool; in LSF mode it throttled
         # nothing, because LSF schedules submitted jobs independently of this process.
         # Holding a folder until its occupant finishes makes that flag mean what it says.
+        self.lsf_status_dir.mkdir(exist_ok=True)
+        self._last_lsf_fallback_poll = time.time()
+        # Called once per tier (see _run_tiers): wait for this batch's runs only
+        batch_end = self.completed_tests + len(tests)
+        if self._resume_lsf_jobs:
+            reattached = self._reattach_lsf_jobs({test_obj['name'] for test_obj in tests})
+            tests = [test_obj for test_obj in tests if test_obj['name'] not in reattached]
+        
         for i, test_obj in enumerate(tests):
             if self.stop_all.is_set():
                 break
@@ -1988,6 +4547,8 @@ class RegressionRunner:
             test_name = test_obj['name']
 
             # Wait for a free folder, servicing completions so folders are released.
+            # A completion seen while waiting can be the compile failure that makes
+            # this run pointless, so the build is checked once a folder is free.
             folder_id = None
             while folder_id is None and not self.stop_all.is_set():
                 for candidate in range(len(folders)):
@@ -1996,14 +4557,19 @@ class RegressionRunner:
                         break
                 if folder_id is None:
                     # _monitor_lsf_jobs() CONSUMES completions -- it returns each job id
-                    # exactly once and then marks it 'completed'. Buffer what we drain
-                    # here so the monitoring loop below still reports those results
-                    # instead of losing them.
-                    self._pending_completions.extend(self._monitor_lsf_jobs())
-                    time.sleep(5)
+                    # exactly once and then marks it 'completed' -- so report them here
+                    # rather than leaving them for the monitoring loop below.
+                    for job_id in self._monitor_lsf_jobs():
+                        self._process_lsf_completion(job_id)
+                    time.sleep(LSF_STATUS_SCAN_INTERVAL)
             if folder_id is None:
                 break
 
+            build_error_result = self._build_error_result(test_obj)
+            if build_error_result:
+                self._update_progress(build_error_result)
+                continue
+
             folder_path = folders[folder_id]
 
             try:
@@ -2031,9 +4597,8 @@ class RegressionRunner:
         
         # Monitor jobs until completion
         last_status_update = time.time()
-        while self.completed_tests < self.total_tests and not self.stop_all.is_set():
-            completed_job_ids = self._pending_completions + self._monitor_lsf_jobs()
-            self._pending_completions = []
+        while self.completed_tests < batch_end and not self.stop_all.is_set():
+            completed_job_ids = self._monitor_lsf_jobs()
             
             # Update LSF status every 10 seconds
             if time.time() - last_status_update >= 10:
@@ -2042,70 +4607,12 @@ class RegressionRunner:
             
             # Process completed jobs
             for job_id in completed_job_ids:
-                job_info = self.lsf_jobs[job_id]
-                test_name = job_info['test_name']
-                folder_path = job_info['folder_path']
-                folder_id = job_info['folder_id']
-                
-                # Calculate duration
-                duration = job_info.get('end_time', time.time()) - job_info['submit_time']
-                
-                # Analyze results
-                log_file = folder_path / f"{test_name}.log"
-                if job_info['status'] == 'TIMEOUT':
-                    status = 'TIMEOUT'
-                    error_msg = f"LSF job timed out after {self.timeout}s"
-                    uvm_errors = 0
-                    uvm_fatals = 0
-                elif job_info['status'] == 'EXIT':
-                    status = 'FAIL'
-                    error_msg = "LSF job exited with error"
-                    uvm_errors = 0
-                    uvm_fatals = 0
-                else:
-                    # Analyze log file for actual test result
-                    if log_file.exists():
-                        with open(log_file, 'r') as f:
-                            log_content = f.read()
-                        status, error_msg, uvm_errors, uvm_fatals = self._analyze_test_result(log_file, log_content)
-                    else:
-                        status = 'ERROR'
-                        error_msg = "Log file not found"
-                        uvm_errors = 0
-                        uvm_fatals = 0
-                
-                result = TestResult(
-                    name=test_name,
-                    status=status,
-                    duration=duration,
-                    log_file=str(log_file),
-                    error_msg=error_msg,
-                    folder_id=folder_id,
-                    uvm_errors=uvm_errors,
-                    uvm_fatals=uvm_fatals,
-                    seed=job_info.get('seed'),
-                    command_add=job_info.get('command_add'),
-                    base_name=job_info.get('base_name', test_name),
-                    run_number=job_info.get('run_number', 1),
-                    test_group=job_info.get('test_group')
-                )
-                
-                # Copy coverage files if coverage collection is enabled
-                if self.coverage:
-                    self._copy_coverage_files(test_name, folder_path, folder_id)
-                
-                self._update_progress(result)
+                self._process_lsf_completion(job_id)
             
             # Sleep briefly before next monitoring cycle
-            if self.completed_tests < self.total_tests:
-                time.sleep(2)
-        
-        # Copy all logs to logs folder and print summary
-        self._copy_all_logs_to_logs_folder()
-        exit_code = self._print_summary()
-        if exit_code == 0:
-            self._regression_success = True
-        return exit_code
+            if self.completed_tests < batch_end:
+                time.sleep(LSF_STATUS_SCAN_INTERVAL)
+
     
     def _run_local_regression(self, tests, folders):
         """Run regression using local parallel execution with proper folder management"""
@@ -2122,7 +4629,12 @@ class RegressionRunner:
                     break
                 
                 test_name = test_obj['name']
-                
+
+                build_error_result = self._build_error_result(test_obj)
+                if build_error_result:
+                    self._update_progress(build_error_result)
+                    continue
+
                 # Ensure thorough cleanup before starting new test
                 self._cleanup_vcs_artifacts(folder_path)
                 self._cleanup_old_logs(folder_path, test_name)
@@ -2172,7 +4684,12 @@ class RegressionRunner:
                             if not pending_tests:
                                 return None
                             test_obj = pending_tests.pop(0)
-                        
+
+                        build_error_result = self._build_error_result(test_obj)
+                        if build_error_result:
+                            self._update_progress(build_error_result)
+                            continue
+
                         test_name = test_obj['name']
                         
                         # Wait for available folder
@@ -2243,13 +4760,306 @@ class RegressionRunner:
                         # Submit next test
                         submit_test_when_folder_available()
                         break
+
+    def _run_distributed_regression(self, tests, folders):
+        """Run regression on workers that pull the runs from this process (--serve)
+
+        The runs wait in a queue; every worker connection takes one at a time, runs it
+        on its own host and sends back the result record and the log, which go through
+        _update_progress like a local run. A run whose worker disconnects or stops
+        sending heartbeats goes back to the front of the queue for the next worker.
+        """
+        if self._worker_server is None:
+            # Workers must build the same testbench (see _serve_worker)
+            self._worker_build_hash = self._build_hash(portable=True)
+            self._start_worker_server()
+        batch_end = self.completed_tests + len(tests)
+        queued_at = time.time()
+        with self._worker_lock:
+            for test_obj in tests:
+                test_obj['queued_at'] = queued_at
+                self._worker_queue.append(test_obj)
+        
+        last_status = time.time()
+        while self.completed_tests < batch_end and not self.stop_all.is_set():
+            time.sleep(0.5)
+            if time.time() - last_status >= 60:
+                last_status = time.time()
+                with self._worker_lock:
+                    print(f"🛰️  Workers: {len(self._worker_hosts)} connected, {len(self._worker_leases)} running, "
+                          f"{len(self._worker_queue)} queued")
+    
+    def _release_workers(self):
+        """Tell the workers the regression is over and give them a moment to disconnect"""
+        self._workers_released = True
+        deadline = time.time() + WORKER_IDLE_POLL * 3
+        while self._worker_hosts and time.time() < deadline:
+            time.sleep(0.1)
+        self._worker_server.close()
+    
+    def _start_worker_server(self):
+        """Listen for workers and print the command that starts one"""
+        self._worker_server = socket.create_server(self.serve_address)
+        threading.Thread(target=self._accept_workers, daemon=True).start()
+        port = self._worker_server.getsockname()[1]
+        host = self.serve_address[0] or socket.getfqdn()
+        print(f"🛰️  Serving runs to workers on port {port}; start workers (one slot per -p) with:")
+        print(f"   python3 axi4_regression.py --worker {host}:{port} --token {self.worker_token} -p <slots>")
+        if self.coverage:
+            print(f"⚠️  Warning: Coverage databases stay in the workers' coverage_collect folders; merge them there")
+        if self.fsdb_dump:
+            print(f"⚠️  Warning: Waves stay in the workers' waves folders")
+    
+    def _accept_workers(self):
+        """Serve every worker connection on its own thread"""
+        while True:
+            try:
+                conn, peer = self._worker_server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_worker, args=(conn, peer), daemon=True).start()
+    
+    def _next_worker_test(self):
+        """Pop the next run to hand out, reporting those of broken builds as BUILD_ERROR"""
+        while True:
+            with self._worker_lock:
+                if not self._worker_queue:
+                    return None
+                test_obj = self._worker_queue.popleft()
+            build_error_result = self._build_error_result(test_obj)
+            if build_error_result:
+                self._update_progress(build_error_result)
+                continue
+            return test_obj
+    
+    def _serve_worker(self, conn, peer):
+        """Talk to one worker connection: hand out runs, take back results and heartbeats"""
+        conn.settimeout(WORKER_LOST_TIMEOUT)
+        host = peer[0]
+        leased = None  # name of the run this connection is simulating
+        log_part = None  # where the leased run's 'log' frames are written
+        lost_reason = "disconnected"
+        try:
+            hello = _recv_frame(conn)
+            # Constant-time comparison, so response timing does not leak the token
+            presented = str(hello.get('token') or '').encode() if hello else b''
+            if not hello or hello.get('type') != 'hello' or not hmac.compare_digest(presented, self.worker_token.encode()):
+                _send_frame(conn, {'type': 'reject', 'reason': 'wrong or missing --token'})
+                print(f"⚠️  Warning: Rejected worker connection from {peer[0]} (wrong token)")
+                return
+            host = hello.get('host') or peer[0]
+            if self._worker_build_hash is not None and hello.get('build_hash') != self._worker_build_hash:
+                # Its results would be for another testbench than the one this regression covers
+                _send_frame(conn, {'type': 'reject', 'reason': f"testbench differs from the coordinator's "
+                                   f"(build hash {hello.get('build_hash')} != {self._worker_build_hash})"})
+                print(f"⚠️  Warning: Rejected worker {host}: its testbench differs from this checkout")
+                return
+            _send_frame(conn, {'type': 'welcome', 'fsdb_dump': self.fsdb_dump, 'coverage': self.coverage,
+                               'verbosity': self.verbosity})
+            with self._worker_lock:
+                self._worker_hosts[conn] = host
+            if self.verbose:
+                print(f"🛰️  Worker connected: {host} slot {hello.get('slot')}")
+            
+            while True:
+                message = _recv_frame(conn)
+                if message is None:
+                    break
+                kind = message.get('type')
+                if kind == 'heartbeat':
+                    continue
+                if kind == 'get':
+                    test_obj = None if self.stop_all.is_set() else self._next_worker_test()
+                    if test_obj is None:
+                        if self._workers_released or self.stop_all.is_set():
+                            _send_frame(conn, {'type': 'done'})
+                            lost_reason = None
+                            break
+                        _send_frame(conn, {'type': 'wait', 'seconds': WORKER_IDLE_POLL})
+                        continue
+                    with self._worker_lock:
+                        self._worker_leases[test_obj['name']] = test_obj
+                    leased = test_obj['name']
+                    _send_frame(conn, {'type': 'test', 'test': test_obj})
+                elif kind == 'log':
+                    if message.get('name') == leased:
+                        if log_part is None:
+                            log_part = open(self.no_pass_logs_folder / f".{leased}.log.part", 'w')
+                        log_part.write(message.get('data', ''))
+                elif kind == 'result':
+                    if message.get('record', {}).get('name') == leased:
+                        with self._worker_lock:
+                            self._worker_leases.pop(leased, None)
+                        leased = None
+                        received_log = None
+                        if log_part is not None:
+                            log_part.close()
+                            received_log, log_part = Path(log_part.name), None
+                        self._accept_worker_result(message, host, received_log)
+                    _send_frame(conn, {'type': 'ack'})
+        except socket.timeout:
+            lost_reason = f"no heartbeat for {WORKER_LOST_TIMEOUT}s"
+        except (OSError, ValueError) as e:
+            lost_reason = f"connection error: {e}"
+        finally:
+            conn.close()
+            if log_part is not None:
+                log_part.close()
+                Path(log_part.name).unlink(missing_ok=True)
+            with self._worker_lock:
+                self._worker_hosts.pop(conn, None)
+                test_obj = self._worker_leases.pop(leased, None) if leased else None
+                if test_obj is not None:
+                    self._worker_queue.appendleft(test_obj)
+                    self.requeued_tests += 1
+            if test_obj is not None and not self.stop_all.is_set():
+                print(f"🔁 Worker {host} lost ({lost_reason}), requeued {leased}")
+    
+    def _accept_worker_result(self, message, host, received_log):
+        """Archive the log a worker sent back (received_log, if any) and record its result"""
+        result = TestResult.from_record(message['record'])
+        result.host = result.host or host
+        target_folder = self.pass_logs_folder if result.status == 'PASS' else self.no_pass_logs_folder
+        target_log = target_folder / f"{result.name}.log"
+        if received_log is not None:
+            move_path(received_log, target_log)
+            result.log_file = str(target_log)
+        self._update_progress(result)
+    
+    def run_worker(self, address, token):
+        """Pull runs from a coordinator (--serve) and simulate them on this host (--worker)
+
+        Every slot (-p) holds its own connection and runs one test at a time in its own
+        run folder. Results and logs go back to the coordinator, so this host's results
+        folder is only a work area, removed on exit unless it holds coverage or waves.
+        """
+        self.max_parallel = self.max_parallel or 1
+        self.total_tests = self.max_parallel
+        self.start_time = time.time()
+        self._worker_failed = False
+        print(f"🛰️  Worker {self.hostname}: {self.max_parallel} slot(s) for coordinator {address[0]}:{address[1]}")
+        self._claim_results_folder()
+        folders = self._setup_test_folders()
+        # Presented in every hello: the coordinator turns away a worker building another testbench
+        self._worker_build_hash = self._build_hash(portable=True)
+        
+        slots = [threading.Thread(target=self._worker_slot, args=(address, token, folder_id, folder_path), daemon=True)
+                 for folder_id, folder_path in enumerate(folders)]
+        for slot in slots:
+            slot.start()
+        while any(slot.is_alive() for slot in slots):
+            time.sleep(0.5)
+        
+        print(f"🏁 Worker finished: {self.completed_tests} runs simulated "
+              f"({self.passed_tests} passed, {self.failed_tests} not passed)")
+        if self._results_stream:
+            self._results_stream.close()
+        kept = [folder for folder in (self.coverage_folder, self.waves_folder)
+                if folder and folder.exists() and any(folder.iterdir())]
+        if kept:
+            self._cleanup_all_folders()
+            for folder in kept:
+                print(f"📊 Kept on this worker: {self._to_relative_path(folder)}")
+        else:
+            shutil.rmtree(self.results_folder, ignore_errors=True)
+        return 1 if self._worker_failed else 0
+    
+    def _worker_slot(self, address, token, folder_id, folder_path):
+        """One worker slot: ask for a run, simulate it, send back the record and log, repeat"""
+        coordinator = f"{address[0]}:{address[1]}"
+        try:
+            conn = socket.create_connection(address, timeout=WORKER_LOST_TIMEOUT)
+        except OSError as e:
+            print(f"❌ Error: Cannot reach coordinator {coordinator}: {e}")
+            self._worker_failed = True
+            return
+        send_lock = threading.Lock()
+        
+        def send(message):
+            with send_lock:
+                _send_frame(conn, message)
+        
+        def heartbeat(done):
+            # Keeps the lease of the running test while VCS is busy
+            while not done.wait(WORKER_HEARTBEAT_INTERVAL):
+                try:
+                    send({'type': 'heartbeat'})
+                except OSError:
+                    return
         
-        # Copy all logs to logs folder and print summary
-        self._copy_all_logs_to_logs_folder()
-        exit_code = self._print_summary()
-        if exit_code == 0:
-            self._regression_success = True
-        return exit_code
+        try:
+            with conn:
+                send({'type': 'hello', 'token': token, 'host': self.hostname, 'slot': folder_id,
+                      'build_hash': self._worker_build_hash})
+                welcome = _recv_frame(conn)
+                if not welcome or welcome.get('type') != 'welcome':
+                    reason = welcome.get('reason') if welcome else 'connection closed'
+                    print(f"❌ Error: Coordinator {coordinator} refused this worker: {reason}")
+                    self._worker_failed = True
+                    return
+                # Waves, coverage and verbosity follow the coordinator's options
+                self.fsdb_dump = welcome.get('fsdb_dump', False)
+                self.verbosity = welcome.get('verbosity', self.verbosity)
+                if welcome.get('coverage') and not self.coverage:
+                    self.coverage = True
+                    self.coverage_folder = self.results_folder / "coverage_collect"
+                    self.coverage_folder.mkdir(exist_ok=True)
+                
+                while not self.stop_all.is_set():
+                    send({'type': 'get'})
+                    message = _recv_frame(conn)
+                    if message is None or message.get('type') == 'done':
+                        break
+                    if message.get('type') == 'wait':
+                        time.sleep(message.get('seconds', WORKER_IDLE_POLL))
+                        continue
+                    
+                    test_obj = message['test']
+                    done = threading.Event()
+                    beat = threading.Thread(target=heartbeat, args=(done,), daemon=True)
+                    beat.start()
+                    try:
+                        result = self._run_single_test(test_obj, folder_path, folder_id)
+                    except Exception as e:
+                        result = TestResult(
+                            name=test_obj['name'],
+                            status='ERROR',
+                            duration=0.0,
+                            log_file='',
+                            error_msg=f"Worker execution error: {str(e)}",
+                            folder_id=folder_id,
+                            seed=test_obj.get('seed'),
+                            command_add=test_obj.get('command_add'),
+                            base_name=test_obj.get('base_name', test_obj['name']),
+                            run_number=test_obj.get('run_number', 1),
+                            test_group=test_obj.get('test_group'),
+                            host=self.hostname
+                        )
+                    finally:
+                        done.set()
+                        beat.join()
+                        self.running_tests.pop(test_obj['name'], None)
+                    
+                    if result.log_file and Path(result.log_file).is_file():
+                        with open(result.log_file, 'r', errors='replace') as f:
+                            for chunk in iter(lambda: f.read(WORKER_LOG_CHUNK_CHARS), ''):
+                                send({'type': 'log', 'name': result.name, 'data': chunk})
+                    send({'type': 'result', 'record': result.to_record()})
+                    if _recv_frame(conn) is None:
+                        print(f"⚠️  Warning: Coordinator {coordinator} closed before acknowledging {result.name}")
+                        break
+                    
+                    with self.results_lock:
+                        self.completed_tests += 1
+                        if result.status == 'PASS':
+                            self.passed_tests += 1
+                        else:
+                            self.failed_tests += 1
+                    print(f"{'✅' if result.status == 'PASS' else '❌'} [slot {folder_id:02d}] "
+                          f"{result.name:50s} {result.status} ({result.duration:6.1f}s) → {coordinator}")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Warning: Lost coordinator {coordinator}: {e}")
+
 
 
 def main():
@@ -2267,6 +5077,18 @@ Examples:
   python3 axi4_regression.py --cov                # Enable coverage collection
   python3 axi4_regression.py --lsf                # Use LSF job submission
   python3 axi4_regression.py --lsf -p 10 --cov    # LSF mode with coverage and 10 parallel jobs
+  python3 axi4_regression.py --triage-fsdb        # Waves only for the triage_rerun_list representatives
+  python3 axi4_regression.py --resume regression_result_20260803_130501  # Continue an interrupted run
+  python3 axi4_regression.py --test-list regression_result_20260803_130501/no_pass_list --no-cache
+  python3 axi4_regression.py --lsf --smoke-threshold 100  # Release tier>0 only if every tier=0 run passes
+  python3 axi4_regression.py --scratch-dir /local/tmp      # Compile and simulate on local disk, copy back logs
+  python3 axi4_regression.py --seed-base 1 --lsf          # Same seeds every night: unchanged runs come from the cache
+  python3 axi4_regression.py --low-verbosity --rerun-verbosity HIGH  # UVM_LOW pass, verbose reruns of failures
+  python3 axi4_regression.py --rerun-fsdb         # Rerun failures with waves around the first UVM_ERROR
+  python3 axi4_regression.py --lsf --compress-logs        # Archive logs as .log.zst (or .log.gz without zstd)
+  python3 axi4_regression.py --lsf --metrics 9464        # Prometheus/JSON progress at :9464/metrics
+  python3 axi4_regression.py --serve 7070                  # Coordinator: workers on other hosts run the tests
+  python3 axi4_regression.py --worker simhost01:7070 --token <token> -p 8  # Worker with 8 slots
         """
     )
     
@@ -2280,8 +5102,9 @@ Examples:
     parser.add_argument(
         '--timeout', '-t',
         type=int,
-        default=600,
-        help='Timeout for each test in seconds (default: 600)'
+        default=None,
+        help='Timeout in seconds for tests without enough duration history; tests with history '
+             'get p99 of their recorded durations x3 (default: 600)'
     )
     
     parser.add_argument(
@@ -2298,8 +5121,8 @@ Examples:
     
     parser.add_argument(
         '--test-list',
-        default='axi4_transfers_regression.list',
-        help='Path to test list file (default: axi4_transfers_regression.list)'
+        default=None,
+        help='Path to test list file (default: axi4_transfers_regression.list, or the list of the resumed run)'
     )
     
     parser.add_argument(
@@ -2314,6 +5137,128 @@ Examples:
         help='Enable coverage collection (function and code coverage) with VCS -cm options'
     )
     
+    parser.add_argument(
+        '--triage-fsdb',
+        action='store_true',
+        help='Add +define+DUMP_FSDB to the entries of the generated triage_rerun_list (default: disabled)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='REGRESSION_RESULT_DIR',
+        default=None,
+        help='Continue an interrupted regression: skip runs that already have a verdict in its results.jsonl '
+             'and, in LSF mode, re-attach to its still-known jobs'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Simulate every run even if regression_cache/ holds a verdict for the same build, test, '
+             'seed and plusargs (fresh results still refresh the cache)'
+    )
+    
+    parser.add_argument(
+        '--smoke-threshold',
+        type=float,
+        default=90.0,
+        metavar='PERCENT',
+        help='Pass rate the tier=0 smoke runs need before the other tiers are started (default: 90)'
+    )
+    
+    parser.add_argument(
+        '--scratch-dir',
+        metavar='DIR',
+        help='Run VCS in DIR/axi4_regression_<timestamp>/<test> (node-local disk or tmpfs) and copy '
+             'back only the log, coverage vdb and waves (default: $TMPDIR of the LSF job in LSF mode, '
+             'run folders otherwise)'
+    )
+    
+    parser.add_argument(
+        '--no-scratch',
+        action='store_true',
+        help='Run VCS in the run folders even in LSF mode'
+    )
+    
+    parser.add_argument(
+        '--fixed-timeout',
+        action='store_true',
+        help='Ignore duration history for timeouts: every test gets --timeout, still raised to 1h '
+             'for timeout-scenario and 30min for stress/burn-in tests by name'
+    )
+    
+    parser.add_argument(
+        '--serve',
+        metavar='[HOST:]PORT',
+        help='Coordinator mode: serve the runs to --worker processes on other hosts over TCP instead of '
+             'running them here (HOST defaults to all interfaces, PORT 0 picks a free one)'
+    )
+    
+    parser.add_argument(
+        '--worker',
+        metavar='HOST:PORT',
+        help='Worker mode: run tests pulled from the --serve coordinator at HOST:PORT, -p at a time '
+             '(default: 1), from this host\'s checkout'
+    )
+    
+    parser.add_argument(
+        '--token',
+        help='Shared secret workers present to the coordinator (default: a random one, printed by --serve)'
+    )
+    
+    parser.add_argument(
+        '--no-test-check',
+        action='store_true',
+        help='Skip the pre-flight check that every test name is registered (uvm_component_utils) in test/*.sv'
+    )
+    
+    parser.add_argument(
+        '--seed-base',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Derive the seed of every run without seed= from N, the test name, run number and '
+             'command_add, so the same list and N always give the same seeds (default: random seeds)'
+    )
+    
+    parser.add_argument(
+        '--compress-logs',
+        nargs='?',
+        const='auto',
+        choices=['auto', 'gzip', 'zstd'],
+        default=None,
+        help='Compress pass_logs/no_pass_logs in the background once each verdict is in: '
+             '<run>.log.gz, or <run>.log.zst with zstd (auto: zstd if installed) (default: plain logs)'
+    )
+    
+    parser.add_argument(
+        '--low-verbosity',
+        action='store_true',
+        help='Run at +UVM_VERBOSITY=LOW and rerun every FAIL/TIMEOUT once, with the same seed, at '
+             '--rerun-verbosity; reruns are linked to the failed runs in the results (default: every run at MEDIUM)'
+    )
+    
+    parser.add_argument(
+        '--rerun-verbosity',
+        choices=['MEDIUM', 'HIGH', 'FULL', 'DEBUG'],
+        default=None,
+        help='UVM verbosity of the --low-verbosity/--rerun-fsdb reruns (default: MEDIUM)'
+    )
+    
+    parser.add_argument(
+        '--rerun-fsdb',
+        action='store_true',
+        help='Rerun every FAIL/TIMEOUT once, with the same seed, with +define+DUMP_FSDB, dumping hdl_top '
+             'only around the first UVM_ERROR/UVM_FATAL (also the --low-verbosity reruns) (default: disabled)'
+    )
+    
+    parser.add_argument(
+        '--metrics',
+        metavar='[HOST:]PORT',
+        help='Serve live progress over HTTP while the regression runs: /metrics in Prometheus text format, '
+             '/metrics.json as a JSON snapshot (HOST defaults to all interfaces, PORT 0 picks a free one)'
+    )
+    
     args = parser.parse_args()
     
     # Validate arguments
@@ -2321,10 +5266,100 @@ Examples:
         print("❌ Error: max-parallel must be between 1 and 50")
         return 1
     
-    if args.timeout < 60:
+    if args.timeout is not None and args.timeout < 60:
         print("❌ Error: timeout must be at least 60 seconds")
         return 1
     
+    if args.seed_base is not None and not 0 <= args.seed_base <= 2**31-1:
+        print("❌ Error: seed-base must be between 0 and 2^31-1")
+        return 1
+    
+    if args.rerun_verbosity and not (args.low_verbosity or args.rerun_fsdb) and not args.resume:
+        print("⚠️  Warning: --rerun-verbosity only applies with --low-verbosity or --rerun-fsdb")
+    
+    compress_logs = args.compress_logs
+    if compress_logs == 'auto':
+        compress_logs = 'zstd' if shutil.which('zstd') else 'gzip'
+    elif compress_logs == 'zstd' and not shutil.which('zstd'):
+        print("⚠️  Warning: zstd command not found, compressing logs with gzip")
+        compress_logs = 'gzip'
+    
+    if not 0 <= args.smoke_threshold <= 100:
+        print("❌ Error: smoke-threshold must be between 0 and 100")
+        return 1
+    
+    serve_address = None
+    if args.serve is not None or args.worker is not None:
+        host, _, port = (args.worker or args.serve).rpartition(':')
+        if not port.isdigit() or (args.worker and not host):
+            print(f"❌ Error: Expected {'HOST:PORT' if args.worker else '[HOST:]PORT'}, got: {args.worker or args.serve}")
+            return 1
+        if args.serve is not None and args.worker is not None:
+            print("❌ Error: --serve and --worker are exclusive")
+            return 1
+        if args.serve is not None and args.lsf:
+            print("❌ Error: --serve and --lsf are exclusive")
+            return 1
+        serve_address = (host, int(port))
+    
+    metrics_address = None
+    if args.metrics is not None:
+        host, _, port = args.metrics.rpartition(':')
+        if not port.isdigit():
+            print(f"❌ Error: Expected [HOST:]PORT for --metrics, got: {args.metrics}")
+            return 1
+        if args.worker:
+            print("⚠️  Warning: --metrics is served by the coordinator, not by workers")
+        metrics_address = (host, int(port))
+    
+    if args.worker:
+        if not args.token:
+            print("❌ Error: --worker needs the --token printed by the coordinator")
+            return 1
+        runner = RegressionRunner(
+            max_parallel=args.max_parallel or 1,
+            timeout=args.timeout or 600,
+            verbose=args.verbose,
+            use_cache=False,
+            scratch_dir=args.scratch_dir,
+            use_scratch=not args.no_scratch
+        )
+        try:
+            return runner.run_worker(serve_address, args.token)
+        except KeyboardInterrupt:
+            print("\n⚠️  Worker interrupted by user")
+            return 1
+    
+    # A resumed run defaults to the list (and execution mode) it was started with
+    if args.resume:
+        state_file = Path(args.resume) / "regression_state.json"
+        if not state_file.exists():
+            print(f"❌ Error: Not a resumable regression folder (no {state_file.name}): {args.resume}")
+            return 1
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+        if args.test_list is None:
+            args.test_list = state.get('test_list')
+        args.lsf = args.lsf or state.get('use_lsf', False)
+        if args.max_parallel is None:
+            args.max_parallel = state.get('max_parallel')
+        if args.timeout is None:
+            args.timeout = state.get('timeout')
+        args.fsdb_dump = args.fsdb_dump or state.get('fsdb_dump', False)
+        args.cov = args.cov or state.get('coverage', False)
+        if args.seed_base is None:
+            args.seed_base = state.get('seed_base')
+        args.low_verbosity = args.low_verbosity or state.get('low_verbosity', False)
+        if args.rerun_verbosity is None:
+            args.rerun_verbosity = state.get('rerun_verbosity')
+        args.rerun_fsdb = args.rerun_fsdb or state.get('rerun_fsdb', False)
+        if args.compress_logs is None:
+            compress_logs = state.get('compress_logs')
+    if args.test_list is None:
+        args.test_list = 'axi4_transfers_regression.list'
+    if args.timeout is None:
+        args.timeout = 600
+    
     # Check if test list file exists
     test_list_path = Path(args.test_list)
     if not test_list_path.exists():
@@ -2338,7 +5373,23 @@ Examples:
         verbose=args.verbose,
         use_lsf=args.lsf,
         fsdb_dump=args.fsdb_dump,
-        coverage=args.cov
+        coverage=args.cov,
+        triage_fsdb=args.triage_fsdb,
+        resume_dir=args.resume,
+        use_cache=not args.no_cache,
+        smoke_threshold=args.smoke_threshold,
+        history_timeouts=not args.fixed_timeout,
+        scratch_dir=args.scratch_dir,
+        use_scratch=not args.no_scratch,
+        serve_address=serve_address,
+        worker_token=args.token,
+        compress_logs=compress_logs,
+        check_test_names=not args.no_test_check,
+        seed_base=args.seed_base,
+        low_verbosity=args.low_verbosity,
+        rerun_verbosity=args.rerun_verbosity or 'MEDIUM',
+        rerun_fsdb=args.rerun_fsdb,
+        metrics_address=metrics_address
     )
     
     try:
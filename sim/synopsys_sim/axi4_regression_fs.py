@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+AXI4 Regression File Placement
+==============================
+
+How the regression runners (axi4_regression.py, axi4_regression_makefile.py and
+axi4_regression_makefile_runfolder.py) put logs, coverage databases and waves into
+place without ever exposing a half-written file:
+- move_path  a rename on one filesystem, else a copy under a temporary name that is
+             renamed into place before the source is deleted
+- link_path  for files that must also stay where they are: a hardlink, else a copy,
+             renamed into place the same way
+"""
+
+import os
+import errno
+import shutil
+from pathlib import Path
+
+
+def move_path(source, target):
+    """Move a file or directory to target: a rename on one filesystem, else copy then delete
+
+    Across filesystems the copy is written under a temporary name next to target and
+    renamed into place, so target never appears half-written; the source goes last.
+    """
+    source, target = Path(source), Path(target)
+    try:
+        os.replace(source, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    tmp_target = target.with_name(f".{target.name}.{os.getpid()}")
+    try:
+        if source.is_dir():
+            shutil.copytree(source, tmp_target, symlinks=True)
+        else:
+            shutil.copy2(source, tmp_target)
+        os.replace(tmp_target, target)
+    except BaseException:
+        if tmp_target.is_dir():
+            shutil.rmtree(tmp_target, ignore_errors=True)
+        else:
+            tmp_target.unlink(missing_ok=True)
+        raise
+    if source.is_dir():
+        shutil.rmtree(source)
+    else:
+        source.unlink()
+
+
+def link_path(source, target):
+    """Place a file that must also stay at source: hardlink it to target, copy across filesystems"""
+    source, target = Path(source), Path(target)
+    tmp_target = target.with_name(f".{target.name}.{os.getpid()}")
+    tmp_target.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_target)
+    except OSError:
+        shutil.copy2(source, tmp_target)
+    os.replace(tmp_target, target)
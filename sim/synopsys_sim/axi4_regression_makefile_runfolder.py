@@ -46,6 +46,10 @@ from datetime import datetime, timedelta
 import signal
 import json
 
+# Composed lists (include/exclude/filter) resolve exactly as in the main runner
+from axi4_regression import TestListComposer
+from axi4_regression_fs import move_path
+
 
 class TestResult:
     """Container for test execution results"""
@@ -75,6 +79,8 @@ class RegressionRunner:
         self.log_wait_timeout = log_wait_timeout  # Configurable log file wait timeout
         self.cleanup_delay = cleanup_delay  # Configurable delay after cleanup
         self.base_dir = Path.cwd()
+        self.list_composer = TestListComposer(self.base_dir.parent.parent / 'doc' / 'testcase_matrix.csv',
+                                              self.base_dir / ".test_list_cache.json")
         self.results = []
         self.stop_all = threading.Event()
         
@@ -193,17 +199,14 @@ class RegressionRunner:
         - testname seed=123                        (run once with custom seed)
         - testname command_add=+define+XXX         (run once with custom VCS command)
         - testname run_cnt=N seed=123 command_add=+define+XXX  (combine parameters)
+        - include/exclude/filter directives        (composed lists, see TestListComposer)
         """
-        tests = []
         expanded_tests = []
         try:
-            with open(test_list_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if line and not line.startswith('#'):
-                        tests.append(line)
-            
+            tests, composed = self.list_composer.compose(test_list_file)
+            if composed:
+                print(f"📋 Composed {len(tests)} entries from {test_list_file} ({composed})")
+        
             if not tests:
                 raise ValueError(f"No tests found in {test_list_file}")
             
@@ -877,22 +880,22 @@ class RegressionRunner:
             # Create unique coverage directory name in collection folder
             dest_coverage_dir = self.coverage_folder / f"{test_name}_cov_{folder_id:02d}.vdb"
             
-            # Copy coverage database to collection folder
-            # Handle compatibility with older Python versions
+            # Move coverage database to collection folder (the run folder is
+            # archived and removed before its next test)
             if dest_coverage_dir.exists():
                 shutil.rmtree(dest_coverage_dir)
-            shutil.copytree(coverage_dir, dest_coverage_dir)
+            move_path(coverage_dir, dest_coverage_dir)
             
             if self.verbose:
-                print(f"📊 [Folder {folder_id:02d}] Copied coverage data: {coverage_dir.name} -> {dest_coverage_dir.name}")
+                print(f"📊 [Folder {folder_id:02d}] Moved coverage data: {coverage_dir.name} -> {dest_coverage_dir.name}")
             
-            # Also copy any additional coverage files (like .cm files if they exist)
+            # Also move any additional coverage files (like .cm files if they exist)
             for pattern in ['*.cm', '*.ucm', '*.ccf']:
                 for coverage_file in folder_path.glob(pattern):
                     dest_file = self.coverage_folder / f"{test_name}_{coverage_file.name}"
-                    shutil.copy2(coverage_file, dest_file)
+                    move_path(coverage_file, dest_file)
                     if self.verbose:
-                        print(f"📊 [Folder {folder_id:02d}] Copied coverage file: {coverage_file.name}")
+                        print(f"📊 [Folder {folder_id:02d}] Moved coverage file: {coverage_file.name}")
                         
         except Exception as e:
             print(f"⚠️  Warning: Could not copy coverage files for {test_name}: {e}")
@@ -1149,8 +1152,8 @@ class RegressionRunner:
                 print(f"⚠️  [Folder {folder_id:02d}] Error verifying log completion: {e}")
             return False
 
-    def _copy_verified_log(self, log_file, target_folder, test_name, folder_id):
-        """Copy log file only after verifying it's complete with retry mechanism"""
+    def _move_verified_log(self, log_file, target_folder, test_name, folder_id):
+        """Move log file only after verifying it's complete with retry mechanism; returns its new path or None"""
         max_retries = 3
         retry_delay = 2.0
         
@@ -1164,9 +1167,9 @@ class RegressionRunner:
                         time.sleep(retry_delay)
                         continue
                     else:
-                        return False
+                        return None
                 
-                # Verify log file is complete before copying
+                # Verify log file is complete before moving
                 if not self._verify_log_completion(log_file, folder_id, test_name):
                     if self.verbose:
                         print(f"⚠️  [Folder {folder_id:02d}] Attempt {attempt+1}: Log file incomplete, waiting...")
@@ -1174,9 +1177,9 @@ class RegressionRunner:
                         time.sleep(retry_delay)
                         continue
                     else:
-                        # Copy anyway even if completion verification failed
+                        # Move anyway even if completion verification failed
                         if self.verbose:
-                            print(f"⚠️  [Folder {folder_id:02d}] Copying incomplete log file as final attempt")
+                            print(f"⚠️  [Folder {folder_id:02d}] Moving incomplete log file as final attempt")
                 
                 # Ensure log file is not empty and not being written to
                 file_size = log_file.stat().st_size
@@ -1187,7 +1190,7 @@ class RegressionRunner:
                         time.sleep(retry_delay)
                         continue
                     else:
-                        return False
+                        return None
                 
                 # Wait a bit then check if file size is stable (not being written to)
                 time.sleep(1.0)
@@ -1202,34 +1205,31 @@ class RegressionRunner:
                 # Create target directory if it doesn't exist
                 target_folder.mkdir(parents=True, exist_ok=True)
                 
-                # Copy the log file
+                # Move the log file (a rename when the run folder and logs share a filesystem)
                 target_file = target_folder / f"{test_name}.log"
-                shutil.copy2(log_file, target_file)
+                file_size = log_file.stat().st_size
+                move_path(log_file, target_file)
                 
-                # Verify the copy was successful
-                if target_file.exists() and target_file.stat().st_size == log_file.stat().st_size:
+                # Verify the move was successful
+                if target_file.exists() and target_file.stat().st_size == file_size:
                     if self.verbose:
-                        print(f"✅ [Folder {folder_id:02d}] Successfully copied log file ({log_file.stat().st_size} bytes)")
-                    return True
+                        print(f"✅ [Folder {folder_id:02d}] Successfully moved log file ({file_size} bytes)")
+                    return target_file
                 else:
                     if self.verbose:
-                        print(f"⚠️  [Folder {folder_id:02d}] Attempt {attempt+1}: Copy verification failed")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        return False
+                        print(f"⚠️  [Folder {folder_id:02d}] Attempt {attempt+1}: Move verification failed")
+                    return None
                         
             except Exception as e:
                 if self.verbose:
-                    print(f"⚠️  [Folder {folder_id:02d}] Attempt {attempt+1}: Error copying log file: {e}")
+                    print(f"⚠️  [Folder {folder_id:02d}] Attempt {attempt+1}: Error moving log file: {e}")
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     continue
                 else:
-                    return False
+                    return None
         
-        return False
+        return None
     
     def _comprehensive_cleanup_folder(self, folder_path, folder_id):
         """Remove and recreate folder ensuring previous test completion"""
@@ -1363,14 +1363,10 @@ class RegressionRunner:
             archive_name = f"run_folder_{folder_id:02d}_{timestamp}"
             archive_path = archive_base / archive_name
             
-            # Copy the entire folder to archive
-            try:
-                shutil.copytree(folder_path, archive_path)
-            except OSError:
-                # If destination exists, try to remove it first
-                if archive_path.exists():
-                    shutil.rmtree(archive_path)
-                shutil.copytree(folder_path, archive_path)
+            # Move the entire folder to archive (it is removed right after anyway)
+            if archive_path.exists():
+                shutil.rmtree(archive_path)
+            move_path(folder_path, archive_path)
             
             if self.verbose:
                 print(f"📦 [Folder {folder_id:02d}] Test data archived to {archive_path}")
@@ -1500,6 +1496,20 @@ class RegressionRunner:
         custom_seed = test_obj.get('seed')
         command_add = test_obj.get('command_add')
         
+        # Special handling for tests that intentionally take longer
+        # Near timeout tests need much longer timeout as they test timeout scenarios
+        test_timeout = self.timeout
+        if 'near_timeout' in test_name.lower() or 'timeout' in self._extract_base_test_name(test_name).lower():
+            # These tests intentionally test timeout scenarios and may take longer
+            test_timeout = 3600  # 1 hour timeout for timeout-related tests
+            if self.verbose:
+                print(f"📋 Extended timeout to {test_timeout}s for timeout-related test: {test_name}")
+        elif 'stress' in test_name.lower() or 'burnin' in test_name.lower():
+            # Stress tests may also take longer
+            test_timeout = 1800  # 30 minutes for stress tests
+            if self.verbose:
+                print(f"📋 Extended timeout to {test_timeout}s for stress test: {test_name}")
+        
         # Simple approach: just run the test without complex locking
         
         try:
@@ -1580,10 +1590,10 @@ class RegressionRunner:
             if self.verbose:
                 print(f"    Make command: {' '.join(make_cmd)} (using synopsys_sim/Makefile)")
 
-            # Change to the run folder before executing
-            original_dir = os.getcwd()
-            os.chdir(str(folder_path))
-            
+            # Run make in the run folder. Through cwd=, not os.chdir(): the working
+            # directory is shared by every worker thread, so a chdir here could start
+            # another thread's make in this folder.
+
             # SERIALIZE VCS STARTUP in parallel mode to prevent database corruption
             if self.max_parallel > 1:
                 with self.vcs_startup_lock:
@@ -1596,6 +1606,7 @@ class RegressionRunner:
                         stdout=subprocess.PIPE,
                         stderr=subprocess.STDOUT,
                         universal_newlines=True,
+                        cwd=str(folder_path),
                         preexec_fn=os.setsid  # Create new process group
                     )
                     
@@ -1626,6 +1637,7 @@ class RegressionRunner:
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     universal_newlines=True,
+                    cwd=str(folder_path),
                     preexec_fn=os.setsid  # Create new process group
                 )
             
@@ -1640,12 +1652,14 @@ class RegressionRunner:
                 # Enhanced log copying with completion verification
                 target_folder = self.pass_logs_folder if status == 'PASS' else self.no_pass_logs_folder
                 
-                # Copy log with verification and retry mechanism
-                if self._copy_verified_log(log_file, target_folder, test_name, folder_id):
+                # Move log with verification and retry mechanism; the result records where it went
+                archived_log = self._move_verified_log(log_file, target_folder, test_name, folder_id)
+                if archived_log:
+                    log_file = archived_log
                     if self.verbose:
-                        print(f"📋 Copied verified log to {target_folder.name}: {test_name}.log")
+                        print(f"📋 Moved verified log to {target_folder.name}: {test_name}.log")
                 else:
-                    print(f"⚠️  Warning: Could not copy verified log file for {test_name}")
+                    print(f"⚠️  Warning: Could not move verified log file for {test_name}")
                 
                 # Copy coverage files if coverage collection is enabled
                 if self.coverage:
@@ -1668,10 +1682,12 @@ class RegressionRunner:
                 duration = time.time() - start_time
                 timeout_msg = f"Test timed out after {test_timeout} seconds"
                 
-                # Copy log to no_pass_logs folder for timeout cases using enhanced mechanism
-                if not self._copy_verified_log(log_file, self.no_pass_logs_folder, test_name, folder_id):
-                    if self.verbose:
-                        print(f"⚠️  Warning: Could not copy verified log file for timeout case {test_name}")
+                # Move log to no_pass_logs folder for timeout cases using enhanced mechanism
+                archived_log = self._move_verified_log(log_file, self.no_pass_logs_folder, test_name, folder_id)
+                if archived_log:
+                    log_file = archived_log
+                elif self.verbose:
+                    print(f"⚠️  Warning: Could not move verified log file for timeout case {test_name}")
                 
                 return TestResult(
                     name=test_name,
@@ -1696,9 +1712,6 @@ class RegressionRunner:
                 seed=seed_value if 'seed_value' in locals() else None,
                 command_add=command_add
             )
-        finally:
-            # Always change back to original directory
-            os.chdir(original_dir)
 
     def _run_single_test(self, test_obj, folder_path, folder_id):
         """Simplified test execution without complex locking"""
@@ -1958,14 +1971,15 @@ class RegressionRunner:
                 print(f"    └─ Error: {test_result.error_msg}")
     
     def _ensure_log_copied(self, test_result):
-        """Ensure test log is copied to appropriate logs subfolder based on test status"""
+        """Ensure test log is in appropriate logs subfolder based on test status, and recorded as the result's log"""
         try:
             # Determine target folder based on test status
             target_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
             target_log = target_folder / f"{test_result.name}.log"
             
             if target_log.exists():
-                return  # Already copied
+                test_result.log_file = str(target_log)
+                return  # Already archived
             
             # Try to find the log file in various locations
             possible_locations = [
@@ -1979,18 +1993,23 @@ class RegressionRunner:
             
             for log_path in possible_locations:
                 if log_path and log_path.exists():
-                    shutil.copy2(log_path, target_log)
+                    move_path(log_path, target_log)
+                    test_result.log_file = str(target_log)
                     status_folder = "pass_logs" if test_result.status == 'PASS' else "no_pass_logs"
                     if self.verbose:
-                        print(f"📋 Copied log to {status_folder}: {test_result.name}.log")
+                        print(f"📋 Moved log to {status_folder}: {test_result.name}.log")
                     return
             
             print(f"⚠️  Warning: Could not find log file for {test_result.name}")
         except Exception as e:
-            print(f"⚠️  Warning: Error copying log for {test_result.name}: {e}")
+            print(f"⚠️  Warning: Error archiving log for {test_result.name}: {e}")
     
     def _copy_all_logs_to_logs_folder(self):
-        """Ensure all test logs are in appropriate pass_logs or no_pass_logs folders"""
+        """Ensure all test logs are in appropriate pass_logs or no_pass_logs folders
+
+        Logs are moved into place as each test completes and the result records the
+        path, so this only checks that each recorded log is where its status puts it.
+        """
         print(f"\n📋 Verifying log organization...")
         verified_count = 0
         missing_count = 0
@@ -1998,14 +2017,14 @@ class RegressionRunner:
         for test_result in self.results:
             # Determine target folder based on test status
             target_folder = self.pass_logs_folder if test_result.status == 'PASS' else self.no_pass_logs_folder
-            target_log = target_folder / f"{test_result.name}.log"
+            archived_log = Path(test_result.log_file) if test_result.log_file else None
             
             # Check if already properly organized
-            if target_log.exists():
+            if archived_log and archived_log.parent == target_folder and archived_log.is_file():
                 verified_count += 1
                 continue
             
-            # If not found, this indicates an issue with earlier copying
+            # If not found, this indicates an issue with earlier archiving
             missing_count += 1
             print(f"⚠️  Warning: Log not found in expected location for {test_result.name}")
         
@@ -2458,20 +2477,7 @@ class RegressionRunner:
                 
                 test_name = test_obj['name']
                 
-        
-        # Special handling for tests that intentionally take longer
-        # Near timeout tests need much longer timeout as they test timeout scenarios
-        test_timeout = self.timeout
-        if 'near_timeout' in test_name.lower() or 'timeout' in base_name.lower():
-            # These tests intentionally test timeout scenarios and may take longer
-            test_timeout = 3600  # 1 hour timeout for timeout-related tests
-            if self.verbose:
-                print(f"📋 Extended timeout to {test_timeout}s for timeout-related test: {test_name}")
-        elif 'stress' in test_name.lower() or 'burnin' in test_name.lower():
-            # Stress tests may also take longer
-            test_timeout = 1800  # 30 minutes for stress tests
-            if self.verbose:
-                print(f"📋 Extended timeout to {test_timeout}s for stress test: {test_name}")
+
                 try:
                     if self.verbose:
                         print(f"🔄 [Folder {folder_id:02d}] Starting {test_name}")
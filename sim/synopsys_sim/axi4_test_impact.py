@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+"""
+AXI4 Test Impact Analysis
+=========================
+
+Selects the regression list entries whose tests can be affected by a source change,
+so that a one-line fix to one sequence does not cost the full list.
+
+The SystemVerilog sources of the build (axi4_compile.f plus any -f file named in an
+entry's command_add) are indexed into a dependency graph between files:
+- `include "file"        the including file depends on the included one
+- class definitions      which file defines which class
+- class references       extends, ::type_id::create, typed handles, #(params) and
+                         static calls: every identifier naming a known class
+                         (outside comments and string literals)
+
+A test depends on every file reachable from the file defining its test class. A
+changed file that defines classes affects the tests that reach it; a changed file
+without classes, or one holding a package, module or interface (macros, parameters,
+typedefs, pkg include lists, hdl_top/hvl_top, BFMs) affects every entry whose build compiles it, as does
+a changed compile file. Entries naming an unknown test are always selected.
+
+Per-file parse results are cached in .test_impact_cache.json by mtime and size,
+so only the files that changed are parsed again.
+
+Usage:
+    python3 axi4_test_impact.py [--since REV] [--test-list LIST] [--output FILE]
+"""
+
+import os
+import sys
+import re
+import json
+import shlex
+import argparse
+import subprocess
+from pathlib import Path
+
+from axi4_regression import TestListComposer
+
+
+# Bumped whenever the parse results stored in the cache change shape
+CACHE_VERSION = 1
+
+SV_SOURCE_SUFFIXES = ('.sv', '.svh', '.v', '.vh')
+
+COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.S)
+INCLUDE_RE = re.compile(r'`include\s+"([^"]+)"')
+STRING_RE = re.compile(r'"(?:\\.|[^"\\\n])*"')
+CLASS_RE = re.compile(r'\b(typedef\s+)?(?:interface\s+)?class\s+(?:automatic\s+|static\s+)?(\w+)')
+# Files holding these are compiled into every test: packages, modules, interfaces
+GLOBAL_UNIT_RE = re.compile(r'^\s*(?:package|module|macromodule|interface|program)\b(?!\s+class)', re.M)
+IDENTIFIER_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+
+
+class TestImpactAnalyzer:
+    def __init__(self, compile_file, test_list_file):
+        self.base_dir = Path.cwd()
+        self.compile_file = Path(compile_file).resolve()
+        self.test_list_file = Path(test_list_file)
+        # axi4_compile.f and command_add are written for a run folder next to sim/
+        self.path_anchor_dir = self.base_dir.parent / 'run_folder_00'
+        self.cache_file = self.base_dir / ".test_impact_cache.json"
+        self.cache = {}
+        self.parsed = {}  # file -> {'classes', 'includes', 'identifiers', 'global'}
+        self.builds = {}  # compile files (tuple) -> {'sources', 'incdirs', 'files'}
+        self.definers = {}  # class name -> files defining it
+
+    def _resolve(self, path, anchor_dir):
+        """path as VCS would read it from anchor_dir"""
+        return os.path.normpath(os.path.join(str(anchor_dir), os.path.expandvars(path)))
+
+    def _read_compile_file(self, compile_file, build, seen):
+        """Collect the source files and include directories of a -f file, nested -f included"""
+        if compile_file in seen:
+            return
+        seen.add(compile_file)
+        with open(compile_file, 'r') as f:
+            tokens = shlex.split(COMMENT_RE.sub(' ', f.read()))
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token in ('-f', '-F') and index + 1 < len(tokens):
+                index += 1
+                nested = self._resolve(tokens[index], self.path_anchor_dir)
+                build['compile_files'].add(nested)
+                self._read_compile_file(nested, build, seen)
+            elif token.startswith('+incdir+'):
+                build['incdirs'] += [self._resolve(d, self.path_anchor_dir)
+                                     for d in token[len('+incdir+'):].split('+') if d]
+            elif not token.startswith(('+', '-')) and token.endswith(SV_SOURCE_SUFFIXES):
+                build['sources'].append(self._resolve(token, self.path_anchor_dir))
+            index += 1
+
+    def _build(self, compile_files):
+        """Sources, include directories and every compiled file of a build (cached per build)"""
+        if compile_files in self.builds:
+            return self.builds[compile_files]
+        build = {'sources': [], 'incdirs': [], 'compile_files': set(compile_files), 'files': set()}
+        seen = set()
+        for compile_file in compile_files:
+            self._read_compile_file(compile_file, build, seen)
+
+        # Every file the sources pull in through `include
+        pending = list(build['sources'])
+        while pending:
+            path = pending.pop()
+            if path in build['files'] or not os.path.isfile(path):
+                continue
+            build['files'].add(path)
+            for included in self._parse(path)['includes']:
+                resolved = self._resolve_include(included, path, build['incdirs'])
+                if resolved:
+                    pending.append(resolved)
+        self.builds[compile_files] = build
+        return build
+
+    def _resolve_include(self, included, including_file, incdirs):
+        """File an `include names: the including file's directory first, then the +incdir+ list"""
+        for directory in [os.path.dirname(including_file)] + incdirs:
+            candidate = os.path.normpath(os.path.join(directory, included))
+            if os.path.isfile(candidate):
+                return candidate
+        return None  # uvm_macros.svh and friends come from the simulator
+
+    def _parse(self, path):
+        """Definitions, includes and identifiers of one source file, from the cache if unchanged"""
+        if path in self.parsed:
+            return self.parsed[path]
+        stat = os.stat(path)
+        cached = self.cache.get(path)
+        if cached and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+            info = cached['info']
+        else:
+            with open(path, 'r', errors='replace') as f:
+                text = COMMENT_RE.sub(' ', f.read())
+            includes = INCLUDE_RE.findall(text)
+            # Test names in strings (configuration by test name) are not references
+            text = STRING_RE.sub('""', text)
+            classes = sorted({match.group(2) for match in CLASS_RE.finditer(text) if not match.group(1)})
+            info = {
+                'classes': classes,
+                'includes': includes,
+                'identifiers': sorted(set(IDENTIFIER_RE.findall(text)) - set(classes)),
+                'global': bool(GLOBAL_UNIT_RE.search(text)),
+            }
+            self.cache[path] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'info': info}
+        self.parsed[path] = info
+        return info
+
+    def _load_cache(self):
+        """Parse results of earlier runs; a cache of another format is ignored"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if cache.get('version') == CACHE_VERSION:
+                self.cache = cache['files']
+        except (OSError, ValueError, KeyError):
+            self.cache = {}
+
+    def _save_cache(self):
+        """Write the parse results back, dropping files that no longer exist"""
+        files = {path: entry for path, entry in self.cache.items() if os.path.exists(path)}
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'files': files}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write {self.cache_file.name}: {e}")
+
+    def _load_entries(self):
+        """(test name, entry line, compile files) for every entry of the test list
+
+        Entries are kept verbatim so the selected list reads exactly like the original;
+        include/exclude/filter directives are resolved the way axi4_regression.py does.
+        """
+        entries = []
+        composer = TestListComposer(self.base_dir.parent.parent / 'doc' / 'testcase_matrix.csv',
+                                    self.base_dir / ".test_list_cache.json")
+        lines, _ = composer.compose(self.test_list_file)
+        for line in lines:
+            compile_files = [str(self.compile_file)]
+            match = re.search(r'command_add=(?:"([^"]*)"|\'([^\']*)\'|(\S+))', line)
+            if match:
+                command_add = next(group for group in match.groups() if group is not None)
+                tokens = command_add.split()
+                compile_files += [self._resolve(tokens[i + 1], self.path_anchor_dir)
+                                  for i, token in enumerate(tokens[:-1]) if token in ('-f', '-F')]
+            entries.append((line.split()[0], line, tuple(compile_files)))
+        return entries
+
+    def _file_dependencies(self, path, build):
+        """Files path depends on directly: its includes and the files defining the classes it names"""
+        info = self._parse(path)
+        dependencies = set()
+        for included in info['includes']:
+            resolved = self._resolve_include(included, path, build['incdirs'])
+            if resolved:
+                dependencies.add(resolved)
+        for identifier in info['identifiers']:
+            dependencies.update(self.definers.get(identifier, ()))
+        return dependencies
+
+    def _reach(self, test_name, build):
+        """Every file the test class can reach, or None if no file of the build defines it"""
+        start = [path for path in self.definers.get(test_name, ()) if path in build['files']]
+        if not start:
+            return None
+        reached = set()
+        pending = list(start)
+        while pending:
+            path = pending.pop()
+            if path in reached:
+                continue
+            reached.add(path)
+            pending += [dependency for dependency in self._file_dependencies(path, build)
+                        if dependency in build['files'] and dependency not in reached]
+        return reached
+
+    def _changed_files(self, since):
+        """Files changed since a git revision: committed, staged, unstaged and untracked"""
+        def git(*args):
+            result = subprocess.run(['git', *args], cwd=str(self.base_dir), stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE, universal_newlines=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+            return result.stdout
+
+        root = git('rev-parse', '--show-toplevel').strip()
+        names = git('diff', '--name-only', since, '--').splitlines()
+        names += git('ls-files', '--others', '--exclude-standard', '--full-name', root).splitlines()
+        return {os.path.normpath(os.path.join(root, name)) for name in names if name}
+
+    def select(self, changed_files):
+        """Entries affected by changed_files, with the reason each one was selected"""
+        self._load_cache()
+        entries = self._load_entries()
+        for compile_files in {entry[2] for entry in entries}:
+            self._build(compile_files)
+        for build in self.builds.values():
+            for path in build['files']:
+                for name in self._parse(path)['classes']:
+                    self.definers.setdefault(name, set()).add(path)
+        self._save_cache()
+
+        selected = []
+        reach_cache = {}
+        for test_name, line, compile_files in entries:
+            build = self.builds[compile_files]
+            changed = [path for path in changed_files
+                       if path in build['files'] or path in build['compile_files']]
+            if not changed:
+                continue
+            global_changes = [path for path in changed
+                              if path in build['compile_files'] or self._parse(path)['global']
+                              or not self._parse(path)['classes']]
+            if global_changes:
+                selected.append((line, f"build input {self._display(global_changes[0])}"))
+                continue
+            key = (test_name, compile_files)
+            if key not in reach_cache:
+                reach_cache[key] = self._reach(test_name, build)
+            reached = reach_cache[key]
+            if reached is None:
+                print(f"⚠️  Warning: No class {test_name} in the sources, selecting it")
+                selected.append((line, "unknown test"))
+                continue
+            hits = [path for path in changed if path in reached]
+            if hits:
+                selected.append((line, f"reaches {self._display(hits[0])}"))
+        return entries, selected
+
+    def _display(self, path):
+        """path relative to the working directory when possible"""
+        try:
+            return os.path.relpath(path, str(self.base_dir))
+        except ValueError:
+            return path
+
+    def write_list(self, output_file, selected, changed_files, since):
+        """Write the selected entries in the test list format _load_test_list reads"""
+        with open(output_file, 'w') as f:
+            f.write(f"# Entries of {self.test_list_file} affected by {len(changed_files)} changed file(s)")
+            f.write(f" since {since}\n" if since else "\n")
+            for line, _ in selected:
+                f.write(f"{line}\n")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="AXI4 Test Impact Analysis: list entries affected by a source change",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 axi4_test_impact.py                                  # Uncommitted changes vs HEAD
+  python3 axi4_test_impact.py --since origin/main              # Everything changed on this branch
+  python3 axi4_test_impact.py --files ../../virtual_seq/axi4_virtual_4k_boundary_cross_seq.sv
+  python3 axi4_test_impact.py --since HEAD~3 -o impacted.list && \\
+      python3 axi4_regression.py --test-list impacted.list
+        """
+    )
+
+    parser.add_argument(
+        '--since',
+        default='HEAD',
+        metavar='REV',
+        help='Git revision to diff the working tree against (default: HEAD, i.e. uncommitted changes)'
+    )
+
+    parser.add_argument(
+        '--files',
+        nargs='+',
+        metavar='FILE',
+        help='Changed files to analyze instead of asking git'
+    )
+
+    parser.add_argument(
+        '--test-list',
+        default='axi4_transfers_regression.list',
+        help='List to select entries from (default: axi4_transfers_regression.list)'
+    )
+
+    parser.add_argument(
+        '--compile-file',
+        default='../axi4_compile.f',
+        help='Compile file of the default build (default: ../axi4_compile.f)'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        default='impacted.list',
+        help='Where to write the selected entries (default: impacted.list)'
+    )
+
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Print every selected entry with the changed file it depends on'
+    )
+
+    args = parser.parse_args()
+
+    for path, what in ((args.test_list, "Test list"), (args.compile_file, "Compile file")):
+        if not Path(path).exists():
+            print(f"❌ Error: {what} not found: {path}")
+            return 1
+
+    analyzer = TestImpactAnalyzer(args.compile_file, args.test_list)
+    try:
+        if args.files:
+            since = None
+            changed_files = {os.path.normpath(os.path.abspath(path)) for path in args.files}
+        else:
+            since = args.since
+            changed_files = analyzer._changed_files(since)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    try:
+        entries, selected = analyzer.select(changed_files)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    analyzer.write_list(args.output, selected, changed_files, since)
+
+    print(f"🔍 {len(changed_files)} changed file(s), {len(analyzer.parsed)} source files indexed")
+    if args.verbose:
+        for line, reason in selected:
+            print(f"   {line.split()[0]:50s} {reason}")
+    print(f"📋 Selected {len(selected)}/{len(entries)} list entries: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
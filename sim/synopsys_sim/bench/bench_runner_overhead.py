@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+"""
+AXI4 Regression Runner Overhead Benchmark
+=========================================
+
+Measures how much wall time the regression runners add on top of the simulator:
+folder cleanup forks, sleeps, log hunts, copies and analysis. Every runner is
+pointed at a scratch workspace whose PATH starts with stub `vcs` and `make`
+commands. The stubs sleep a configurable time and write realistic UVM logs, so
+everything the runner does is real except the simulation itself.
+
+Stub log kinds (chosen per list entry, see --error-rate and friends):
+- pass   clean UVM Report Summary, TEST RESULT: PASS
+- error  UVM_ERROR from the scoreboard, UVM_ERROR : 1 in the summary
+- fatal  UVM_FATAL, run ends early
+- hang   the same UVM_INFO line repeated thousands of times, no summary
+- huge   passing log padded to --huge-mb megabytes of distinct transactions
+
+Reported per runner and list size:
+- wall time and throughput (runs/min)
+- stub busy time (sum of the simulated compile + sim time of all runs)
+- runner overhead per run: (wall x parallelism - stub busy) / runs
+- peak RSS of the runner process itself
+
+With --lsf the runners run in LSF mode against lsf_emulator.py (bsub/bjobs/bkill
+backed by a local process pool), which exercises submission, polling and the
+injected LSF failures at list sizes no shared cluster queue would allow.
+
+Usage:
+    python3 bench_runner_overhead.py [--sizes 10,100,1000] [-p 8] [--sim-seconds 1.0]
+    python3 bench_runner_overhead.py --lsf --sizes 10000 --runners axi4_regression.py -p 48
+"""
+
+import os
+import sys
+import subprocess
+import time
+import argparse
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+
+SYNOPSYS_SIM_DIR = Path(__file__).resolve().parent.parent
+LSF_EMULATOR = Path(__file__).resolve().parent / 'lsf_emulator.py'
+
+RUNNERS = {
+    'axi4_regression.py': [],
+    'axi4_regression_makefile.py': ['--cleanup-delay', '0', '--log-wait-timeout', '5'],
+    'axi4_regression_makefile_runfolder.py': ['--cleanup-delay', '0', '--log-wait-timeout', '5'],
+}
+
+# Stub simulator. Parses the few VCS arguments the runners pass, sleeps for the
+# configured compile and sim time, prints the VCS phase markers and writes a UVM
+# log whose shape depends on the test name (bench_<kind>_...). With
+# +define+DUMP_FSDB it also writes a placeholder FSDB (+fsdbfile=, else novas.fsdb). The busy interval
+# is recorded in $BENCH_STAMP_DIR so the harness can subtract it from wall time.
+VCS_STUB = r'''#!{python}
+import os, sys, time, json
+start = time.time()
+args = sys.argv[1:]
+log_file, test, seed, fsdb_file = 'simv.log', 'unknown', '1', 'novas.fsdb'
+for i, arg in enumerate(args):
+    if arg == '-l' and i + 1 < len(args):
+        log_file = args[i + 1]
+    elif arg.startswith('+UVM_TESTNAME='):
+        test = arg.split('=', 1)[1]
+    elif arg.startswith('+ntb_random_seed='):
+        seed = arg.split('=', 1)[1]
+    elif arg.startswith('+fsdbfile='):
+        fsdb_file = arg.split('=', 1)[1]
+kind = test.split('_')[1] if test.startswith('bench_') else 'pass'
+
+print('Chronologic VCS (TM)', flush=True)
+time.sleep(float(os.environ.get('BENCH_COMPILE_SECONDS', '0')))
+print('CPU time: 1.0 seconds to compile + .2 seconds to elab + .3 seconds to link', flush=True)
+print('Chronologic VCS simulator copyright 1991-2020', flush=True)
+time.sleep(float(os.environ.get('BENCH_SIM_SECONDS', '0')))
+
+info = 'UVM_INFO /bench/axi4_master_driver_proxy.sv(214) @ {t}: uvm_test_top.env.master_agent[0] [DRV] write txn id=0x3 len=15\n'
+with open(log_file, 'w') as log:
+    log.write(f'UVM_INFO @ 0: reporter [RNTST] Running test {test}...\n')
+    log.write(f'NOTE: automatic random seed used: {seed}\n')
+    for t in range(200):
+        log.write(info.format(t=t * 1000))
+    if kind == 'hang':
+        for _ in range(5000):
+            log.write(info.format(t=999000))
+        log.flush()
+        sys.exit(0)
+    if kind == 'huge':
+        # Distinct transactions, so the log analyzer's repetition check sees traffic, not a hang
+        txn = 'UVM_INFO /bench/axi4_master_driver_proxy.sv(214) @ {t}: uvm_test_top.env.master_agent[0] [DRV] write txn id=0x{i:x} addr=0x{a:08x} len=15\n'
+        target = int(os.environ.get('BENCH_HUGE_MB', '200')) * 1048576
+        written = n = 0
+        while written < target:
+            block = ''.join(txn.format(t=200000 + (n + k) * 10, i=(n + k) % 16, a=((n + k) * 64) & 0xffffffff)
+                            for k in range(4096))
+            log.write(block)
+            written += len(block)
+            n += 4096
+    errors = fatals = 0
+    if kind == 'error':
+        errors = 1
+        log.write('UVM_ERROR /bench/axi4_scoreboard.sv(812) @ 91230: uvm_test_top.env.sb [SB_DATA] rdata mismatch addr=0x1f00 exp=0x3 got=0x7\n')
+    elif kind == 'fatal':
+        fatals = 1
+        log.write('UVM_FATAL /bench/axi4_env.sv(77) @ 500: uvm_test_top.env [CFG] no virtual interface for master_agent[3]\n')
+    log.write('\n--- UVM Report Summary ---\n\n** Report counts by severity\n')
+    log.write(f'UVM_INFO :  202\nUVM_WARNING :    0\nUVM_ERROR :    {errors}\nUVM_FATAL :    {fatals}\n')
+    log.write('TEST RESULT: PASS\n' if not (errors or fatals) else 'TEST RESULT: FAIL\n')
+    log.write('$finish called from file "/bench/hvl_top.sv", line 80.\n')
+    log.write('           V C S   S i m u l a t i o n   R e p o r t\n')
+    log.write('Time: 100000000 ps\nCPU Time:      0.420 seconds;       Data structure size:   9.6Mb\n')
+print('           V C S   S i m u l a t i o n   R e p o r t', flush=True)
+if any('+define+DUMP_FSDB' in arg for arg in args):
+    with open(fsdb_file, 'w') as f:
+        f.write(f'stub waves of {test}\n')
+
+stamp_dir = os.environ.get('BENCH_STAMP_DIR')
+if stamp_dir:
+    with open(os.path.join(stamp_dir, f'{os.getpid()}.json'), 'w') as f:
+        json.dump({'test': test, 'start': start, 'end': time.time()}, f)
+sys.exit(1 if kind == 'fatal' else 0)
+'''
+
+# Stub make: implements only `make -f <Makefile> sim VAR=value ...` as the
+# makefile runners call it, honouring CLEANUP_DELAY like the real sim target,
+# then hands over to the stub vcs with the equivalent arguments.
+MAKE_STUB = r'''#!{python}
+import os, sys, time
+variables = dict(arg.split('=', 1) for arg in sys.argv[1:] if '=' in arg and not arg.startswith('-'))
+time.sleep(float(variables.get('CLEANUP_DELAY', '0') or 0))
+vcs_args = ['vcs', '-R', '+UVM_TESTNAME=' + variables.get('test', 'unknown'),
+            '+ntb_random_seed=' + (variables.get('SEED') or '1'),
+            '-l', variables.get('LOG_FILE', 'simv.log')]
+os.execvp('vcs', vcs_args)
+'''
+
+
+def write_stubs(bin_dir):
+    """Write the stub vcs and make into bin_dir"""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name, source in (('vcs', VCS_STUB), ('make', MAKE_STUB)):
+        stub = bin_dir / name
+        stub.write_text(source.replace('{python}', sys.executable, 1))
+        os.chmod(stub, 0o755)
+
+
+def write_test_list(list_file, size, args, rng):
+    """Write a list of `size` distinct entries with the requested failure mix"""
+    kinds = ['huge'] * min(args.huge_count, size)
+    for kind, rate in (('error', args.error_rate), ('fatal', args.fatal_rate), ('hang', args.hang_rate)):
+        kinds += [kind] * int(round(size * rate))
+    kinds = kinds[:size] + ['pass'] * max(0, size - len(kinds))
+    rng.shuffle(kinds)
+    with open(list_file, 'w') as f:
+        f.write(f"# Benchmark list: {size} entries\n")
+        for index, kind in enumerate(kinds):
+            f.write(f"bench_{kind}_t{index:05d}_test\n")
+    return {kind: kinds.count(kind) for kind in set(kinds)}
+
+
+def read_peak_rss_mb(pid):
+    """VmHWM (peak resident set) of a live process, in MB, or None"""
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def start_lsf_emulator(workspace, args, env):
+    """Start a fresh LSF emulator for one benchmark run; returns its total slots"""
+    env['LSF_EMU_DIR'] = str(workspace / 'lsf')
+    slots_per_host = -(-args.max_parallel // args.lsf_hosts)
+    subprocess.run([sys.executable, str(LSF_EMULATOR), 'stop', '--purge'], env=env, stdout=subprocess.DEVNULL)
+    subprocess.run([sys.executable, str(LSF_EMULATOR), 'start', '--hosts', str(args.lsf_hosts),
+                    '--slots-per-host', str(slots_per_host), '--pend-max', str(args.lsf_pend_max),
+                    '--exit-rate', str(args.lsf_exit_rate), '--host-fail-rate', str(args.lsf_host_fail_rate),
+                    '--seed', str(args.seed)],
+                   env=env, stdout=subprocess.DEVNULL, check=True)
+    env['PATH'] = f"{workspace / 'lsf' / 'bin'}{os.pathsep}{env['PATH']}"
+    return args.lsf_hosts * slots_per_host
+
+
+def run_benchmark(runner, size, args, workspace, rng):
+    """Run one runner against one list size in a fresh workspace, return a result row"""
+    sim_dir = workspace / 'sim' / 'synopsys_sim'
+    stamp_dir = workspace / 'stamps'
+    for path in (workspace / 'sim', stamp_dir):
+        if path.exists():
+            shutil.rmtree(path)
+    sim_dir.mkdir(parents=True)
+    stamp_dir.mkdir()
+    (sim_dir / 'Makefile').write_text('# placeholder: the stub make on PATH never reads it\n')
+    (workspace / 'sim' / 'axi4_compile.f').write_text('')
+
+    list_file = sim_dir / f'bench_{size}.list'
+    mix = write_test_list(list_file, size, args, rng)
+
+    env = dict(os.environ)
+    env['PATH'] = f"{workspace / 'bin'}{os.pathsep}{env.get('PATH', '')}"
+    env['BENCH_STAMP_DIR'] = str(stamp_dir)
+    env['BENCH_COMPILE_SECONDS'] = str(args.compile_seconds)
+    env['BENCH_SIM_SECONDS'] = str(args.sim_seconds)
+    env['BENCH_HUGE_MB'] = str(args.huge_mb)
+
+    cmd = [sys.executable, str(SYNOPSYS_SIM_DIR / runner), '--test-list', list_file.name,
+           '-p', str(args.max_parallel), '--timeout', str(args.timeout)] + RUNNERS[runner]
+    slots = args.max_parallel
+    if args.lsf:
+        slots = start_lsf_emulator(workspace, args, env)
+        cmd.append('--lsf')
+    output_file = workspace / f'{Path(runner).stem}_{size}.out'
+
+    print(f"🏃 {runner} x {size} entries ({', '.join(f'{k}={v}' for k, v in sorted(mix.items()))})")
+    start = time.time()
+    peak_rss_mb = None
+    with open(output_file, 'w') as out:
+        process = subprocess.Popen(cmd, cwd=str(sim_dir), env=env, stdout=out, stderr=subprocess.STDOUT)
+        while process.poll() is None:
+            rss = read_peak_rss_mb(process.pid)
+            if rss is not None:
+                peak_rss_mb = rss
+            if args.max_wall and time.time() - start > args.max_wall:
+                process.kill()
+                print(f"⏰ Stopped after --max-wall {args.max_wall}s")
+                break
+            time.sleep(0.5)
+        process.wait()
+    wall = time.time() - start
+    if args.lsf:
+        lsf_status = subprocess.run([sys.executable, str(LSF_EMULATOR), 'status'], env=env,
+                                    stdout=subprocess.PIPE, universal_newlines=True).stdout
+        print('   ' + lsf_status.strip().replace('\n', '\n   '))
+        subprocess.run([sys.executable, str(LSF_EMULATOR), 'stop', '--purge'], env=env,
+                       stdout=subprocess.DEVNULL)
+
+    busy = 0.0
+    runs = 0
+    for stamp_file in stamp_dir.glob('*.json'):
+        with open(stamp_file, 'r') as f:
+            stamp = json.load(f)
+        busy += stamp['end'] - stamp['start']
+        runs += 1
+    # hang runs exit without a stamp; count them at their nominal stub time
+    runs_expected = size
+    busy += (runs_expected - runs) * (args.compile_seconds + args.sim_seconds)
+
+    parallelism = min(args.max_parallel, slots, runs_expected)
+    overhead = (wall * parallelism - busy) / runs_expected
+    return {
+        'runner': runner,
+        'entries': size,
+        'exit_code': process.returncode,
+        'wall_s': round(wall, 2),
+        'runs_per_min': round(runs_expected / wall * 60, 1),
+        'stub_busy_s': round(busy, 2),
+        'overhead_per_run_s': round(overhead, 3),
+        'peak_runner_rss_mb': round(peak_rss_mb, 1) if peak_rss_mb else None,
+        'output': str(output_file),
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="AXI4 Regression Runner Overhead Benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 bench_runner_overhead.py                                  # All runners, 10/100/1000 entries
+  python3 bench_runner_overhead.py --sizes 10 --runners axi4_regression.py
+  python3 bench_runner_overhead.py --sim-seconds 5 -p 16            # Slower stub, more parallelism
+  python3 bench_runner_overhead.py --huge-count 2 --huge-mb 400     # Two 400 MB logs per list
+  python3 bench_runner_overhead.py --lsf --sizes 10000 --runners axi4_regression.py -p 48
+  python3 bench_runner_overhead.py --lsf --lsf-pend-max 5 --lsf-exit-rate 0.01 --lsf-host-fail-rate 0.002
+        """
+    )
+    parser.add_argument('--sizes', default='10,100,1000',
+                        help='Comma-separated list sizes (default: 10,100,1000)')
+    parser.add_argument('--runners', default=','.join(RUNNERS),
+                        help='Comma-separated runner scripts to benchmark (default: all three)')
+    parser.add_argument('--max-parallel', '-p', type=int, default=8,
+                        help='Parallelism passed to every runner (default: 8)')
+    parser.add_argument('--timeout', type=int, default=60,
+                        help='Per-test timeout passed to every runner (default: 60, the runners\' minimum)')
+    parser.add_argument('--compile-seconds', type=float, default=0.5,
+                        help='Stub vcs compile time per run (default: 0.5)')
+    parser.add_argument('--sim-seconds', type=float, default=1.0,
+                        help='Stub simulation time per run (default: 1.0)')
+    parser.add_argument('--error-rate', type=float, default=0.04,
+                        help='Fraction of entries that end with UVM_ERROR (default: 0.04)')
+    parser.add_argument('--fatal-rate', type=float, default=0.02,
+                        help='Fraction of entries that end with UVM_FATAL (default: 0.02)')
+    parser.add_argument('--hang-rate', type=float, default=0.02,
+                        help='Fraction of entries that produce a hang-repetition log (default: 0.02)')
+    parser.add_argument('--huge-count', type=int, default=1,
+                        help='Number of entries per list with a huge passing log (default: 1)')
+    parser.add_argument('--huge-mb', type=int, default=200,
+                        help='Size of each huge log in MB (default: 200)')
+    parser.add_argument('--lsf', action='store_true',
+                        help='Run the runners in LSF mode against the local LSF emulator')
+    parser.add_argument('--lsf-hosts', type=int, default=4,
+                        help='Emulated LSF hosts; -p slots are spread over them (default: 4)')
+    parser.add_argument('--lsf-pend-max', type=float, default=0.0,
+                        help='Maximum random LSF pending delay per job, seconds (default: 0)')
+    parser.add_argument('--lsf-exit-rate', type=float, default=0.0,
+                        help='Fraction of LSF jobs killed part-way with TERM_MEMLIMIT (default: 0)')
+    parser.add_argument('--lsf-host-fail-rate', type=float, default=0.0,
+                        help='Chance per LSF job that its host fails and kills its jobs (default: 0)')
+    parser.add_argument('--max-wall', type=int, default=0,
+                        help='Kill a runner that takes longer than this many seconds (default: no limit)')
+    parser.add_argument('--workspace', default=None,
+                        help='Scratch directory (default: a new temporary directory, removed afterwards)')
+    parser.add_argument('--output', default='bench_results.json',
+                        help='Where to write the JSON results (default: bench_results.json)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Seed for the failure placement in the generated lists (default: 1)')
+    args = parser.parse_args()
+
+    if args.max_parallel < 1 or args.max_parallel > 50:
+        print("❌ Error: max-parallel must be between 1 and 50")
+        return 1
+
+    runners = [runner.strip() for runner in args.runners.split(',') if runner.strip()]
+    for runner in runners:
+        if runner not in RUNNERS:
+            print(f"❌ Error: Unknown runner {runner} (choose from {', '.join(RUNNERS)})")
+            return 1
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    workspace = Path(args.workspace or tempfile.mkdtemp(prefix='axi4_bench_')).resolve()
+    write_stubs(workspace / 'bin')
+    rng = random.Random(args.seed)
+
+    print(f"🔧 Workspace: {workspace}")
+    print(f"🔧 Stub vcs: {args.compile_seconds}s compile + {args.sim_seconds}s sim, -p {args.max_parallel}")
+    if args.lsf:
+        print(f"🔧 LSF emulator: {args.lsf_hosts} hosts, pending up to {args.lsf_pend_max}s, "
+              f"exit rate {args.lsf_exit_rate}, host failure rate {args.lsf_host_fail_rate}")
+
+    rows = []
+    try:
+        for size in sizes:
+            for runner in runners:
+                rows.append(run_benchmark(runner, size, args, workspace, rng))
+                row = rows[-1]
+                print(f"   └─ {row['wall_s']:.1f}s wall, {row['runs_per_min']:.1f} runs/min, "
+                      f"{row['overhead_per_run_s']:.2f}s overhead/run, peak RSS {row['peak_runner_rss_mb']} MB")
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrupted, reporting what finished")
+
+    print("\n" + "=" * 100)
+    print(f"{'Runner':40s} {'Entries':>8s} {'Wall':>9s} {'Runs/min':>9s} {'Overhead/run':>13s} {'Peak RSS':>10s} {'Exit':>5s}")
+    print("-" * 100)
+    for row in rows:
+        rss = f"{row['peak_runner_rss_mb']:.0f}MB" if row['peak_runner_rss_mb'] else '-'
+        print(f"{row['runner']:40s} {row['entries']:8d} {row['wall_s']:8.1f}s {row['runs_per_min']:9.1f} "
+              f"{row['overhead_per_run_s']:12.2f}s {rss:>10s} {row['exit_code']:5d}")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'config': vars(args),
+            'results': rows,
+        }, f, indent=2)
+    print(f"\n📄 Results saved to: {args.output}")
+
+    if not args.workspace:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
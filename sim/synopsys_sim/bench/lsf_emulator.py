@@ -0,0 +1,671 @@
+#!/usr/bin/env python
+"""
+Local LSF Emulator
+==================
+
+Stands in for the part of LSF the regression runners use, so LSF mode can be run
+and scale-tested on one Linux box: `bsub` queues a job, a local scheduler daemon
+runs it on one of a configurable number of slots, and `bjobs`/`bkill` query and
+kill it through the same command-line interface and output formats as LSF.
+
+Supported subset:
+- bsub [-J name] [-o file] [-e file] [-q queue] [-n n] [-R req] [-K] command [args]
+  or `bsub < script` with #BSUB lines. Prints "Job <id> is submitted to queue <q>."
+- bjobs [-a] [-w] [-noheader] [-o 'field ...'] [-json] [job_id ...]
+  Fields: jobid stat user queue from_host exec_host job_name submit_time
+  start_time finish_time exit_code exit_reason max_mem cpu_used pend_time run_time
+- bkill job_id ... (or 0 for all unfinished jobs)
+
+Jobs run in the submission directory with the submission environment plus
+LSB_JOBID, LSB_HOSTS, LSB_QUEUE, LSB_JOBNAME and a per-job TMPDIR, in their own
+process group. MAX_MEM and CPU_USED come from the job's rusage when it ends.
+
+Scheduling knobs (see `start --help`):
+- --hosts / --slots-per-host   emulated execution hosts emu01..emuNN
+- --pend-min / --pend-max      random pending delay before a job is eligible
+- --exit-rate                  fraction of jobs killed part-way (TERM_MEMLIMIT)
+- --host-fail-rate             chance per started job that its host goes down,
+                               killing every job on it, for --host-down-seconds
+
+State lives in $LSF_EMU_DIR (default /tmp/lsf_emu_<uid>): one JSON status file
+per job, so bjobs for one job is a single small file read at any queue depth.
+
+Usage:
+    python3 lsf_emulator.py start --hosts 4 --slots-per-host 4
+    export PATH=/tmp/lsf_emu_$(id -u)/bin:$PATH
+    python3 axi4_regression.py --lsf --test-list ... --max-parallel 16
+    python3 lsf_emulator.py status
+    python3 lsf_emulator.py stop
+"""
+
+import os
+import sys
+import time
+import json
+import heapq
+import fcntl
+import random
+import signal
+import socket
+import getpass
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+DEFAULT_CONFIG = {
+    'hosts': 4,
+    'slots_per_host': 4,
+    'pend_min': 0.0,
+    'pend_max': 0.0,
+    'exit_rate': 0.0,
+    'host_fail_rate': 0.0,
+    'host_down_seconds': 30.0,
+    'clean_period': 3600.0,
+    'idle_exit': 600.0,
+    'tick': 0.05,
+    'seed': None,
+}
+
+BSUB_VALUE_OPTIONS = {'-J', '-o', '-oo', '-e', '-eo', '-q', '-n', '-R', '-W', '-M', '-P', '-G',
+                      '-cwd', '-m', '-w', '-E', '-app', '-sla', '-L', '-u', '-g', '-sp'}
+BSUB_FLAG_OPTIONS = {'-K', '-I', '-B', '-N', '-r', '-rn', '-x', '-H', '-Is'}
+
+BJOBS_FIELDS = ['jobid', 'user', 'stat', 'queue', 'from_host', 'exec_host', 'job_name', 'submit_time']
+UNFINISHED = ('PEND', 'RUN', 'PSUSP', 'USUSP', 'SSUSP')
+
+
+def state_dir():
+    """Emulator state directory"""
+    return Path(os.environ.get('LSF_EMU_DIR') or f'/tmp/lsf_emu_{os.getuid()}')
+
+
+def load_config(root):
+    """config.json merged over the defaults"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(root / 'config.json', 'r') as f:
+            config.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return config
+
+
+def write_json_atomic(path, data):
+    """Write JSON so readers never see a partial file"""
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def read_json(path):
+    """JSON file contents, or None if missing or mid-replace"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def lsf_time(timestamp):
+    """LSF-style short time ("Oct 19 06:29"), '-' when unset"""
+    if not timestamp:
+        return '-'
+    return datetime.fromtimestamp(timestamp).strftime('%b %d %H:%M')
+
+
+def daemon_running(root):
+    """True if a scheduler daemon holds the daemon lock"""
+    lock_path = root / 'daemon.lock'
+    if not lock_path.exists():
+        return False
+    with open(lock_path, 'a') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        fcntl.flock(lock, fcntl.LOCK_UN)
+    return False
+
+
+def ensure_daemon(root):
+    """Start the scheduler daemon in the background unless one is running"""
+    if daemon_running(root):
+        return
+    with open(root / 'daemon.log', 'a') as log:
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), 'daemon'],
+                         env=dict(os.environ, LSF_EMU_DIR=str(root)),
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                         start_new_session=True, close_fds=True)
+
+
+def init_state(root):
+    """Create the state directory layout"""
+    for sub in ('jobs', 'queue', 'kill', 'scripts', 'tmp', 'bin'):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+
+def allocate_job_id(root):
+    """Next job ID, unique across concurrent bsub calls"""
+    with open(root / 'lock', 'a+') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        counter = root / 'next_id'
+        try:
+            job_id = int(counter.read_text().strip() or 1)
+        except (OSError, ValueError):
+            job_id = 1
+        counter.write_text(str(job_id + 1))
+    return job_id
+
+
+# --------------------------------------------------------------------------- bsub
+
+def parse_bsub_args(argv, options):
+    """Split bsub arguments into options (updated in place) and the job command"""
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg in BSUB_VALUE_OPTIONS and index + 1 < len(argv):
+            options[arg] = argv[index + 1]
+            index += 2
+        elif arg in BSUB_FLAG_OPTIONS:
+            options[arg] = True
+            index += 1
+        else:
+            break
+    return argv[index:]
+
+
+def cmd_bsub(argv):
+    """bsub: queue a job and print its ID"""
+    root = state_dir()
+    init_state(root)
+    options = {}
+    command = parse_bsub_args(argv, options)
+    job_id = allocate_job_id(root)
+
+    if not command:
+        # `bsub < script`: #BSUB lines supply options, command-line options win
+        script = sys.stdin.read()
+        script_options = {}
+        for line in script.splitlines():
+            if line.startswith('#BSUB'):
+                parse_bsub_args(line.split()[1:], script_options)
+        options = dict(script_options, **options)
+        script_path = root / 'scripts' / f'{job_id}.sh'
+        script_path.write_text(script if script.startswith('#!') else '#!/bin/sh\n' + script)
+        os.chmod(script_path, 0o755)
+        command = [str(script_path)]
+
+    queue = options.get('-q', 'normal')
+    now = time.time()
+    record = {
+        'JOBID': str(job_id), 'USER': getpass.getuser(), 'STAT': 'PEND', 'QUEUE': queue,
+        'FROM_HOST': socket.gethostname(), 'EXEC_HOST': '',
+        'JOB_NAME': options.get('-J', ' '.join(command)[:60]),
+        'SUBMIT_TIME': now, 'START_TIME': None, 'FINISH_TIME': None,
+        'EXIT_CODE': '', 'EXIT_REASON': '', 'MAX_MEM': '', 'CPU_USED': '',
+    }
+    spec = {
+        'job_id': job_id, 'command': command, 'cwd': options.get('-cwd', os.getcwd()),
+        'env': dict(os.environ), 'queue': queue, 'job_name': record['JOB_NAME'],
+        'output': options.get('-oo', options.get('-o')), 'error': options.get('-eo', options.get('-e')),
+        'submit_time': now,
+    }
+    write_json_atomic(root / 'jobs' / f'{job_id}.json', record)
+    write_json_atomic(root / 'queue' / f'{job_id}.json', spec)
+    ensure_daemon(root)
+    print(f"Job <{job_id}> is submitted to queue <{queue}>.", flush=True)
+
+    if options.get('-K'):
+        print(f"<<Waiting for dispatch ...>>", flush=True)
+        while True:
+            record = read_json(root / 'jobs' / f'{job_id}.json') or record
+            if record['STAT'] in ('DONE', 'EXIT'):
+                break
+            time.sleep(0.2)
+        print(f"<<Job is finished>>", flush=True)
+        return int(record['EXIT_CODE'] or 0) if record['STAT'] == 'EXIT' else 0
+    return 0
+
+
+# -------------------------------------------------------------------------- bjobs
+
+def field_value(record, field, now):
+    """Value of one bjobs -o field for a job record, as LSF prints it"""
+    key = field.upper()
+    if key in ('SUBMIT_TIME', 'START_TIME', 'FINISH_TIME'):
+        return lsf_time(record.get(key))
+    if key == 'PEND_TIME':
+        start = record.get('START_TIME') or now
+        return f"{int(start - record['SUBMIT_TIME'])} second(s)"
+    if key == 'RUN_TIME':
+        if not record.get('START_TIME'):
+            return '0 second(s)'
+        return f"{int((record.get('FINISH_TIME') or now) - record['START_TIME'])} second(s)"
+    value = record.get(key)
+    return '' if value is None else str(value)
+
+
+def cmd_bjobs(argv):
+    """bjobs: report job status, text or -json"""
+    root = state_dir()
+    show_all = json_output = no_header = False
+    fields = None
+    job_ids = []
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg == '-a':
+            show_all = True
+        elif arg == '-json':
+            json_output = True
+        elif arg == '-noheader':
+            no_header = True
+        elif arg == '-o' and index + 1 < len(argv):
+            index += 1
+            fields = [spec.split(':')[0] for spec in argv[index].split()
+                      if not spec.startswith('delimiter=')]
+        elif arg in ('-u', '-q', '-m', '-J', '-g', '-P') and index + 1 < len(argv):
+            index += 1
+        elif not arg.startswith('-'):
+            job_ids.append(arg)
+        index += 1
+    fields = fields or BJOBS_FIELDS
+    now = time.time()
+
+    rows = []
+    errors = []
+    if job_ids:
+        for job_id in job_ids:
+            record = read_json(root / 'jobs' / f'{job_id}.json')
+            if record is None:
+                errors.append(job_id)
+            else:
+                rows.append(record)
+    else:
+        for path in sorted((root / 'jobs').glob('*.json'), key=lambda p: int(p.stem)):
+            record = read_json(path)
+            if record and (show_all or record['STAT'] in UNFINISHED):
+                rows.append(record)
+
+    if json_output:
+        records = [{field.upper(): field_value(record, field, now) for field in fields} for record in rows]
+        records += [{'JOBID': job_id, 'ERROR': f'Job <{job_id}> is not found'} for job_id in errors]
+        print(json.dumps({'COMMAND': 'bjobs', 'JOBS': len(records), 'RECORDS': records}, indent=2))
+        return 0
+
+    for job_id in errors:
+        print(f"Job <{job_id}> is not found", file=sys.stderr)
+    if not rows:
+        if not job_ids:
+            print("No unfinished job found", file=sys.stderr)
+        return 255 if errors else 0
+    if not no_header:
+        print(' '.join(f'{field.upper():<10s}' for field in fields).rstrip())
+    for record in rows:
+        print(' '.join(f'{field_value(record, field, now) or "-":<10s}' for field in fields).rstrip())
+    return 255 if errors else 0
+
+
+# -------------------------------------------------------------------------- bkill
+
+def cmd_bkill(argv):
+    """bkill: ask the daemon to terminate jobs"""
+    root = state_dir()
+    job_ids = [arg for arg in argv if not arg.startswith('-')]
+    if not job_ids:
+        print("bkill: Job ID or one of '-m', '-u' and '-q' must be specified", file=sys.stderr)
+        return 255
+    if job_ids == ['0']:
+        job_ids = [path.stem for path in (root / 'jobs').glob('*.json')
+                   if (read_json(path) or {}).get('STAT') in UNFINISHED]
+
+    status = 0
+    for job_id in job_ids:
+        record = read_json(root / 'jobs' / f'{job_id}.json')
+        if record is None:
+            print(f"Job <{job_id}>: No matching job found", file=sys.stderr)
+            status = 255
+        elif record['STAT'] not in UNFINISHED:
+            print(f"Job <{job_id}>: Job has already finished", file=sys.stderr)
+            status = 255
+        else:
+            (root / 'kill' / str(job_id)).touch()
+            print(f"Job <{job_id}> is being terminated")
+    return status
+
+
+# ------------------------------------------------------------------------- daemon
+
+class Scheduler:
+    """Local process pool that plays the LSF master and execution hosts"""
+
+    def __init__(self, root, config):
+        self.root = root
+        self.config = config
+        self.rng = random.Random(config['seed'])
+        self.hosts = [f"emu{index + 1:02d}" for index in range(config['hosts'])]
+        self.host_down_until = {host: 0.0 for host in self.hosts}
+        self.pending = []           # heap of (eligible_at, job_id)
+        self.specs = {}             # job_id -> spec, pending and running jobs
+        self.running = {}           # job_id -> dict(process, host, ...)
+        self.finished = {}          # job_id -> finish time, for clean_period
+        self.last_activity = time.time()
+        self.stopping = False
+
+    def record_path(self, job_id):
+        return self.root / 'jobs' / f'{job_id}.json'
+
+    def update_record(self, job_id, **fields):
+        record = read_json(self.record_path(job_id)) or {'JOBID': str(job_id)}
+        record.update(fields)
+        write_json_atomic(self.record_path(job_id), record)
+
+    def intake(self, now):
+        """Pick up newly submitted jobs from queue/"""
+        queue_dir = self.root / 'queue'
+        for name in os.listdir(queue_dir):
+            if not name.endswith('.json'):
+                continue
+            spec = read_json(queue_dir / name)
+            if spec is None:
+                continue
+            os.unlink(queue_dir / name)
+            delay = self.rng.uniform(self.config['pend_min'], max(self.config['pend_min'], self.config['pend_max']))
+            self.specs[spec['job_id']] = spec
+            heapq.heappush(self.pending, (spec['submit_time'] + delay, spec['job_id']))
+            self.last_activity = now
+
+    def free_hosts(self, now):
+        """Hosts that are up, with their free slot count"""
+        busy = {}
+        for job in self.running.values():
+            busy[job['host']] = busy.get(job['host'], 0) + 1
+        return [(host, self.config['slots_per_host'] - busy.get(host, 0)) for host in self.hosts
+                if self.host_down_until[host] <= now and busy.get(host, 0) < self.config['slots_per_host']]
+
+    def schedule(self, now):
+        """Dispatch eligible pending jobs onto free slots, FIFO by eligibility"""
+        free = self.free_hosts(now)
+        while self.pending and free and self.pending[0][0] <= now:
+            _, job_id = heapq.heappop(self.pending)
+            spec = self.specs.get(job_id)
+            if spec is None:
+                continue  # killed while pending
+            host, slots = max(free, key=lambda item: item[1])
+            self.start(spec, host, now)
+            free = [(h, s - 1 if h == host else s) for h, s in free if not (h == host and s == 1)]
+
+    def start(self, spec, host, now):
+        """Launch one job on host"""
+        job_id = spec['job_id']
+        tmp_dir = self.root / 'tmp' / str(job_id)
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        env = dict(spec['env'], LSB_JOBID=str(job_id), LSB_HOSTS=host, LSB_MCPU_HOSTS=f"{host} 1",
+                   LSB_QUEUE=spec['queue'], LSB_JOBNAME=spec['job_name'], TMPDIR=str(tmp_dir))
+        cwd = spec['cwd']
+        stdout = stderr = subprocess.DEVNULL
+        try:
+            if spec['output']:
+                stdout = open(os.path.join(cwd, spec['output']), 'a')
+            if spec['error']:
+                stderr = open(os.path.join(cwd, spec['error']), 'a')
+            elif spec['output']:
+                stderr = subprocess.STDOUT
+            process = subprocess.Popen(spec['command'], cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+                                       stdout=stdout, stderr=stderr, start_new_session=True)
+        except OSError as e:
+            self.update_record(job_id, STAT='EXIT', EXEC_HOST=host, START_TIME=now, FINISH_TIME=now,
+                               EXIT_CODE='127', EXIT_REASON=f'Cannot execute job: {e.strerror}')
+            self.specs.pop(job_id, None)
+            self.finished[job_id] = now
+            return
+        finally:
+            for handle in (stdout, stderr):
+                if hasattr(handle, 'close'):
+                    handle.close()
+
+        job = {'process': process, 'host': host, 'start': now, 'kill_at': None, 'reason': ''}
+        if self.rng.random() < self.config['exit_rate']:
+            job['kill_at'] = now + self.rng.uniform(0.0, 2.0)
+            job['inject'] = 'TERM_MEMLIMIT: job killed after reaching LSF memory usage limit'
+        if self.rng.random() < self.config['host_fail_rate']:
+            job['host_fail_at'] = now + self.rng.uniform(0.0, 2.0)
+        self.running[job_id] = job
+        self.update_record(job_id, STAT='RUN', EXEC_HOST=host, START_TIME=now)
+        self.last_activity = now
+
+    def signal_job(self, job, signum):
+        try:
+            os.killpg(job['process'].pid, signum)
+        except OSError:
+            pass
+
+    def handle_kills(self, now):
+        """bkill requests from kill/"""
+        kill_dir = self.root / 'kill'
+        for name in os.listdir(kill_dir):
+            os.unlink(kill_dir / name)
+            job_id = int(name)
+            if job_id in self.running:
+                job = self.running[job_id]
+                job['reason'] = 'TERM_OWNER: job killed by owner'
+                self.signal_job(job, signal.SIGTERM)
+                job['kill_at'] = now + 2.0  # SIGKILL if SIGTERM is ignored
+            elif job_id in self.specs:
+                self.specs.pop(job_id)
+                self.update_record(job_id, STAT='EXIT', FINISH_TIME=now, EXIT_CODE='',
+                                   EXIT_REASON='TERM_OWNER: job killed by owner')
+                self.finished[job_id] = now
+
+    def inject_faults(self, now):
+        """Scheduled job kills and host failures"""
+        for job_id, job in list(self.running.items()):
+            if job.get('host_fail_at') and job['host_fail_at'] <= now:
+                host = job['host']
+                self.host_down_until[host] = now + self.config['host_down_seconds']
+                print(f"{datetime.now():%H:%M:%S} host {host} down for {self.config['host_down_seconds']}s", flush=True)
+                for other in self.running.values():
+                    if other['host'] == host:
+                        other['reason'] = 'Host failure: job killed (injected by lsf_emulator)'
+                        other.pop('host_fail_at', None)
+                        self.signal_job(other, signal.SIGKILL)
+            elif job['kill_at'] and job['kill_at'] <= now:
+                job['reason'] = job['reason'] or job.get('inject', '')
+                job['kill_at'] = None
+                self.signal_job(job, signal.SIGKILL)
+
+    def reap(self, now):
+        """Collect finished jobs with their rusage"""
+        for job_id, job in list(self.running.items()):
+            try:
+                pid, status, rusage = os.wait4(job['process'].pid, os.WNOHANG)
+            except ChildProcessError:
+                pid, status, rusage = job['process'].pid, 0, None
+            if pid == 0:
+                continue
+            job['process'].returncode = os.waitstatus_to_exitcode(status)
+            # The rest of the job's process group may outlive the top process
+            self.signal_job(job, signal.SIGKILL)
+            code = job['process'].returncode
+            exit_code = 128 - code if code < 0 else code
+            fields = {'FINISH_TIME': now, 'EXIT_REASON': job['reason']}
+            if rusage is not None:
+                fields['MAX_MEM'] = f"{rusage.ru_maxrss / 1024.0:.0f} Mbytes"
+                fields['CPU_USED'] = f"{rusage.ru_utime + rusage.ru_stime:.1f} second(s)"
+            if exit_code == 0 and not job['reason']:
+                fields.update(STAT='DONE', EXIT_CODE='')
+            else:
+                fields.update(STAT='EXIT', EXIT_CODE=str(exit_code))
+            self.update_record(job_id, **fields)
+            del self.running[job_id]
+            self.specs.pop(job_id, None)
+            self.finished[job_id] = now
+            self.last_activity = now
+            tmp_dir = self.root / 'tmp' / str(job_id)
+            subprocess.run(['rm', '-rf', str(tmp_dir)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def clean(self, now):
+        """Forget jobs that finished more than clean_period ago, like LSF's CLEAN_PERIOD"""
+        for job_id, finished_at in list(self.finished.items()):
+            if now - finished_at > self.config['clean_period']:
+                try:
+                    os.unlink(self.record_path(job_id))
+                except OSError:
+                    pass
+                del self.finished[job_id]
+
+    def run(self):
+        signal.signal(signal.SIGTERM, lambda signum, frame: setattr(self, 'stopping', True))
+        print(f"{datetime.now():%H:%M:%S} lsf_emulator daemon {os.getpid()}: "
+              f"{len(self.hosts)} hosts x {self.config['slots_per_host']} slots", flush=True)
+        while not self.stopping:
+            now = time.time()
+            self.intake(now)
+            self.handle_kills(now)
+            self.inject_faults(now)
+            self.reap(now)
+            self.schedule(now)
+            self.clean(now)
+            if not self.running and not self.specs and now - self.last_activity > self.config['idle_exit']:
+                print(f"{datetime.now():%H:%M:%S} idle for {self.config['idle_exit']}s, exiting", flush=True)
+                break
+            time.sleep(self.config['tick'])
+
+        for job in self.running.values():
+            job['reason'] = 'TERM_OWNER: emulator stopped'
+            self.signal_job(job, signal.SIGKILL)
+        self.reap(time.time())
+
+
+def cmd_daemon(argv):
+    """Run the scheduler in the foreground (normally started by bsub)"""
+    root = state_dir()
+    init_state(root)
+    lock = open(root / 'daemon.lock', 'a')
+    # daemon_running() probes by taking the lock for a moment, so retry briefly
+    # before concluding that another daemon already serves this state directory
+    deadline = time.time() + 2.0
+    while True:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            break
+        except OSError:
+            if time.time() >= deadline:
+                return 0
+            time.sleep(0.05)
+    (root / 'daemon.pid').write_text(str(os.getpid()))
+    try:
+        Scheduler(root, load_config(root)).run()
+    finally:
+        try:
+            os.unlink(root / 'daemon.pid')
+        except OSError:
+            pass
+    return 0
+
+
+# ------------------------------------------------------------------ management
+
+WRAPPER = '#!/bin/sh\nLSF_EMU_DIR="{root}" exec "{python}" "{script}" {command} "$@"\n'
+
+
+def cmd_start(argv):
+    """Write config and bsub/bjobs/bkill wrappers, start the daemon"""
+    parser = argparse.ArgumentParser(prog='lsf_emulator.py start',
+                                     description='Configure and start the local LSF emulator')
+    parser.add_argument('--hosts', type=int, default=DEFAULT_CONFIG['hosts'],
+                        help='Number of emulated execution hosts (default: 4)')
+    parser.add_argument('--slots-per-host', type=int, default=DEFAULT_CONFIG['slots_per_host'],
+                        help='Job slots per host (default: 4)')
+    parser.add_argument('--pend-min', type=float, default=0.0,
+                        help='Minimum pending delay before a job may start, seconds (default: 0)')
+    parser.add_argument('--pend-max', type=float, default=0.0,
+                        help='Maximum pending delay, seconds (default: 0)')
+    parser.add_argument('--exit-rate', type=float, default=0.0,
+                        help='Fraction of started jobs killed part-way with TERM_MEMLIMIT (default: 0)')
+    parser.add_argument('--host-fail-rate', type=float, default=0.0,
+                        help='Chance per started job that its host fails (default: 0)')
+    parser.add_argument('--host-down-seconds', type=float, default=30.0,
+                        help='How long a failed host stays closed (default: 30)')
+    parser.add_argument('--clean-period', type=float, default=3600.0,
+                        help='Seconds finished jobs stay visible to bjobs (default: 3600)')
+    parser.add_argument('--idle-exit', type=float, default=600.0,
+                        help='Daemon exits after this many idle seconds (default: 600)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for pending delays and injected failures')
+    args = parser.parse_args(argv)
+
+    root = state_dir()
+    init_state(root)
+    if daemon_running(root):
+        print(f"⚠️  Warning: Daemon already running for {root}; run 'stop' first to apply a new configuration")
+        return 1
+    config = dict(DEFAULT_CONFIG, hosts=args.hosts, slots_per_host=args.slots_per_host,
+                  pend_min=args.pend_min, pend_max=args.pend_max, exit_rate=args.exit_rate,
+                  host_fail_rate=args.host_fail_rate, host_down_seconds=args.host_down_seconds,
+                  clean_period=args.clean_period, idle_exit=args.idle_exit, seed=args.seed)
+    write_json_atomic(root / 'config.json', config)
+    for command in ('bsub', 'bjobs', 'bkill'):
+        wrapper = root / 'bin' / command
+        wrapper.write_text(WRAPPER.format(root=root, python=sys.executable,
+                                          script=os.path.abspath(__file__), command=command))
+        os.chmod(wrapper, 0o755)
+    ensure_daemon(root)
+    print(f"✅ LSF emulator started: {args.hosts} hosts x {args.slots_per_host} slots ({root})")
+    print(f"   export PATH={root / 'bin'}:$PATH")
+    return 0
+
+
+def cmd_status(argv):
+    """Summarize jobs by state"""
+    root = state_dir()
+    counts = {}
+    for path in (root / 'jobs').glob('*.json'):
+        record = read_json(path)
+        if record:
+            counts[record['STAT']] = counts.get(record['STAT'], 0) + 1
+    config = load_config(root)
+    print(f"📊 LSF emulator {root}: daemon {'running' if daemon_running(root) else 'stopped'}, "
+          f"{config['hosts']} hosts x {config['slots_per_host']} slots")
+    print("   " + (', '.join(f"{stat} {count}" for stat, count in sorted(counts.items())) or 'no jobs'))
+    return 0
+
+
+def cmd_stop(argv):
+    """Stop the daemon (its running jobs are killed); --purge also removes all state"""
+    root = state_dir()
+    try:
+        pid = int((root / 'daemon.pid').read_text())
+        os.kill(pid, signal.SIGTERM)
+        deadline = time.time() + 10
+        while daemon_running(root) and time.time() < deadline:
+            time.sleep(0.1)
+        print(f"🛑 LSF emulator daemon {pid} stopped")
+    except (OSError, ValueError):
+        print("ℹ️  No LSF emulator daemon running")
+    if '--purge' in argv:
+        subprocess.run(['rm', '-rf', str(root)])
+        print(f"🗑️  Removed {root}")
+    return 0
+
+
+COMMANDS = {
+    'bsub': cmd_bsub, 'bjobs': cmd_bjobs, 'bkill': cmd_bkill, 'daemon': cmd_daemon,
+    'start': cmd_start, 'status': cmd_status, 'stop': cmd_stop,
+}
+
+
+def main():
+    """Dispatch on the subcommand (the bin/ wrappers pass bsub/bjobs/bkill)"""
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        print(__doc__)
+        print(f"Commands: {', '.join(COMMANDS)}")
+        return 1
+    return COMMANDS[sys.argv[1]](sys.argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
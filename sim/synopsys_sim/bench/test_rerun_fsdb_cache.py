@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+AXI4 Regression Result Cache vs. --rerun-fsdb
+=============================================
+
+Runs axi4_regression.py twice, with the same --seed-base and --rerun-fsdb, in a
+scratch workspace whose PATH starts with the stub vcs of bench_runner_overhead.py.
+The second regression answers its original runs from regression_cache/, but the
+reruns of its failures must simulate again: a cached rerun has no waves.
+
+Usage:
+    python3 -m unittest discover -s bench -p 'test_*.py'   (from sim/synopsys_sim)
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_runner_overhead import SYNOPSYS_SIM_DIR, write_stubs
+
+
+class RerunFsdbCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = Path(tempfile.mkdtemp(prefix='axi4_rerun_fsdb_'))
+        self.sim_dir = self.workspace / 'sim' / 'synopsys_sim'
+        self.sim_dir.mkdir(parents=True)
+        (self.workspace / 'sim' / 'axi4_compile.f').write_text('')
+        (self.sim_dir / 'rerun_fsdb.list').write_text(
+            "bench_pass_t00000_test run_cnt=2\n"
+            "bench_error_t00001_test run_cnt=2\n")
+        write_stubs(self.workspace / 'bin')
+        self.env = dict(os.environ)
+        self.env['PATH'] = f"{self.workspace / 'bin'}{os.pathsep}{self.env['PATH']}"
+
+    def tearDown(self):
+        shutil.rmtree(self.workspace, ignore_errors=True)
+
+    def run_regression(self):
+        """Run one regression and return the records of its results.jsonl"""
+        before = set(self.sim_dir.glob('regression_result_*'))
+        completed = subprocess.run(
+            [sys.executable, str(SYNOPSYS_SIM_DIR / 'axi4_regression.py'), '--test-list', 'rerun_fsdb.list',
+             '-p', '2', '--seed-base', '7', '--rerun-fsdb', '--no-test-check'],
+            cwd=self.sim_dir, env=self.env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        results_folders = set(self.sim_dir.glob('regression_result_*')) - before
+        self.assertEqual(len(results_folders), 1, completed.stdout)
+        self.results_folder = results_folders.pop()
+        with open(self.results_folder / 'results.jsonl') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_second_regression_reruns_with_waves(self):
+        self.run_regression()
+        records = self.run_regression()
+
+        originals = [record for record in records if not record.get('rerun_of')]
+        reruns = [record for record in records if record.get('rerun_of')]
+        self.assertEqual(len(originals), 4)
+        self.assertTrue(all(record['cached'] for record in originals), originals)
+        self.assertEqual(sorted(record['rerun_of'] for record in reruns),
+                         sorted(record['name'] for record in originals if record['status'] == 'FAIL'))
+        self.assertEqual(len(reruns), 2)
+        for record in reruns:
+            self.assertFalse(record['cached'], record)
+            waves = list((self.results_folder / 'waves' / record['name']).glob('*.fsdb'))
+            self.assertTrue(waves, f"no FSDB for {record['name']}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -203,13 +203,27 @@ module hdl_top;
   // in hdl_top, so a waveform taken with it could not answer any question about
   // WVALID/WREADY/WLAST timing. Dumping hdl_top is what makes signal-level debug
   // of the channel handshakes possible at all.
+  //
+  // +fsdb_start=<t> / +fsdb_stop=<t> limit the dump to a window of simulation time
+  // (in the units UVM messages print). The regression runner sets them when it
+  // reruns a failed test, so its waves cover only the stretch before the first
+  // UVM_ERROR instead of the whole run.
   initial begin
     string fsdb_filename;
+    longint unsigned fsdb_start;
+    longint unsigned fsdb_stop;
     if (!$value$plusargs("fsdbfile=%s", fsdb_filename)) begin
       fsdb_filename = "default.fsdb";
     end
     $fsdbDumpfile(fsdb_filename);
+    if ($value$plusargs("fsdb_start=%d", fsdb_start)) begin
+      #(fsdb_start);
+    end
     $fsdbDumpvars(0, hdl_top);
+    if ($value$plusargs("fsdb_stop=%d", fsdb_stop) && fsdb_stop > $time) begin
+      #(fsdb_stop - $time);
+      $fsdbDumpoff;
+    end
   end
 `endif
 
@@ -28,8 +28,11 @@ module hvl_top;
                 fsdb_filename = "default.fsdb"; // if no used for default.fsdb
             end
         
-            $fsdbDumpfile(fsdb_filename);  // 
-            $fsdbDumpvars(0, hdl_top);   //
+            // A dump window (+fsdb_start=) is hdl_top's own: dumping from time 0 here too would undo it
+            if (!$test$plusargs("fsdb_start=")) begin
+              $fsdbDumpfile(fsdb_filename);  // 
+              $fsdbDumpvars(0, hdl_top);   //
+            end
 //            $fsdbDumpvars(" uvm_test_top.axi4_env_h.axi4_master_agent_h[0]", "+class","+object_level=5");   //
 
         end